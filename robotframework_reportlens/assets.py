@@ -0,0 +1,223 @@
+"""
+Report template assets. template/template.html is the page developers open directly (with
+mock data); ReportTemplate holds its CSS and JavaScript, extracted and patched for
+embedded/external report data once, and the static HTML around the report config and
+payload. ReportTemplate.load() keeps one instance per template file (keyed by path, size
+and modification time) for the whole process, so generating many reports does not
+re-read and re-patch the template.
+
+For many reports on one server, write_shared_assets() stores the CSS and JavaScript as
+content-hashed reportlens.<hash>.css/.js files in a shared directory, and a linked()
+template references them with <link>/<script src> instead of inlining them. The files
+never change once written, so browsers can cache them across reports.
+"""
+
+import hashlib
+import html
+import os
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from pathlib import Path
+from typing import TextIO
+
+from .minify import minify_css, minify_javascript
+
+TEMPLATE_PATH = Path(__file__).resolve().parent / "template" / "template.html"
+
+
+def _extract_css(text: str) -> str:
+    start = text.find("<style>") + len("<style>")
+    end = text.find("</style>")
+    if start < len("<style>") or end == -1:
+        return ""
+    return text[start:end].strip()
+
+
+def _extract_javascript(text: str) -> str:
+    """Template JS adapted to the embedded reportData (mock data block removed)."""
+    start = text.find("<script>") + len("<script>")
+    end = text.find("</script>", start)
+    if start < len("<script>") or end == -1:
+        return ""
+    js = text[start:end]
+    js = js.replace("mockData", "reportData")
+    mock_start = js.find("// ========== Mock Data ==========")
+    icons_start = js.find("// ========== Icons ==========")
+    if mock_start != -1 and icons_start != -1 and icons_start > mock_start:
+        js = js[:mock_start] + js[icons_start:]
+    js = js.replace(
+        "expandFailedSuites(reportData.rootSuite);",
+        "if (reportData.rootSuite) expandFailedSuites(reportData.rootSuite);",
+    )
+    js = js.replace(
+        "const failedTests = getFailedTests(reportData.rootSuite);\n    if (failedTests.length > 0)",
+        "const failedTests = reportData.rootSuite ? getFailedTests(reportData.rootSuite) : [];\n    if (failedTests.length > 0)",
+    )
+    return js.strip()
+
+
+@dataclass(frozen=True, slots=True)
+class ReportTemplate:
+    """
+    Ready-to-use report assets: *css* and *javascript*, and the HTML before the report
+    config (*head*) and after the payload (*tail*) with both already spliced in, or, with
+    *css_href*/*javascript_href*, referenced by URL. Immutable, so one instance can be
+    shared by any number of generators and threads.
+    """
+
+    css: str
+    javascript: str
+    css_href: str | None = None
+    javascript_href: str | None = None
+    head: str = field(init=False, repr=False)
+    tail: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if self.css_href is None:
+            style = f"""  <style>
+{self.css}
+  </style>"""
+        else:
+            style = f'  <link rel="stylesheet" href="{html.escape(self.css_href)}">'
+        if self.javascript_href is None:
+            script = f"""  <script>
+{self.javascript}
+  </script>"""
+        else:
+            src = html.escape(self.javascript_href)
+            script = f'  <script src="{src}"></script>'
+        object.__setattr__(
+            self,
+            "head",
+            f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0, minimum-scale=0.25, maximum-scale=5, user-scalable=yes">
+  <title>Robot Framework Test Report</title>
+  <link rel="icon" type="image/svg+xml" href="https://docs.robotframework.org/img/robot-framework-dark.svg">
+  <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;500;600&display=swap" rel="stylesheet">
+{style}
+</head>
+<body>
+  <div class="app" id="app"></div>
+  <script type="application/json" id="report-config">""",
+        )
+        object.__setattr__(
+            self,
+            "tail",
+            f"""
+{script}
+</body>
+</html>""",
+        )
+
+    @classmethod
+    def from_html(cls, text: str) -> "ReportTemplate":
+        """Assets of the template page *text*."""
+        return cls(_extract_css(text), _extract_javascript(text))
+
+    def minified(self) -> "ReportTemplate":
+        """The same assets with comments and optional whitespace removed."""
+        return ReportTemplate(minify_css(self.css), minify_javascript(self.javascript))
+
+    def linked(self, css_href: str, javascript_href: str) -> "ReportTemplate":
+        """The same assets, referenced from the page by URL instead of inlined."""
+        return replace(self, css_href=css_href, javascript_href=javascript_href)
+
+    @classmethod
+    def load(
+        cls, path: str | Path | None = None, minify: bool = False
+    ) -> "ReportTemplate":
+        """
+        Assets of template.html (default: the packaged one), cached per process; a
+        changed file (size or modification time) is read again. With *minify* the
+        minified() assets are returned (and cached).
+        """
+        path = Path(path) if path is not None else TEMPLATE_PATH
+        try:
+            stat = path.stat()
+        except OSError:
+            return cls(
+                "/* template.html not found */",
+                'console.error("template.html not found");',
+            )
+        return _load(str(path), stat.st_size, stat.st_mtime_ns, minify)
+
+    def write(
+        self,
+        fh: TextIO,
+        config_json: str,
+        payload: Callable[[TextIO], None] | None = None,
+        files: Iterable[tuple[str, str]] = (),
+    ) -> None:
+        """
+        Write the report page to *fh*: *config_json* as the report config and, when
+        given, *payload(fh)* writing the embedded report data JSON. Each (name, text) of
+        *files* is embedded as the data file *name* (script element ``rl:<name>``).
+        """
+        fh.write(self.head)
+        fh.write(config_json)
+        fh.write("</script>\n  ")
+        if payload is not None:
+            fh.write('<script type="application/json" id="report-data">')
+            payload(fh)
+            fh.write("</script>")
+        for name, text in files:
+            fh.write(f'<script type="application/json" id="rl:{name}">')
+            fh.write(text)
+            fh.write("</script>\n  ")
+        fh.write(self.tail)
+
+
+@lru_cache(maxsize=8)
+def _load(path: str, size: int, mtime_ns: int, minify: bool) -> ReportTemplate:
+    # size and mtime_ns are part of the cache key only
+    if minify:
+        return _load(path, size, mtime_ns, False).minified()
+    return ReportTemplate.from_html(Path(path).read_text(encoding="utf-8"))
+
+
+def shared_asset_name(content: str, suffix: str) -> str:
+    """Content-hashed file name of a shared asset: ``reportlens.<hash>.<suffix>``."""
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    return f"reportlens.{digest}.{suffix}"
+
+
+def _write_new_file(path: Path, content: bytes) -> None:
+    """
+    Atomically create *path* through a temp file named after this process and thread, so
+    concurrent writers never share a temp path. Another writer having created *path*
+    first (same name, same content) counts as success.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(content)
+        os.replace(tmp, path)
+    except OSError:
+        if not path.exists():
+            raise
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def write_shared_assets(
+    template: ReportTemplate, directory: str | Path
+) -> tuple[str, str]:
+    """
+    Write *template*'s CSS and JavaScript into *directory* as content-hashed files and
+    return their names (css, js). Existing files are left alone: a name always denotes
+    the same content, so concurrent or repeated runs can share the directory.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    names = []
+    for content, suffix in ((template.css, "css"), (template.javascript, "js")):
+        name = shared_asset_name(content, suffix)
+        path = directory / name
+        if not path.exists():
+            _write_new_file(path, content.encode("utf-8"))
+        names.append(name)
+    return names[0], names[1]
@@ -1,15 +1,22 @@
 """
 Build ReportModel from Robot Framework ExecutionResult.
-No XML parsing, no HTML. Uses robot.api.ExecutionResult only.
+No manual XML parsing, no HTML. Uses robot.api.ExecutionResult, or Robot's own
+XML element handlers driven test-by-test in streaming mode.
 """
 
+import heapq
+import mmap
 import os
 import re
 import sys
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from xml.etree import ElementTree as ET
 
 from robot.api import ExecutionResult
+from robot.errors import DataError
+from robot.result import Result, TestCase, TestSuite
+from robot.result.xmlelementhandlers import XmlElementHandler
 
 from .model import (
     Keyword,
@@ -18,6 +25,7 @@ from .model import (
     Suite,
     Test,
 )
+from .timestamps import Timestamps
 
 # Set BUILD_DEBUG=1 in env to print builder debug info (e.g. why test keywords may be empty).
 BUILD_DEBUG = os.environ.get("BUILD_DEBUG", "").strip() in ("1", "true", "yes")
@@ -27,6 +35,7 @@ def _debug(*args, **kwargs):
     if BUILD_DEBUG:
         print("[builder]", *args, **kwargs, file=sys.stderr)
 
+
 # Log level filtering: map to numeric priorities
 _LEVELS = {
     "TRACE": 10,
@@ -39,77 +48,69 @@ _LEVELS = {
 }
 
 
-# NOTE: min log level is passed explicitly into builder functions to avoid global env state.
-
-# Robot legacy timestamp format: "YYYYMMDD HH:MM:SS.fff" (e.g. "20260201 14:04:20.902")
-_LEGACY_TS = re.compile(
-    r"^(\d{4})(\d{2})(\d{2})\s+(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?$"
-)
-# ISO 8601 timezone suffix (Z or ±HH:MM) so we don't double-append
-_ISO_TZ = re.compile(r"(Z|[+-]\d{2}:\d{2})$")
-
+# NOTE: min log level and the build's Timestamps are passed explicitly into builder functions
+# to avoid global env state.
 
-def _local_tz():
-    """Timezone of the machine where the report is built (same as Robot run). Naive timestamps are treated as this."""
-    return datetime.now().astimezone().tzinfo
 
+def _drop_message(elem, min_level_val: int, dropped: dict[str, int]) -> bool:
+    """True (and counted in *dropped* by level) for a <msg> element below min_level_val.
 
-def _ensure_iso_tz(s: str) -> str:
-    """Ensure ISO string has timezone (Z or ±HH:MM). Appends Z if missing so JS Date.parse is reliable."""
-    if not s or not s.strip():
-        return s
-    s = s.strip()
-    if _ISO_TZ.search(s):
-        return s
-    return s.rstrip("Z") + "Z"
+    Callers keep messages under <errors>, which are never filtered.
+    """
+    level = (elem.get("level") or "INFO").upper()
+    if _LEVELS.get(level, _LEVELS["INFO"]) >= min_level_val:
+        return False
+    dropped[level] = dropped.get(level, 0) + 1
+    return True
 
 
-def _naive_to_iso(dt: datetime) -> str:
-    """Convert datetime to ISO string with timezone. Naive datetimes are treated as local time (Robot run timezone)."""
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=_local_tz())
-    return dt.isoformat()
+def _sorted_dropped(dropped: dict[str, int]) -> dict[str, int]:
+    """Dropped message counts ordered by level (TRACE first)."""
+    return dict(
+        sorted(
+            dropped.items(), key=lambda kv: (_LEVELS.get(kv[0], _LEVELS["INFO"]), kv[0])
+        )
+    )
 
 
-def _to_iso_time(ts) -> str:
-    """
-    Normalize a timestamp to ISO 8601 with timezone for the report/JS.
-    Handles datetime, ISO strings, legacy Robot "YYYYMMDD HH:MM:SS.fff", or None.
-    Naive values (no timezone) are treated as local time (where Robot ran); output has offset e.g. +05:30.
-    Always returns a string ending with Z or ±HH:MM, or empty string if missing/invalid.
-    """
-    if ts is None or (isinstance(ts, str) and not ts.strip()):
-        return ""
-    if hasattr(ts, "isoformat"):
-        return _naive_to_iso(ts)
-    s = str(ts).strip()
-    if not s:
-        return ""
-    if "T" in s:
-        try:
-            parsed = datetime.fromisoformat(s.replace("Z", "+00:00"))
-            return _naive_to_iso(parsed)
-        except ValueError:
-            pass
-    m = _LEGACY_TS.match(s)
-    if m:
-        y, mo, d, h, mi, sec = (int(m.group(i)) for i in range(1, 7))
-        frac = m.group(7)
-        if frac:
-            frac = frac.ljust(6, "0")[:6]
-            micro = int(frac)
+def _is_json_source(source) -> bool:
+    """True for a JSON result (``.json`` path or JSON text), which Robot 7 loads itself."""
+    if isinstance(source, bytes):
+        source = source.decode("utf-8", errors="ignore")
+    if isinstance(source, str) and source.lstrip().startswith("{"):
+        return True
+    return str(source).lower().endswith(".json")
+
+
+def _parse_filtered(
+    xml_path: str, min_level_val: int, dropped: dict[str, int]
+) -> Result:
+    """Drive Robot's XML element handlers over output.xml, skipping <msg> elements below
+    min_level_val so Robot never creates Message objects for them."""
+    result = Result(xml_path)
+    handler = XmlElementHandler(result)
+    in_errors = False
+    skipped = None
+    for event, elem in ET.iterparse(xml_path, events=("start", "end")):
+        if event == "start":
+            if (
+                elem.tag == "msg"
+                and not in_errors
+                and _drop_message(elem, min_level_val, dropped)
+            ):
+                skipped = elem
+                continue
+            in_errors = in_errors or elem.tag == "errors"
+            handler.start(elem)
         else:
-            micro = 0
-        try:
-            dt = datetime(y, mo, d, h, mi, sec, micro)
-            return _naive_to_iso(dt)
-        except ValueError:
-            return ""
-    try:
-        parsed = datetime.fromisoformat(s.replace("Z", "+00:00"))
-        return _naive_to_iso(parsed)
-    except ValueError:
-        return ""
+            if elem is skipped:
+                skipped = None
+            else:
+                handler.end(elem)
+                in_errors = in_errors and elem.tag != "errors"
+            elem.clear()
+    result.handle_suite_teardown_failures()
+    return result
 
 
 def _elapsed_ms(robot_item) -> int:
@@ -123,26 +124,21 @@ def _elapsed_ms(robot_item) -> int:
     return 0
 
 
-def _start_time(robot_item) -> str:
-    """Get start time as ISO 8601 with timezone from a Robot result item."""
-    st = getattr(robot_item, "starttime", None)
-    if st:
-        return _to_iso_time(st)
+def _start_time(robot_item, stamps: Timestamps) -> int | None:
+    """Get start time as epoch microseconds from a Robot result item."""
+    # Prefer RF 7 datetime attributes; legacy string ones are formatted on every access
     start = getattr(robot_item, "start_time", None)
     if start is not None:
-        return _to_iso_time(start)
-    return ""
+        return stamps.epoch(start)
+    return stamps.epoch(getattr(robot_item, "starttime", None) or None)
 
 
-def _end_time(robot_item) -> str:
-    """Get end time as ISO 8601 with timezone from a Robot result item."""
-    et = getattr(robot_item, "endtime", None)
-    if et:
-        return _to_iso_time(et)
+def _end_time(robot_item, stamps: Timestamps) -> int | None:
+    """Get end time as epoch microseconds from a Robot result item."""
     end = getattr(robot_item, "end_time", None)
     if end is not None:
-        return _to_iso_time(end)
-    return ""
+        return stamps.epoch(end)
+    return stamps.epoch(getattr(robot_item, "endtime", None) or None)
 
 
 def _get_body(robot_item):
@@ -188,7 +184,9 @@ def _is_executable_body_item(robot_item) -> bool:
     return _get_body(robot_item) is not None
 
 
-def _build_keyword(robot_kw, test_id: str, kw_index, min_level_val: int) -> Keyword:
+def _build_keyword(
+    robot_kw, test_id: str, kw_index, min_level_val: int, stamps: Timestamps
+) -> Keyword:
     """Build a Keyword from Robot's keyword or control structure. Recurses into body for all nested steps."""
     type_name = type(robot_kw).__name__
     body = _get_body(robot_kw)
@@ -297,15 +295,17 @@ def _build_keyword(robot_kw, test_id: str, kw_index, min_level_val: int) -> Keyw
         ) or "KEYWORD"
         if kw_type not in ("SETUP", "TEARDOWN", "KEYWORD"):
             kw_type = "KEYWORD"
-        status = getattr(robot_kw, "status", "PASS") or "PASS"
+        status = sys.intern(getattr(robot_kw, "status", "PASS") or "PASS")
         duration_ms = _elapsed_ms(robot_kw)
-        start_time = _start_time(robot_kw)
+        start_time = _start_time(robot_kw, stamps)
         fail_message = (getattr(robot_kw, "message", None) or "").strip()
         child_keywords = []
         for i, item in enumerate(body_list):
             if _is_executable_body_item(item):
                 child_keywords.append(
-                    _build_keyword(item, test_id, f"{kw_index}-{i}", min_level_val)
+                    _build_keyword(
+                        item, test_id, f"{kw_index}-{i}", min_level_val, stamps
+                    )
                 )
         _debug(
             f"  control badge={badge!r} name={name_rest!r} child_keywords len={len(child_keywords)}"
@@ -313,18 +313,15 @@ def _build_keyword(robot_kw, test_id: str, kw_index, min_level_val: int) -> Keyw
         return Keyword(
             id=kw_id,
             name=name_rest,
-            type=kw_type,
+            type=sys.intern(kw_type),
             status=status,
             duration=duration_ms,
             start_time=start_time,
-            arguments=[],
             documentation="",
-            messages=[],
-            keywords=child_keywords,
+            keywords=tuple(child_keywords),
             fail_message=fail_message,
             returned=False,
-            return_values=[],
-            badge=badge,
+            badge=sys.intern(badge) if badge else None,
         )
 
     # Keyword: full extraction and recurse into body for keywords and control structures
@@ -333,15 +330,15 @@ def _build_keyword(robot_kw, test_id: str, kw_index, min_level_val: int) -> Keyw
     kw_type = (getattr(robot_kw, "type", "KEYWORD") or "KEYWORD").upper()
     if kw_type not in ("SETUP", "TEARDOWN", "KEYWORD"):
         kw_type = "KEYWORD"
-    status = getattr(robot_kw, "status", "PASS") or "PASS"
+    status = sys.intern(getattr(robot_kw, "status", "PASS") or "PASS")
     duration_ms = _elapsed_ms(robot_kw)
-    start_time = _start_time(robot_kw)
+    start_time = _start_time(robot_kw, stamps)
     fail_message = (getattr(robot_kw, "message", None) or "").strip()
-    args = list(getattr(robot_kw, "args", []) or [])
+    args = tuple(getattr(robot_kw, "args", ()) or ())
     doc = (getattr(robot_kw, "doc", None) or "").strip()
 
     returned = False
-    return_values = []
+    return_values = ()
     messages_list = []
     seen_return = False
     child_keywords = []
@@ -351,20 +348,20 @@ def _build_keyword(robot_kw, test_id: str, kw_index, min_level_val: int) -> Keyw
             type_name = type(item).__name__
             if type_name == "Return":
                 seen_return = True
-                return_values = [
+                return_values = tuple(
                     str(v).strip() for v in getattr(item, "values", []) or []
-                ]
+                )
                 returned = True
             elif type_name == "Message":
                 msg = item
-                level = (getattr(msg, "level", "INFO") or "INFO").upper()
+                level = sys.intern((getattr(msg, "level", "INFO") or "INFO").upper())
                 # Filter out messages below configured min_level_val
                 lvl_val = _LEVELS.get(level, _LEVELS.get("INFO"))
                 if lvl_val < min_level_val:
                     continue
                 text = (getattr(msg, "message", None) or "").strip()
                 is_html = bool(getattr(msg, "html", False))
-                ts = _to_iso_time(getattr(msg, "timestamp", None) or "")
+                ts = stamps.epoch(getattr(msg, "timestamp", None))
                 messages_list.append(
                     LogMessage(
                         timestamp=ts,
@@ -377,7 +374,11 @@ def _build_keyword(robot_kw, test_id: str, kw_index, min_level_val: int) -> Keyw
             elif _is_executable_body_item(item):
                 child_keywords.append(
                     _build_keyword(
-                        item, test_id, f"{kw_index}-{child_kw_index}", min_level_val
+                        item,
+                        test_id,
+                        f"{kw_index}-{child_kw_index}",
+                        min_level_val,
+                        stamps,
                     )
                 )
                 child_kw_index += 1
@@ -385,13 +386,13 @@ def _build_keyword(robot_kw, test_id: str, kw_index, min_level_val: int) -> Keyw
     # If no body iteration (e.g. body empty), use keyword.messages
     if not messages_list and hasattr(robot_kw, "messages") and robot_kw.messages:
         for msg in robot_kw.messages:
-            level = (getattr(msg, "level", "INFO") or "INFO").upper()
+            level = sys.intern((getattr(msg, "level", "INFO") or "INFO").upper())
             lvl_val = _LEVELS.get(level, _LEVELS.get("INFO"))
             if lvl_val < min_level_val:
                 continue
             text = (getattr(msg, "message", None) or "").strip()
             is_html = bool(getattr(msg, "html", False))
-            ts = _to_iso_time(getattr(msg, "timestamp", None) or "")
+            ts = stamps.epoch(getattr(msg, "timestamp", None))
             messages_list.append(
                 LogMessage(
                     timestamp=ts,
@@ -404,13 +405,9 @@ def _build_keyword(robot_kw, test_id: str, kw_index, min_level_val: int) -> Keyw
 
     # Failed keyword with no log messages: treat failure message as a log entry so it appears in Logs pane
     if fail_message and not messages_list:
-        ts = (
-            _to_iso_time(
-                getattr(robot_kw, "endtime", None)
-                or getattr(robot_kw, "end_time", None)
-            )
-            or start_time
-        )
+        ts = _end_time(robot_kw, stamps)
+        if ts is None:
+            ts = start_time
         messages_list.append(
             LogMessage(
                 timestamp=ts, level="FAIL", message=fail_message, is_return=False
@@ -420,14 +417,14 @@ def _build_keyword(robot_kw, test_id: str, kw_index, min_level_val: int) -> Keyw
     return Keyword(
         id=kw_id,
         name=name,
-        type=kw_type,
+        type=sys.intern(kw_type),
         status=status,
         duration=duration_ms,
         start_time=start_time,
         arguments=args,
         documentation=doc,
-        messages=messages_list,
-        keywords=child_keywords,
+        messages=tuple(messages_list),
+        keywords=tuple(child_keywords),
         fail_message=fail_message,
         returned=returned,
         return_values=return_values,
@@ -435,17 +432,19 @@ def _build_keyword(robot_kw, test_id: str, kw_index, min_level_val: int) -> Keyw
     )
 
 
-def _build_test(robot_test, suite_full_name: str, min_level_val: int) -> Test:
+def _build_test(
+    robot_test, suite_full_name: str, min_level_val: int, stamps: Timestamps
+) -> Test:
     """Build a Test from Robot's test case result."""
     test_id = getattr(robot_test, "id", "") or ""
     name = getattr(robot_test, "name", "Test") or "Test"
     full_name = f"{suite_full_name}.{name}" if suite_full_name else name
-    status = getattr(robot_test, "status", "PASS") or "PASS"
+    status = sys.intern(getattr(robot_test, "status", "PASS") or "PASS")
     raw_tags = getattr(robot_test, "tags", []) or []
-    tags = [getattr(t, "name", str(t)) for t in raw_tags]
+    tags = [sys.intern(getattr(t, "name", str(t))) for t in raw_tags]
     duration_ms = _elapsed_ms(robot_test)
     message = (getattr(robot_test, "message", None) or "").strip()
-    start_time = _start_time(robot_test)
+    start_time = _start_time(robot_test, stamps)
     doc = (getattr(robot_test, "doc", None) or "").strip()
 
     keywords = []
@@ -466,19 +465,21 @@ def _build_test(robot_test, suite_full_name: str, min_level_val: int) -> Test:
             is_exec = _is_executable_body_item(item)
             _debug(f"  body[{i}] type={item_type} executable={is_exec}")
             if is_exec:
-                keywords.append(_build_keyword(item, test_id, kw_index, min_level_val))
+                keywords.append(
+                    _build_keyword(item, test_id, kw_index, min_level_val, stamps)
+                )
                 kw_index += 1
         _debug(f"  -> keywords len={len(keywords)}")
 
     robot_setup = getattr(robot_test, "setup", None)
     robot_teardown = getattr(robot_test, "teardown", None)
     test_setup = (
-        _build_keyword(robot_setup, test_id, "setup", min_level_val)
+        _build_keyword(robot_setup, test_id, "setup", min_level_val, stamps)
         if robot_setup
         else None
     )
     test_teardown = (
-        _build_keyword(robot_teardown, test_id, "teardown", min_level_val)
+        _build_keyword(robot_teardown, test_id, "teardown", min_level_val, stamps)
         if robot_teardown
         else None
     )
@@ -499,43 +500,66 @@ def _build_test(robot_test, suite_full_name: str, min_level_val: int) -> Test:
     )
 
 
-def _build_suite(robot_suite, parent_full_name: str, min_level_val: int) -> Suite:
+def _build_suite(
+    robot_suite, parent_full_name: str, min_level_val: int, stamps: Timestamps
+) -> Suite:
     """Build a Suite from Robot's test suite result."""
-    suite_id = getattr(robot_suite, "id", "") or ""
     name = getattr(robot_suite, "name", "Suite") or "Suite"
     full_name = f"{parent_full_name}.{name}" if parent_full_name else name
-    status = getattr(robot_suite, "status", "PASS") or "PASS"
-    start_time = _start_time(robot_suite)
-    duration_ms = _elapsed_ms(robot_suite)
-    source = str(getattr(robot_suite, "source", "") or "")
 
     tests = []
     for robot_test in getattr(robot_suite, "tests", []) or []:
-        tests.append(_build_test(robot_test, full_name, min_level_val))
+        tests.append(_build_test(robot_test, full_name, min_level_val, stamps))
 
     suites = []
     for child in getattr(robot_suite, "suites", []) or []:
-        suites.append(_build_suite(child, full_name, min_level_val))
+        suites.append(_build_suite(child, full_name, min_level_val, stamps))
 
+    return _assemble_suite(robot_suite, full_name, tests, suites, min_level_val, stamps)
+
+
+def _suite_statistics(tests: list) -> dict:
+    """Pass/fail/skip counts for a suite's own tests."""
     passed = sum(1 for t in tests if t.status == "PASS")
     failed = sum(1 for t in tests if t.status == "FAIL")
     skipped = sum(1 for t in tests if t.status == "SKIP")
-    statistics = {
+    return {
         "total": len(tests),
         "passed": passed,
         "failed": failed,
         "skipped": skipped,
     }
 
+
+def _assemble_suite(
+    robot_suite,
+    full_name: str,
+    tests: list,
+    suites: list,
+    min_level_val: int,
+    stamps: Timestamps,
+) -> Suite:
+    """Build a Suite from Robot's suite result and already built tests and child suites."""
+    suite_id = getattr(robot_suite, "id", "") or ""
+    name = getattr(robot_suite, "name", "Suite") or "Suite"
+    status = getattr(robot_suite, "status", "PASS") or "PASS"
+    start_time = _start_time(robot_suite, stamps)
+    duration_ms = _elapsed_ms(robot_suite)
+    source = str(getattr(robot_suite, "source", "") or "")
+
+    statistics = _suite_statistics(tests)
+
     robot_setup = getattr(robot_suite, "setup", None)
     robot_teardown = getattr(robot_suite, "teardown", None)
     suite_setup = (
-        _build_keyword(robot_setup, f"suite-{suite_id}", "setup", min_level_val)
+        _build_keyword(robot_setup, f"suite-{suite_id}", "setup", min_level_val, stamps)
         if robot_setup
         else None
     )
     suite_teardown = (
-        _build_keyword(robot_teardown, f"suite-{suite_id}", "teardown", min_level_val)
+        _build_keyword(
+            robot_teardown, f"suite-{suite_id}", "teardown", min_level_val, stamps
+        )
         if robot_teardown
         else None
     )
@@ -562,20 +586,57 @@ def build_report_model(
     """
     Load output.xml via Robot's ExecutionResult and build our ReportModel.
     No manual XML, no HTML. IDs are deterministic (from Robot).
+    Log messages below min_log_level are dropped while parsing (counted per level in
+    ReportModel.dropped_messages).
     """
-    result = ExecutionResult(xml_path)
+    dropped: dict[str, int] = {}
+    result = _load_result(xml_path, min_log_level, dropped)
+    stamps = Timestamps()
     root = result.suite
+    root_suite = (
+        _build_suite(root, "", min_log_level, stamps) if root is not None else None
+    )
+    return _finish_report_model(
+        result, root, root_suite, xml_path, stamps, dropped=dropped
+    )
+
 
+def _load_result(xml_path: str, min_log_level: int, dropped: dict[str, int]) -> Result:
+    """ExecutionResult(xml_path), with <msg> elements below min_log_level skipped at parse time."""
+    if min_log_level <= _LEVELS["TRACE"] or _is_json_source(xml_path):
+        return ExecutionResult(xml_path)
+    try:
+        return _parse_filtered(xml_path, min_log_level, dropped)
+    except Exception as err:
+        raise DataError(f"Reading XML source '{xml_path}' failed: {err}") from err
+
+
+def _finish_report_model(
+    result,
+    root,
+    root_suite: Suite | None,
+    xml_path: str,
+    stamps: Timestamps,
+    count_tests: bool = False,
+    dropped: dict[str, int] | None = None,
+) -> ReportModel:
+    """Wrap a built root suite with errors, statistics and timing from the Robot result.
+
+    count_tests=True takes totals from the built tests instead of ``result.statistics``
+    (streaming mode, where Robot's suite tree no longer holds the tests).
+    """
     # Project name based on xml_path's parent directory
     project_name = (Path(xml_path).resolve().parent.name or "Test Run").upper()
 
-    if root is None:
+    # Robot's own root suite name, used when merging outputs (root_suite shows the project)
+    root_name = root_suite.name if root_suite is not None else project_name
+    if root_suite is None:
         root_suite = Suite(
             id="s0",
             name=project_name,
             full_name=project_name,
             status="PASS",
-            start_time="",
+            start_time=None,
             duration=0,
             source="",
             tests=[],
@@ -585,7 +646,6 @@ def build_report_model(
             teardown=None,
         )
     else:
-        root_suite = _build_suite(root, "", min_log_level)
         root_suite.name = project_name
         root_suite.full_name = project_name
 
@@ -598,12 +658,12 @@ def build_report_model(
         )
         for msg in messages or []:
             level = (getattr(msg, "level", "WARN") or "WARN").upper()
-            ts = _to_iso_time(getattr(msg, "timestamp", None) or "")
+            ts = stamps.epoch(getattr(msg, "timestamp", None))
             text = getattr(msg, "message", None) or getattr(msg, "text", "") or ""
             errors.append({"time": ts, "level": level, "text": str(text).strip()})
 
     # Statistics
-    stats = result.statistics
+    stats = None if count_tests else result.statistics
     total_stats = getattr(stats, "total", None)
     if total_stats is not None:
         passed = getattr(total_stats, "passed", 0) or 0
@@ -626,13 +686,13 @@ def build_report_model(
     gen_time = getattr(result, "generation_time", None) or getattr(
         result, "generated", None
     )
-    gen_str = _to_iso_time(gen_time) if gen_time else ""
+    generated = stamps.epoch(gen_time) if gen_time else None
     # Report start: root suite start_time, then generation_time, then suite status start, then earliest test
-    start_time = _report_start_time(result, root)
-    if not start_time and root_suite.start_time:
-        start_time = _to_iso_time(root_suite.start_time)
-    if not start_time:
-        start_time = gen_str
+    start_time = _report_start_time(result, root, stamps)
+    if start_time is None:
+        start_time = root_suite.start_time
+    if start_time is None:
+        start_time = generated
     end_time = start_time
     duration_ms = root_suite.duration
 
@@ -643,7 +703,7 @@ def build_report_model(
                 _debug(f"SUMMARY: test id={t.id!r} name={t.name!r} has 0 keywords")
 
     return ReportModel(
-        generated=gen_str,
+        generated=generated,
         generator=str(gen),
         start_time=start_time,
         end_time=end_time,
@@ -657,9 +717,311 @@ def build_report_model(
         },
         errors=errors,
         root_suite=root_suite,
+        utc_offset=stamps.utc_offset,
+        dropped_messages=_sorted_dropped(dropped or {}),
+        root_name=root_name,
+    )
+
+
+def stream_report_model(
+    xml_path: str, min_log_level: int = _LEVELS.get("DEBUG"), jobs: int = 1
+) -> ReportModel:
+    """
+    Build our ReportModel from output.xml without materializing the full ExecutionResult.
+    Drives Robot's own XML element handlers over iterparse and converts each test as soon
+    as its element ends, then swaps it for an empty placeholder (keeping Robot's
+    positional IDs stable) and drops the parsed elements. Peak memory is bounded by the
+    largest single test plus the built model. Output is identical to build_report_model.
+
+    jobs > 1 builds the top-level suite subtrees in that many worker processes (balanced
+    by their size in the file) and stitches them back under the root in document order.
+    """
+    if jobs > 1:
+        return _parallel_report_model(xml_path, min_log_level, jobs)
+    stamps = Timestamps()
+    dropped: dict[str, int] = {}
+    result, root_suite = _stream_suite_tree(xml_path, min_log_level, stamps, dropped)
+    if root_suite is not None:
+        _finish_streamed_suite(result, root_suite, result.suite)
+    root = result.suite if root_suite is not None else None
+    return _finish_report_model(
+        result, root, root_suite, xml_path, stamps, count_tests=True, dropped=dropped
     )
 
 
+def _stream_suite_tree(
+    xml_path: str,
+    min_log_level: int,
+    stamps: Timestamps,
+    dropped: dict[str, int],
+    build_child=None,
+    count_root_drops: bool = True,
+):
+    """
+    Stream output.xml into (Robot result, root Suite). The root suite is not finished
+    (teardown status, suite status); callers do that via _finish_streamed_suite.
+    <msg> elements below min_log_level are never handed to Robot; they are counted per
+    level in *dropped*.
+
+    build_child(index) decides which top-level child suites are built; skipped ones are
+    never handed to Robot (only a placeholder keeps later IDs stable) and are left as
+    None in root_suite.suites. By default everything is built. count_root_drops=False
+    leaves messages of the root suite's own items out of *dropped* (parallel workers,
+    whose root items are counted by the main process).
+    """
+    result = Result(xml_path)
+    handler = XmlElementHandler(result)
+    robot_suites = []  # open Robot suites, innermost last
+    frames = []  # (full_name, tests, suites) being built for each open suite
+    elems = []  # open XML elements, so finished ones can be detached from the parent
+    skipping = 0  # depth inside a top-level child suite that is not built here
+    skipped_msg = None  # <msg> below min_log_level currently being skipped
+    root_suite = None
+
+    for event, elem in ET.iterparse(xml_path, events=("start", "end")):
+        # <suite> also appears under <statistics>; only suites in the result tree count
+        if event == "start":
+            if skipping:
+                skipping += 1
+            elif (
+                build_child is not None
+                and elem.tag == "suite"
+                and len(robot_suites) == 1
+                and elems[-1].tag == "suite"
+                and not build_child(len(robot_suites[0].suites))
+            ):
+                robot_suites[0].suites.append(TestSuite())
+                skipping = 1
+            elif (
+                elem.tag == "msg"
+                and elems[-1].tag != "errors"
+                and _drop_message(
+                    elem,
+                    min_log_level,
+                    dropped if count_root_drops or len(robot_suites) > 1 else {},
+                )
+            ):
+                skipped_msg = elem
+            else:
+                handler.start(elem)
+                if elem.tag == "suite" and (
+                    not elems or elems[-1].tag in ("robot", "suite")
+                ):
+                    robot_suite = (
+                        robot_suites[-1].suites[-1] if robot_suites else result.suite
+                    )
+                    name = robot_suite.name or "Suite"
+                    full_name = f"{frames[-1][0]}.{name}" if frames else name
+                    robot_suites.append(robot_suite)
+                    frames.append((full_name, [], []))
+            elems.append(elem)
+            continue
+
+        elems.pop()
+        if elems:
+            del elems[-1][-1]
+        if skipping:
+            skipping -= 1
+            if not skipping:
+                frames[-1][2].append(None)
+            continue
+        if elem is skipped_msg:
+            skipped_msg = None
+            continue
+        handler.end(elem)
+        if elem.tag == "test" and robot_suites:
+            robot_suite = robot_suites[-1]
+            full_name, tests, _ = frames[-1]
+            test = _build_test(robot_suite.tests[-1], full_name, min_log_level, stamps)
+            tests.append(test)
+            robot_suite.tests[-1] = TestCase()
+        elif elem.tag == "suite" and (not elems or elems[-1].tag in ("robot", "suite")):
+            robot_suite = robot_suites.pop()
+            full_name, tests, suites = frames.pop()
+            suite = _assemble_suite(
+                robot_suite, full_name, tests, suites, min_log_level, stamps
+            )
+            if frames:
+                _finish_streamed_suite(result, suite, robot_suite)
+                frames[-1][2].append(suite)
+                robot_suites[-1].suites[-1] = TestSuite()
+            else:
+                root_suite = suite
+
+    return result, root_suite
+
+
+def _finish_streamed_suite(result, suite: Suite, robot_suite) -> None:
+    """Apply suite teardown failures and Robot's derived suite status to a streamed suite."""
+    if result.generated_by_robot:
+        _apply_suite_teardown_status(suite, robot_suite)
+    # Robot derives suite status from all tests below it, which are gone by now
+    suite.status = _status_from_tests(_all_tests(suite))
+
+
+# Start or end tag of a <suite> element in the raw output.xml bytes; literal "<" never
+# occurs in escaped text or attribute values
+_SUITE_TAG = re.compile(rb"<(/?)suite[\s>]")
+
+
+def _top_level_suite_sizes(xml_path: str) -> list[int]:
+    """Byte size of each top-level child suite of the root suite, in document order.
+
+    A regex scan of the memory-mapped file, much cheaper than parsing it.
+    """
+    sizes = []
+    depth = 0
+    start = 0
+    with open(xml_path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return sizes
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for match in _SUITE_TAG.finditer(data):
+                if match.group(1):
+                    depth -= 1
+                    if depth == 1:
+                        sizes.append(match.end() - start)
+                    elif depth == 0:
+                        # Root suite closed; <suite> under <statistics> follows
+                        break
+                else:
+                    depth += 1
+                    if depth == 2:
+                        start = match.start()
+    return sizes
+
+
+def _assign_suites(sizes: list[int], jobs: int) -> list[frozenset[int]]:
+    """Top-level suite indices per worker, largest suites first to the least loaded
+    worker. Workers that would get nothing are left out."""
+    loads = [(0, worker) for worker in range(min(jobs, len(sizes)))]
+    assigned: list[set[int]] = [set() for _ in loads]
+    for index in sorted(range(len(sizes)), key=lambda i: -sizes[i]):
+        load, worker = heapq.heappop(loads)
+        assigned[worker].add(index)
+        heapq.heappush(loads, (load + sizes[index], worker))
+    return [frozenset(indices) for indices in assigned]
+
+
+def _build_top_level_suites(
+    xml_path: str,
+    min_log_level: int,
+    utc_offset: int,
+    indices: frozenset[int],
+    rest_from: int | None = None,
+) -> tuple[list, dict[str, int]]:
+    """Worker: build the top-level child suites listed in *indices* and, unless
+    rest_from is None, every suite from index rest_from on (ones the pre-scan missed).
+
+    Returns (index, Suite) pairs and the messages dropped while building them.
+    """
+    dropped: dict[str, int] = {}
+    _, root_suite = _stream_suite_tree(
+        xml_path,
+        min_log_level,
+        Timestamps(utc_offset),
+        dropped,
+        lambda index: (
+            index in indices or (rest_from is not None and index >= rest_from)
+        ),
+        count_root_drops=False,
+    )
+    if root_suite is None:
+        return [], dropped
+    return [(i, s) for i, s in enumerate(root_suite.suites) if s is not None], dropped
+
+
+def _parallel_report_model(xml_path: str, min_log_level: int, jobs: int) -> ReportModel:
+    """Build top-level suite subtrees across a process pool; the root is built here.
+
+    Every worker parses the whole file but only hands its own suites to Robot, so suites
+    are balanced by their byte size rather than their count.
+    """
+    stamps = Timestamps()
+    sizes = _top_level_suite_sizes(xml_path)
+    # Worker 0 also builds any suite the pre-scan missed, so every index gets built
+    assigned = _assign_suites(sizes, jobs) or [frozenset()]
+    with ProcessPoolExecutor(max_workers=len(assigned)) as pool:
+        futures = [
+            pool.submit(
+                _build_top_level_suites,
+                xml_path,
+                min_log_level,
+                stamps.utc_offset,
+                indices,
+                len(sizes) if worker == 0 else None,
+            )
+            for worker, indices in enumerate(assigned)
+        ]
+        # Root suite's own tests, setup/teardown, errors and statistics; children skipped
+        dropped: dict[str, int] = {}
+        result, root_suite = _stream_suite_tree(
+            xml_path, min_log_level, stamps, dropped, lambda index: False
+        )
+        fragments = {}
+        for future in futures:
+            suites, worker_dropped = future.result()
+            fragments.update(suites)
+            for level, count in worker_dropped.items():
+                dropped[level] = dropped.get(level, 0) + count
+    if root_suite is not None:
+        root_suite.suites = [fragments[i] for i in range(len(root_suite.suites))]
+        _finish_streamed_suite(result, root_suite, result.suite)
+    root = result.suite if root_suite is not None else None
+    return _finish_report_model(
+        result, root, root_suite, xml_path, stamps, count_tests=True, dropped=dropped
+    )
+
+
+# Messages Robot's SuiteTeardownFailed visitor adds to tests of a suite whose teardown failed
+_TEARDOWN_FAILED = "Parent suite teardown failed:\n%s"
+_TEARDOWN_ALSO_FAILED = "\n\nAlso parent suite teardown failed:\n%s"
+_TEARDOWN_SKIPPED = "Skipped in parent suite teardown:\n%s"
+_TEARDOWN_ALSO_SKIPPED = "Skipped in parent suite teardown:\n%s\n\nEarlier message:\n%s"
+
+
+def _apply_suite_teardown_status(suite: Suite, robot_suite) -> None:
+    """
+    Propagate a failed or skipped suite teardown to every test below *suite*, as Robot's
+    handle_suite_teardown_failures does once the whole tree is loaded. Streamed tests are
+    already built when the teardown status becomes known, so it is applied to our model.
+    """
+    teardown = getattr(robot_suite, "teardown", None)
+    status = getattr(teardown, "status", None) if teardown else None
+    if status not in ("FAIL", "SKIP"):
+        return
+    teardown_msg = getattr(teardown, "message", "") or ""
+
+    def walk(s: Suite) -> None:
+        for t in s.tests:
+            if status == "FAIL":
+                if t.status != "SKIP":
+                    t.status = "FAIL"
+                prefix = _TEARDOWN_ALSO_FAILED if t.message else _TEARDOWN_FAILED
+                t.message = (t.message + prefix % teardown_msg).strip()
+            elif t.message:
+                t.status = "SKIP"
+                t.message = (_TEARDOWN_ALSO_SKIPPED % (teardown_msg, t.message)).strip()
+            else:
+                t.status = "SKIP"
+                t.message = (_TEARDOWN_SKIPPED % teardown_msg).strip()
+        s.statistics = _suite_statistics(s.tests)
+        for child in s.suites:
+            walk(child)
+
+    walk(suite)
+
+
+def _status_from_tests(tests: list) -> str:
+    """Suite status the way Robot computes it: FAIL if any test failed, else PASS if any passed, else SKIP."""
+    statuses = {t.status for t in tests}
+    if "FAIL" in statuses:
+        return "FAIL"
+    if "PASS" in statuses:
+        return "PASS"
+    return "SKIP"
+
+
 def _all_tests(suite: Suite) -> list:
     """Flatten all tests from suite tree."""
     out = list(suite.tests)
@@ -676,30 +1038,32 @@ def _all_robot_tests(robot_suite):
         yield from _all_robot_tests(s)
 
 
-def _report_start_time(result, robot_root) -> str:
+def _report_start_time(result, robot_root, stamps: Timestamps) -> int | None:
     """
-    Best available report start time as ISO string.
+    Best available report start time as epoch microseconds.
     Order: root suite start_time, result generation_time, root suite status start, earliest test start.
     """
     candidates = []
     if robot_root:
-        st = _start_time(robot_root)
-        if st:
+        st = _start_time(robot_root, stamps)
+        if st is not None:
             candidates.append(st)
     gen = getattr(result, "generation_time", None) or getattr(result, "generated", None)
     if gen is not None and gen != "":
-        candidates.append(gen.isoformat() if hasattr(gen, "isoformat") else str(gen))
+        gen_epoch = stamps.epoch(gen)
+        if gen_epoch is not None:
+            candidates.append(gen_epoch)
     if not candidates and robot_root:
         status = getattr(robot_root, "status", None)
         if status is not None:
-            st = _start_time(status)
-            if st:
+            st = _start_time(status, stamps)
+            if st is not None:
                 candidates.append(st)
     if not candidates and robot_root:
         for robot_test in _all_robot_tests(robot_root):
-            st = _start_time(robot_test)
-            if st:
+            st = _start_time(robot_test, stamps)
+            if st is not None:
                 candidates.append(st)
     if not candidates:
-        return ""
-    return _to_iso_time(candidates[0])
+        return None
+    return candidates[0]
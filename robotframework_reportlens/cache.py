@@ -0,0 +1,184 @@
+"""
+On-disk cache of built ReportModels.
+Entries are keyed by the output.xml content hash, the reportlens version and the build
+options, and stored as zlib-compressed pickles. The cache directory is bounded in size:
+least recently used entries are evicted after each store.
+
+Unpickling runs code, so every entry is signed with an HMAC and only entries signed with
+this user's key are loaded. The key is REPORTLENS_CACHE_KEY when set (CI jobs sharing a
+restored cache directory), else a random per-user key created in the user's config
+directory; entries from anyone without the key are cache misses.
+"""
+
+import contextlib
+import hashlib
+import hmac
+import json
+import os
+import pickle
+import secrets
+import threading
+import zlib
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from robot.version import VERSION as ROBOT_VERSION
+
+from . import __version__
+from .model import ReportModel
+from .timestamps import local_utc_offset
+
+# Bump when the pickled model layout changes without a release
+_CACHE_FORMAT = 3
+_SUFFIX = ".model"
+_CHUNK = 1 << 20
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+KEY_ENV = "REPORTLENS_CACHE_KEY"
+_SIGNATURE_BYTES = hashlib.sha256().digest_size
+
+
+def _package_version() -> str:
+    try:
+        return version("robotframework-reportlens")
+    except PackageNotFoundError:
+        return __version__
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of the file contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _key_file() -> Path:
+    config = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return Path(config) / "reportlens" / "cache.key"
+
+
+def signing_key() -> bytes:
+    """
+    Key that signs cache entries: REPORTLENS_CACHE_KEY, else the per-user key file,
+    created (readable by the user only) on first use.
+    """
+    env = os.environ.get(KEY_ENV)
+    if env:
+        return env.encode("utf-8")
+    path = _key_file()
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(secrets.token_bytes(32))
+        try:
+            # Link instead of replace: a key another process created first wins
+            os.link(tmp, path)
+        except FileExistsError:
+            pass
+        finally:
+            tmp.unlink()
+    return path.read_bytes()
+
+
+class ModelCache:
+    """
+    Size-bounded directory of cached ReportModels. load() returns None on a miss (or an
+    unreadable or unsigned entry); store() writes atomically and then evicts the least
+    recently used entries until the directory fits in max_bytes.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        secret: bytes | None = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._secret = secret
+
+    def _sign(self, data: bytes) -> bytes:
+        if self._secret is None:
+            self._secret = signing_key()
+        return hmac.digest(self._secret, data, "sha256")
+
+    def key(self, xml_path: str, min_log_level: int) -> str:
+        """Cache key for building *xml_path* with the given options on this machine."""
+        options = {
+            "format": _CACHE_FORMAT,
+            "version": _package_version(),
+            # Models come from Robot's own parser, which changes between releases
+            "robotVersion": ROBOT_VERSION,
+            "minLogLevel": min_log_level,
+            # The root suite is named after the output's directory; naive Robot
+            # timestamps are resolved with the local UTC offset
+            "project": Path(xml_path).resolve().parent.name,
+            "utcOffset": local_utc_offset(),
+        }
+        material = f"{file_digest(xml_path)}:{json.dumps(options, sort_keys=True)}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{_SUFFIX}"
+
+    def load(self, key: str) -> ReportModel | None:
+        path = self._path(key)
+        try:
+            content = path.read_bytes()
+        except OSError:
+            # Missing, or unreadable (permissions, I/O error): a miss either way
+            return None
+        signature, data = content[:_SIGNATURE_BYTES], content[_SIGNATURE_BYTES:]
+        if not hmac.compare_digest(signature, self._sign(data)):
+            # Not written with this key (or tampered with): never unpickled, and left
+            # for its writer; store() replaces it
+            return None
+        try:
+            model = pickle.loads(zlib.decompress(data))
+        except (
+            OSError,
+            zlib.error,
+            pickle.UnpicklingError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            TypeError,
+        ):
+            # Corrupt or incompatible entry: drop it and rebuild
+            path.unlink(missing_ok=True)
+            return None
+        if not isinstance(model, ReportModel):
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)  # mark as recently used for eviction
+        return model
+
+    def store(self, key: str, model: ReportModel) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        data = zlib.compress(pickle.dumps(model, pickle.HIGHEST_PROTOCOL), 6)
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(self._sign(data) + data)
+        os.replace(tmp, path)
+        self.evict(keep=path)
+
+    def evict(self, keep: Path | None = None) -> None:
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for path in self.cache_dir.glob(f"*{_SUFFIX}"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
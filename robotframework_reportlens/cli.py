@@ -5,6 +5,9 @@ import os
 import sys
 from pathlib import Path
 
+from .cache import DEFAULT_CACHE_MAX_BYTES
+from .manifest import DEFAULT_SHARD_BYTES, FILE_KINDS, CompressionPolicy
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -13,7 +16,19 @@ def main():
     )
     parser.add_argument(
         "xml_file",
-        help="Path to Robot Framework XML output (e.g. output.xml)",
+        nargs="+",
+        help=(
+            "Path to Robot Framework XML output (e.g. output.xml). Several outputs (e.g. pabot "
+            "shards) are combined into one report like rebot does."
+        ),
+    )
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help=(
+            "Merge several outputs like rebot --merge: suites are matched by name and re-executed "
+            "tests replace earlier results (latest result wins)."
+        ),
     )
     parser.add_argument(
         "-o",
@@ -31,11 +46,152 @@ def main():
         action="store_true",
         help=(
             "Write gzip-compressed .json.gz files instead of plain .json in reportlens-data/. "
-            "Requires --external-data. Produces the smallest possible output (~97%% smaller at 10k tests). "
+            "Produces the smallest possible output (~97%% smaller at 10k tests). Without --external-data, "
+            "embed the payload gzip-compressed and base64-encoded (about 10x smaller report.html). "
             "Requires Chrome 80+, Edge 80+, Firefox 113+, or Safari 16.4+ (DecompressionStream API). "
             "Reports will not load in older browsers — a clear error banner is shown instead."
         ),
     )
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        default=9,
+        choices=range(1, 10),
+        metavar="1-9",
+        help="gzip level for --compress-data (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--compress-min-size",
+        type=int,
+        default=0,
+        metavar="BYTES",
+        help=(
+            "With --compress-data, store data files smaller than this many bytes of JSON as plain "
+            ".json; manifest.sha256 tells the report which files are compressed (default: 0)."
+        ),
+    )
+    parser.add_argument(
+        "--compress-kind",
+        action="append",
+        default=[],
+        metavar="KIND=LEVEL",
+        help=(
+            "gzip level for one kind of data file (summary, suites, suite, test, logs, blocks, search); "
+            "0 stores that kind plain. May be repeated, e.g. --compress-kind test=1 --compress-kind logs=9."
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "With --external-data, only rewrite files whose content hash differs from "
+            "reportlens-data/manifest.sha256 and delete files the previous run wrote but this one does not."
+        ),
+    )
+    parser.add_argument(
+        "--packed",
+        action="store_true",
+        help=(
+            "With --external-data, pack per-test and per-test log data into a few "
+            "reportlens-data/tests_<n>.pack shard files (indexed by byte offset in suites.json) "
+            "instead of two files per test."
+        ),
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=DEFAULT_SHARD_BYTES // (1024 * 1024),
+        metavar="MB",
+        help="Target size of --packed shard files (default: %(default)s MB).",
+    )
+    parser.add_argument(
+        "--string-table",
+        action="store_true",
+        help=(
+            "Write schemaVersion 2 data: keyword names, arguments, statuses and log messages are "
+            "stored once in a string table and referenced by index (smaller embedded payload)."
+        ),
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help=(
+            "With --external-data or --split-payload, store keyword subtrees and log message blocks "
+            "that repeat across tests (e.g. data-driven suites) once in blocks.json "
+            "(reportlens-data/blocks.json, or an embedded block) and reference them."
+        ),
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help=(
+            "With --external-data or --split-payload, store each suite's test list and the suites.json index as "
+            "parallel arrays per field instead of one object per test/suite (smaller, faster to parse)."
+        ),
+    )
+    parser.add_argument(
+        "--split-payload",
+        action="store_true",
+        help=(
+            "Self-contained report that embeds the data as separate blocks (summary, suite tree, "
+            "one per test) parsed only when needed, instead of one payload parsed on open."
+        ),
+    )
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="Strip comments and optional whitespace from the report's embedded CSS and JavaScript.",
+    )
+    parser.add_argument(
+        "--assets-dir",
+        metavar="DIR",
+        help=(
+            "Write the report CSS/JS once as content-hashed reportlens.<hash>.css/.js files into DIR "
+            "(shared by many reports) and link them instead of inlining them."
+        ),
+    )
+    parser.add_argument(
+        "--assets-url",
+        metavar="URL",
+        help="URL under which --assets-dir is served (default: path relative to the report).",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help=(
+            "Parse output.xml test by test instead of loading the whole execution result first. "
+            "Keeps peak memory bounded by the largest single test; recommended for very large outputs."
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Build top-level suites in N worker processes (implies --streaming parsing). "
+            "Every worker parses the full output.xml but builds only its suites, balanced by "
+            "their size in the file, so this helps when there are several large top-level suites. "
+            "With several outputs, parse up to N of them in parallel instead. "
+            "External-data files and --packed records are encoded, compressed and written by N threads. "
+            "Output is identical to a serial build (default: 1)."
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help=(
+            "Cache built report models in this directory, keyed by the output.xml content hash, "
+            "reportlens and Robot Framework versions and build options; repeated runs on the same output skip parsing."
+        ),
+    )
+    parser.add_argument(
+        "--cache-max-size",
+        type=int,
+        default=DEFAULT_CACHE_MAX_BYTES // (1024 * 1024),
+        metavar="MB",
+        help="Evict least recently used cache entries beyond this size (default: %(default)s MB).",
+    )
     # TODO: needs to improvise this feature for better debugging which users can use to debug the report
     # as well as raise issues if needed with debug logs attached
     parser.add_argument(
@@ -50,6 +206,23 @@ def main():
         help="Minimum log level to include in external-data payloads (default: DEBUG, excludes TRACE).",
     )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.shard_size < 1:
+        parser.error("--shard-size must be at least 1")
+    if args.split_payload and args.external_data:
+        parser.error("--split-payload cannot be combined with --external-data")
+    if args.assets_url and not args.assets_dir:
+        parser.error("--assets-url requires --assets-dir")
+    kind_levels = {}
+    for item in args.compress_kind:
+        kind, _, level = item.partition("=")
+        if kind not in FILE_KINDS or not level.isdigit() or int(level) > 9:
+            parser.error(
+                f"--compress-kind expects KIND=LEVEL with KIND one of {', '.join(FILE_KINDS)} "
+                f"and LEVEL 0-9, got '{item}'"
+            )
+        kind_levels[kind] = int(level)
 
     if args.debug:
         os.environ["BUILD_DEBUG"] = "1"
@@ -58,19 +231,41 @@ def main():
     from .builder import _LEVELS
     from .generator import RobotFrameworkReportGenerator
 
-    if not Path(args.xml_file).exists():
-        print(f"Error: File not found: {args.xml_file}", file=sys.stderr)
-        return 1
+    for xml_file in args.xml_file:
+        if not Path(xml_file).exists():
+            print(f"Error: File not found: {xml_file}", file=sys.stderr)
+            return 1
+    xml_files = args.xml_file[0] if len(args.xml_file) == 1 else args.xml_file
 
     # Resolve explicit min_log_level (None means generator will pick mode-appropriate default)
     min_log_level = _LEVELS.get(args.loglevel.upper()) if args.loglevel else None
 
     try:
         generator = RobotFrameworkReportGenerator(
-            args.xml_file,
+            xml_files,
             external_data=args.external_data,
             min_log_level=min_log_level,
             compress_data=args.compress_data,
+            streaming=args.streaming,
+            jobs=args.jobs,
+            cache_dir=args.cache_dir,
+            cache_max_bytes=args.cache_max_size * 1024 * 1024,
+            incremental=args.incremental,
+            merge=args.merge,
+            packed=args.packed,
+            shard_bytes=args.shard_size * 1024 * 1024,
+            string_table=args.string_table,
+            columnar=args.columnar,
+            dedup=args.dedup,
+            minify=args.minify,
+            split_payload=args.split_payload,
+            assets_dir=args.assets_dir,
+            assets_url=args.assets_url,
+            compression=CompressionPolicy(
+                level=args.compress_level,
+                min_bytes=args.compress_min_size,
+                kind_levels=kind_levels,
+            ),
         )
         generator.generate_html(args.output, external_data=args.external_data)
         return 0
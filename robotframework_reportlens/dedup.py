@@ -0,0 +1,206 @@
+"""
+Content-addressed deduplication of keyword subtrees and log message blocks for the
+external-data files (--dedup). Data-driven suites run the same keywords with the same
+log output many times; only ids, timestamps and durations differ.
+
+A counting pass hashes every keyword subtree of every test by its content (name, type,
+status, arguments, ..., and the hashes of its children; no ids or timing) and every
+keyword's message block by its messages' level, text and flags. During serialization a
+subtree or message block whose hash occurs at least twice is stored once in
+blocks.json and the test and logs files reference it by hash, keeping only the parts
+that differ per occurrence:
+
+- keyword: ``{"id", "ref", "times": [start, end, duration, ...]}`` with one
+  start/end/duration triple per node of the subtree in preorder (start/end null when the
+  plain keyword dict omits them), plus ``"ids"`` (preorder, root excluded) when the
+  child ids are not Robot's positional ``<parent id>-<index>``;
+- message block: ``{"ref", "timestamps": [...]}``; message ids stay
+  ``<keyword id>-msg-<index>``.
+
+Hashes are stable across runs, so --incremental only rewrites files whose content
+changed.
+"""
+
+import hashlib
+import json
+
+from .model import Keyword, LogMessage, ReportModel, Suite
+
+BLOCKS_NAME = "blocks.json"
+# Keyword dict fields that differ per occurrence of the same subtree
+_VARIABLE_FIELDS = ("id", "startTime", "endTime", "duration")
+
+
+def _digest(value: list) -> str:
+    text = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def keyword_key(kw: Keyword, child_keys: list[str]) -> str:
+    """Content hash of a keyword subtree, given the hashes of its children."""
+    return _digest(
+        [
+            kw.name,
+            kw.type,
+            kw.status,
+            list(kw.arguments),
+            kw.documentation,
+            kw.fail_message,
+            kw.returned,
+            list(kw.return_values),
+            kw.badge,
+            child_keys,
+        ]
+    )
+
+
+def message_block_key(messages: tuple[LogMessage, ...]) -> str:
+    """Content hash of a keyword's log messages (without timestamps)."""
+    return _digest([[m.level, m.message, m.is_return, m.html] for m in messages])
+
+
+def _test_keywords(test) -> list[Keyword]:
+    return [kw for kw in (*test.keywords, test.setup, test.teardown) if kw is not None]
+
+
+class BlockStore:
+    """
+    Counts repeated keyword subtrees and message blocks of *model*'s tests on creation;
+    keywords() and messages() then replace repeated ones in the serialized test and logs
+    data by references and collect the referenced blocks for blocks.json.
+    """
+
+    def __init__(self, model: ReportModel):
+        self.keyword_blocks: dict[str, dict] = {}
+        self.message_blocks: dict[str, list[dict]] = {}
+        self.keyword_refs = 0
+        self.keyword_nodes = 0
+        self.message_refs = 0
+        self._counts: dict[str, int] = {}
+        stack: list[Suite] = [model.root_suite]
+        while stack:
+            suite = stack.pop()
+            stack.extend(suite.suites)
+            for test in suite.tests:
+                for kw in test.keywords:
+                    self._count(kw, True)
+                for kw in (test.setup, test.teardown):
+                    if kw is not None:
+                        self._count(kw, False)
+
+    def _count(self, kw: Keyword, messages: bool) -> str:
+        # Logs files only hold the messages of the test body, not of setup/teardown
+        key = keyword_key(kw, [self._count(child, messages) for child in kw.keywords])
+        self._counts[key] = self._counts.get(key, 0) + 1
+        if messages and kw.messages:
+            mkey = message_block_key(kw.messages)
+            self._counts[mkey] = self._counts.get(mkey, 0) + 1
+        return key
+
+    def _keys(self, kw: Keyword, keys: dict[int, str]) -> str:
+        key = keyword_key(kw, [self._keys(child, keys) for child in kw.keywords])
+        keys[id(kw)] = key
+        return key
+
+    def keywords(self, test, test_dict: dict) -> None:
+        """Replace repeated keyword subtrees of a test dict (without messages) by refs."""
+        keys: dict[int, str] = {}
+        for kw in _test_keywords(test):
+            self._keys(kw, keys)
+        test_dict["keywords"] = [
+            self._keyword(kw, d, keys)
+            for kw, d in zip(test.keywords, test_dict.get("keywords", ()))
+        ]
+        if not test_dict["keywords"]:
+            del test_dict["keywords"]
+        for field, kw in (("setup", test.setup), ("teardown", test.teardown)):
+            if kw is not None and field in test_dict:
+                test_dict[field] = self._keyword(kw, test_dict[field], keys)
+
+    def _keyword(self, kw: Keyword, kw_dict: dict, keys: dict[int, str]) -> dict:
+        key = keys[id(kw)]
+        if self._counts[key] < 2:
+            if kw.keywords:
+                kw_dict["keywords"] = [
+                    self._keyword(child, d, keys)
+                    for child, d in zip(kw.keywords, kw_dict["keywords"])
+                ]
+            return kw_dict
+        times: list = []
+        ids: list[str] = []
+        positional = self._store(kw, kw_dict, keys, times, ids)
+        self.keyword_refs += 1
+        self.keyword_nodes += len(times) // 3
+        ref = {"id": kw_dict["id"], "ref": key, "times": times}
+        if not positional:
+            ref["ids"] = ids
+        return ref
+
+    def _store(
+        self,
+        kw: Keyword,
+        kw_dict: dict,
+        keys: dict[int, str],
+        times: list,
+        ids: list[str],
+    ) -> bool:
+        """
+        Add the subtree of *kw* to the blocks and collect its per-occurrence timing and
+        child ids in preorder; return whether all child ids are positional.
+        """
+        key = keys[id(kw)]
+        times += [
+            kw_dict.get("startTime"),
+            kw_dict.get("endTime"),
+            kw_dict.get("duration", 0),
+        ]
+        child_dicts = kw_dict.get("keywords", ())
+        if key not in self.keyword_blocks:
+            block = {k: v for k, v in kw_dict.items() if k not in _VARIABLE_FIELDS}
+            if child_dicts:
+                block["keywords"] = [keys[id(child)] for child in kw.keywords]
+            self.keyword_blocks[key] = block
+        positional = True
+        for index, (child, child_dict) in enumerate(zip(kw.keywords, child_dicts)):
+            ids.append(child_dict["id"])
+            positional &= child_dict["id"] == f"{kw_dict['id']}-{index}"
+            positional &= self._store(child, child_dict, keys, times, ids)
+        return positional
+
+    def messages(self, test, log_map: dict[str, list[dict]]) -> None:
+        """Replace repeated message blocks in a test's keywordMessages by refs."""
+        stack = list(test.keywords)
+        while stack:
+            kw = stack.pop()
+            stack.extend(kw.keywords)
+            if not kw.messages or kw.id not in log_map:
+                continue
+            key = message_block_key(kw.messages)
+            if self._counts[key] < 2:
+                continue
+            messages = log_map[kw.id]
+            if key not in self.message_blocks:
+                self.message_blocks[key] = [
+                    {k: v for k, v in m.items() if k not in ("id", "timestamp")}
+                    for m in messages
+                ]
+            log_map[kw.id] = {
+                "ref": key,
+                "timestamps": [m.get("timestamp") for m in messages],
+            }
+            self.message_refs += 1
+
+    @property
+    def ratio(self) -> float:
+        """Referenced keyword nodes and message blocks per stored block."""
+        stored = len(self.keyword_blocks) + len(self.message_blocks)
+        return (self.keyword_nodes + self.message_refs) / stored if stored else 1.0
+
+    def summary(self) -> str:
+        """One-line build summary with the dedup ratio."""
+        return (
+            f"Deduplicated data: {self.keyword_refs} keyword subtrees "
+            f"({self.keyword_nodes} keywords) and {self.message_refs} message blocks "
+            f"-> {len(self.keyword_blocks)} + {len(self.message_blocks)} blocks "
+            f"(ratio x{self.ratio:.1f})"
+        )
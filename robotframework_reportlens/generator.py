@@ -3,17 +3,34 @@ Robot Framework Report Generator.
 Uses ExecutionResult -> ReportModel -> template payload. No manual XML.
 """
 
-import gzip
+import base64
+import io
 import json
+import os
 from pathlib import Path
+from typing import TextIO
 
-from .builder import build_report_model, _LEVELS
+from .assets import ReportTemplate, write_shared_assets
+from .builder import build_report_model, stream_report_model, _LEVELS
+from .cache import DEFAULT_CACHE_MAX_BYTES, ModelCache
+from .dedup import BlockStore
+from .manifest import (
+    DEFAULT_SHARD_BYTES,
+    CompressionPolicy,
+    DataDirWriter,
+    ShardPacker,
+    encode_json_file,
+    file_kind,
+    gzip_bytes,
+)
+from .merge import build_shard_models, merge_report_models
 from .serialize import (
     _error_file_path,
+    _script_safe,
+    external_data_files,
     model_to_payload,
-    _keyword_to_dict,
-    _collect_keyword_messages,
-    _test_to_dict_without_messages,
+    write_payload_gzip_base64,
+    write_payload_json,
 )
 
 
@@ -26,14 +43,103 @@ class RobotFrameworkReportGenerator:
         external_data: bool = False,
         min_log_level: int | None = None,
         compress_data: bool = False,
+        streaming: bool = False,
+        jobs: int = 1,
+        cache_dir: str | None = None,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        incremental: bool = False,
+        merge: bool = False,
+        packed: bool = False,
+        shard_bytes: int = DEFAULT_SHARD_BYTES,
+        compression: CompressionPolicy | None = None,
+        string_table: bool = False,
+        columnar: bool = False,
+        dedup: bool = False,
+        template: ReportTemplate | None = None,
+        minify: bool = False,
+        assets_dir: str | None = None,
+        assets_url: str | None = None,
+        split_payload: bool = False,
     ):
+        # One output.xml, or several (e.g. pabot shards) combined like rebot (merge=True: rebot --merge)
         self.xml_file = xml_file
+        xml_files = [xml_file] if isinstance(xml_file, (str, Path)) else list(xml_file)
         # Default loglevel: TRACE (include everything) for self-contained; DEBUG (exclude TRACE) for external-data
         if min_log_level is None:
             min_log_level = _LEVELS["DEBUG"] if external_data else _LEVELS["TRACE"]
-        self._model = build_report_model(xml_file, min_log_level=min_log_level)
+        # All build modes produce the same model, so cache keys ignore streaming/jobs;
+        # with several outputs each one is cached on its own
+        cache = ModelCache(cache_dir, cache_max_bytes) if cache_dir else None
+        keys = [cache.key(str(f), min_log_level) for f in xml_files] if cache else []
+        models = [cache.load(key) for key in keys] if cache else [None] * len(xml_files)
+        missing = [i for i, model in enumerate(models) if model is None]
+        if len(xml_files) == 1:
+            built = (
+                [self._build_model(min_log_level, streaming, jobs)] if missing else []
+            )
+        else:
+            built = build_shard_models(
+                [str(xml_files[i]) for i in missing], min_log_level, jobs, streaming
+            )
+        for i, model in zip(missing, built):
+            models[i] = model
+            if cache:
+                cache.store(keys[i], model)
+        self._model = (
+            models[0] if len(models) == 1 else merge_report_models(models, merge=merge)
+        )
+        dropped = self._model.dropped_messages
+        if dropped:
+            level = next(
+                (k for k, v in _LEVELS.items() if v == min_log_level),
+                str(min_log_level),
+            )
+            counts = ", ".join(f"{lvl}: {n}" for lvl, n in dropped.items())
+            print(
+                f"Dropped {sum(dropped.values())} log messages below {level} ({counts})"
+            )
         self._external_data = external_data
         self._compress_data = compress_data
+        # External-data only: keep files whose hash matches reportlens-data/manifest.sha256
+        self._incremental = incremental
+        # External-data files are also encoded, compressed and written by `jobs` threads
+        self._jobs = jobs
+        # External-data only: pack test and logs records into tests_<n>.pack shards
+        self._packed = packed
+        self._shard_bytes = shard_bytes
+        # With compress_data: gzip level per file kind and minimum size to compress
+        self._compression = compression or CompressionPolicy()
+        # Set by _build_external when some data files are .gz and others plain, and
+        # when the policy kept every external-data file plain
+        self._mixed_compression = False
+        self._all_plain = False
+        # schemaVersion 2 payloads: keyword/message strings referenced by table index
+        self._string_table = string_table
+        # External-data only: test stubs and the suites index as parallel arrays
+        self._columnar = columnar
+        # External-data only: repeated keyword subtrees/message blocks in blocks.json
+        self._dedup = dedup
+        # Precompiled template assets; None uses the process-wide cached template.html
+        self._template = template
+        # Comments and optional whitespace stripped from the cached template CSS/JS
+        self._minify = minify
+        # Shared reportlens.<hash>.css/.js written here and linked instead of inlined;
+        # referenced relative to the report unless assets_url gives their public URL
+        self._assets_dir = Path(assets_dir) if assets_dir else None
+        self._assets_url = assets_url
+        # Self-contained only: embed the external-data files as separate script blocks
+        # that the report parses on demand instead of one payload parsed at open
+        self._split_payload = split_payload
+
+    def _build_model(self, min_log_level: int, streaming: bool, jobs: int):
+        """Build the ReportModel from self.xml_file."""
+        # Streaming never holds Robot's full ExecutionResult in memory (large output.xml files);
+        # jobs > 1 streams top-level suites in worker processes
+        if streaming or jobs > 1:
+            return stream_report_model(
+                self.xml_file, min_log_level=min_log_level, jobs=jobs
+            )
+        return build_report_model(self.xml_file, min_log_level=min_log_level)
 
     _error_file_path = staticmethod(_error_file_path)
 
@@ -45,247 +151,200 @@ class RobotFrameworkReportGenerator:
         compress=True  → write ``.json.gz`` only (no plain .json).
                          mtime=0 ensures deterministic output across runs.
         """
-        json_bytes = json.dumps(data, ensure_ascii=False).encode("utf-8")
         if compress:
-            gz_path = path_obj.parent / (path_obj.name + ".gz")
-            with gzip.GzipFile(gz_path, "wb", compresslevel=9, mtime=0) as fh:
-                fh.write(json_bytes)
-        else:
-            path_obj.write_bytes(json_bytes)
+            path_obj = path_obj.parent / (path_obj.name + ".gz")
+        path_obj.write_bytes(encode_json_file(path_obj.name, data, compress))
 
     def _build_report_data(self):
         """Build template-format report data from the internal model."""
-        return model_to_payload(self._model)
+        return model_to_payload(self._model, string_table=self._string_table)
 
     def generate_html(self, output_file="report.html", external_data: bool = False):
         """Generate the complete HTML report. Overwrites the file if it already exists."""
         if external_data:
             self._build_external(output_file)
             return
-        html_content = self._build_html(external_data=False)
         path = Path(output_file)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(html_content, encoding="utf-8")
+        # The payload is streamed into the file instead of being built as one string
+        template = self._page_template(path)
+        with path.open("w", encoding="utf-8") as fh:
+            self._write_html(fh, external_data=False, template=template)
         print(f"Report generated: {output_file}")
 
     def _get_template_html_path(self):
         """Path to template.html inside this package (works when installed)."""
         return Path(__file__).resolve().parent / "template" / "template.html"
 
+    def _get_template(self) -> ReportTemplate:
+        """Template assets: the ones passed in, else the process-wide cached template."""
+        return self._template or ReportTemplate.load(
+            self._get_template_html_path(), minify=self._minify
+        )
+
+    def _page_template(self, output_path: Path) -> ReportTemplate:
+        """Template for the report at *output_path*: inlined, or linking shared assets."""
+        template = self._get_template()
+        if self._assets_dir is None:
+            return template
+        css_name, js_name = write_shared_assets(template, self._assets_dir)
+        if self._assets_url:
+            base = self._assets_url.rstrip("/") + "/"
+        else:
+            rel = os.path.relpath(
+                self._assets_dir.resolve(), output_path.parent.resolve()
+            )
+            base = "" if rel == "." else Path(rel).as_posix() + "/"
+        return template.linked(base + css_name, base + js_name)
+
     def _get_template_css(self):
-        """Extract CSS from template/template.html."""
-        path = self._get_template_html_path()
-        if not path.exists():
-            return "/* template.html not found */"
-        text = path.read_text(encoding="utf-8")
-        start = text.find("<style>") + len("<style>")
-        end = text.find("</style>")
-        if start < len("<style>") or end == -1:
-            return ""
-        return text[start:end].strip()
+        """CSS of template/template.html."""
+        return self._get_template().css
 
     def _get_template_javascript(self):
-        """Extract JS from template/template.html and adapt to use embedded reportData."""
-        path = self._get_template_html_path()
-        if not path.exists():
-            return 'console.error("template.html not found");'
-        text = path.read_text(encoding="utf-8")
-        start = text.find("<script>") + len("<script>")
-        end = text.find("</script>", start)
-        if start < len("<script>") or end == -1:
-            return ""
-        js = text[start:end]
-        js = js.replace("mockData", "reportData")
-        mock_start = js.find("// ========== Mock Data ==========")
-        icons_start = js.find("// ========== Icons ==========")
-        if mock_start != -1 and icons_start != -1 and icons_start > mock_start:
-            js = js[:mock_start] + js[icons_start:]
-        js = js.replace(
-            "expandFailedSuites(reportData.rootSuite);",
-            "if (reportData.rootSuite) expandFailedSuites(reportData.rootSuite);",
-        )
-        js = js.replace(
-            "const failedTests = getFailedTests(reportData.rootSuite);\n    if (failedTests.length > 0)",
-            "const failedTests = reportData.rootSuite ? getFailedTests(reportData.rootSuite) : [];\n    if (failedTests.length > 0)",
-        )
-        return js.strip()
+        """JS of template/template.html adapted to use embedded reportData."""
+        return self._get_template().javascript
 
     def _build_html(
-        self, external_data: bool = False, data_root: str = "reportlens-data"
+        self,
+        external_data: bool = False,
+        data_root: str = "reportlens-data",
+        template: ReportTemplate | None = None,
     ):
         """Build the complete HTML document (template-style, data-driven)."""
-        report_data = None if external_data else self._build_report_data()
-        json_str = (
-            json.dumps(report_data, ensure_ascii=False)
-            if report_data is not None
-            else ""
+        buf = io.StringIO()
+        self._write_html(
+            buf, external_data=external_data, data_root=data_root, template=template
         )
-        json_str = (
-            json_str.replace("</script>", "<\\/script>").replace(
-                "</SCRIPT>", "<\\/SCRIPT>"
-            )
-            if json_str
-            else ""
-        )
-        css = self._get_template_css()
-        js = self._get_template_javascript()
+        return buf.getvalue()
+
+    def _write_html(
+        self,
+        fh: TextIO,
+        external_data: bool = False,
+        data_root: str = "reportlens-data",
+        template: ReportTemplate | None = None,
+    ) -> None:
+        """Write the complete HTML document to *fh*, streaming the embedded payload."""
+        split = self._split_payload and not external_data
         config = {
-            "externalData": external_data,
+            # Split self-contained reports load their embedded files like external data
+            "externalData": external_data or split,
             "dataRoot": data_root,
-            "schemaVersion": 1,
+            "schemaVersion": 2 if self._string_table else 1,
         }
-        if external_data and self._compress_data:
+        if split:
+            config["embeddedData"] = True
+        if self._compress_data and not (external_data and self._all_plain):
+            # External data: .json.gz files; self-contained: a gzip+base64 payload
             config["compressed"] = True
+        if external_data and self._packed:
+            config["packed"] = True
+        if (external_data or split) and self._dedup:
+            config["dedup"] = True
+        if external_data and self._mixed_compression:
+            # Only the files listed as .gz in manifest.sha256 are compressed
+            config["mixedCompression"] = True
         config_str = json.dumps(config, ensure_ascii=False)
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0, minimum-scale=0.25, maximum-scale=5, user-scalable=yes">
-  <title>Robot Framework Test Report</title>
-  <link rel="icon" type="image/svg+xml" href="https://docs.robotframework.org/img/robot-framework-dark.svg">
-  <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;500;600&display=swap" rel="stylesheet">
-  <style>
-{css}
-  </style>
-</head>
-<body>
-  <div class="app" id="app"></div>
-  <script type="application/json" id="report-config">{config_str}</script>
-  {"" if external_data else f'<script type="application/json" id="report-data">{json_str}</script>'}
-  <script>
-{js}
-  </script>
-</body>
-</html>"""
+        payload = None
+        files = ()
+        blocks = None
+        if split:
+            blocks = BlockStore(self._model) if self._dedup else None
+            files = self._embedded_files(blocks)
+        elif not external_data and self._compress_data:
 
-    def _build_external(self, output_file: str):
-        """Generate report.html plus external JSON payload split across files."""
-        report_data = self._build_report_data()
-        payload = model_to_payload(self._model)
+            def payload(out: TextIO) -> None:
+                write_payload_gzip_base64(
+                    self._model,
+                    out,
+                    level=self._compression.level,
+                    string_table=self._string_table,
+                )
 
-        path = Path(output_file)
-        data_dir = path.parent / "reportlens-data"
-        data_dir.mkdir(parents=True, exist_ok=True)
+        elif not external_data:
 
-        suite_errors_map = {}
-        test_suite_errors = {}
+            def payload(out: TextIO) -> None:
+                write_payload_json(
+                    self._model, out, script_safe=True, string_table=self._string_table
+                )
 
-        def walk_errors(suite_dict):
-            suite_errors_map[suite_dict.get("id")] = suite_dict.get("errors", [])
-            for t in suite_dict.get("tests", []):
-                test_suite_errors[t.get("id")] = t.get("suiteErrors", [])
-            for child in suite_dict.get("suites", []):
-                walk_errors(child)
+        (template or self._get_template()).write(fh, config_str, payload, files)
+        if blocks is not None:
+            print(blocks.summary())
 
-        if payload.get("rootSuite"):
-            walk_errors(payload["rootSuite"])
+    def _embedded_files(self, blocks: BlockStore | None):
+        """
+        (name, text) of the external-data files for a split self-contained report:
+        script-safe JSON, or base64 gzip JSON where the compression policy compresses.
+        """
+        for name, data in external_data_files(
+            self._model, self._string_table, self._columnar, blocks
+        ):
+            text = json.dumps(data, ensure_ascii=False)
+            if self._compress_data:
+                json_bytes = text.encode("utf-8")
+                level = self._compression.level_for(file_kind(name), len(json_bytes))
+                if level:
+                    gz = gzip_bytes(name + ".gz", json_bytes, level)
+                    yield name, base64.b64encode(gz).decode("ascii")
+                    continue
+            yield name, _script_safe(text)
 
-        def iter_suites(suite):
-            yield suite
-            for child in suite.suites:
-                yield from iter_suites(child)
+    def _build_external(self, output_file: str):
+        """Generate report.html plus external JSON payload split across files."""
+        path = Path(output_file)
+        data_dir = path.parent / "reportlens-data"
+        data_dir.mkdir(parents=True, exist_ok=True)
 
-        root = self._model.root_suite
-        summary = {
-            "schemaVersion": 1,
-            "generated": report_data.get("generated", ""),
-            "generator": report_data.get("generator", ""),
-            "startTime": report_data.get("startTime", ""),
-            "endTime": report_data.get("endTime", ""),
-            "duration": report_data.get("duration", 0),
-            "statistics": report_data.get("statistics", {}),
-            "errors": report_data.get("errors", []),
-            "rootSuiteId": root.id,
-            "rootSuiteName": root.name,
-        }
+        writer = DataDirWriter(
+            data_dir,
+            compress=self._compress_data,
+            incremental=self._incremental,
+            # Compression only runs in parallel on separate cores; more threads than
+            # CPUs just contend for the GIL
+            jobs=min(self._jobs, os.cpu_count() or 1),
+            policy=self._compression,
+        )
+        # One pass over the model yields summary, per-suite, per-test and logs files
+        # and finally the suites index
+        packer = ShardPacker(writer, self._shard_bytes) if self._packed else None
+        test_index: dict[str, list[int]] = {}
+        test_file = None
+        blocks = BlockStore(self._model) if self._dedup else None
+        for name, data in external_data_files(
+            self._model, self._string_table, self._columnar, blocks
+        ):
+            if packer is not None and name.startswith("test_"):
+                # A test file is always followed by its logs file: pack them together
+                if name.endswith("_logs.json"):
+                    test_index[data["testId"]] = packer.add(
+                        (f"test_{data['testId']}.json", test_file),
+                        (name, data),
+                    )
+                else:
+                    test_file = data
+                continue
+            if packer is not None and name == "suites.json":
+                packer.finish()
+                data = {**data, "shards": packer.shards, "testIndex": test_index}
+            writer.write_json(name, data)
 
-        suites_list = []
-        for suite in iter_suites(root):
-            suites_list.append(
-                {
-                    "id": suite.id,
-                    "name": suite.name,
-                    "fullName": suite.full_name,
-                    "status": suite.status,
-                    "startTime": suite.start_time,
-                    "duration": suite.duration,
-                    "statistics": suite.statistics,
-                    "childSuiteIds": [s.id for s in suite.suites],
-                    "testIds": [t.id for t in suite.tests],
-                }
+        writer.finish()
+        if self._incremental:
+            print(
+                f"Incremental data: {len(writer.changed)} written, "
+                f"{writer.unchanged} unchanged, {len(writer.deleted)} deleted"
             )
-
-        suites_json = {
-            "schemaVersion": 1,
-            "rootSuiteId": root.id,
-            "suites": suites_list,
-        }
-
-        def write_json(path_obj: Path, data: dict):
-            self._write_json_files(path_obj, data, compress=self._compress_data)
-
-        write_json(data_dir / "summary.json", summary)
-        write_json(data_dir / "suites.json", suites_json)
-
-        for suite in iter_suites(root):
-            tests_stub = []
-            for test in suite.tests:
-                tests_stub.append(
-                    {
-                        "id": test.id,
-                        "name": test.name,
-                        "fullName": test.full_name,
-                        "status": test.status,
-                        "duration": test.duration,
-                        "startTime": test.start_time,
-                        "message": test.message,
-                        "tags": test.tags,
-                    }
-                )
-
-            suite_payload = {
-                "schemaVersion": 1,
-                "suite": {
-                    "id": suite.id,
-                    "name": suite.name,
-                    "fullName": suite.full_name,
-                    "status": suite.status,
-                    "startTime": suite.start_time,
-                    "duration": suite.duration,
-                    "statistics": suite.statistics,
-                    "setup": _keyword_to_dict(suite.setup) if suite.setup else None,
-                    "teardown": _keyword_to_dict(suite.teardown)
-                    if suite.teardown
-                    else None,
-                    "childSuiteIds": [s.id for s in suite.suites],
-                    "testIds": [t.id for t in suite.tests],
-                    "errors": suite_errors_map.get(suite.id, []),
-                },
-                "tests": tests_stub,
-            }
-            write_json(data_dir / f"suite_{suite.id}.json", suite_payload)
-
-            for test in suite.tests:
-                test_payload = _test_to_dict_without_messages(test)
-                test_payload["suiteErrors"] = test_suite_errors.get(test.id, [])
-                test_file = {
-                    "schemaVersion": 1,
-                    "test": test_payload,
-                }
-                write_json(data_dir / f"test_{test.id}.json", test_file)
-
-                log_map: dict[str, list[dict]] = {}
-                for kw in test.keywords:
-                    _collect_keyword_messages(kw, log_map)
-                logs_file = {
-                    "schemaVersion": 1,
-                    "testId": test.id,
-                    "keywordMessages": log_map,
-                }
-                write_json(data_dir / f"test_{test.id}_logs.json", logs_file)
-
-        html_content = self._build_html(external_data=True, data_root="reportlens-data")
+        if blocks is not None:
+            print(blocks.summary())
+        self._mixed_compression = writer.mixed_compression
+        self._all_plain = not writer.compressed
+        html_content = self._build_html(
+            external_data=True,
+            data_root="reportlens-data",
+            template=self._page_template(path),
+        )
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(html_content, encoding="utf-8")
         print(f"Report generated: {output_file}")
@@ -0,0 +1,275 @@
+"""
+Writer for the external-data directory (reportlens-data/).
+Every file written is recorded with its SHA-256 in manifest.sha256 (``sha256sum`` format,
+so ``sha256sum -c manifest.sha256`` verifies the directory). In incremental mode the
+previous manifest is used to skip files whose bytes did not change and to delete files
+from the previous run that are no longer produced. With jobs > 1, files are encoded,
+compressed, hashed and written by a bounded thread pool (zlib, hashlib and file I/O
+release the GIL); the written bytes and the manifest do not depend on the job count.
+When compressing, a CompressionPolicy picks the gzip level per file kind and keeps small
+files plain; the manifest tells the frontend which files ended up as .gz.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+MANIFEST_NAME = "manifest.sha256"
+DEFAULT_SHARD_BYTES = 8 * 1024 * 1024
+FILE_KINDS = ("summary", "suites", "suite", "test", "logs", "blocks", "search")
+
+
+def file_kind(name: str) -> str:
+    """Kind of an external-data file name (one of FILE_KINDS)."""
+    if name.startswith("test_"):
+        return "logs" if name.split(".", 1)[0].endswith("_logs") else "test"
+    if name.startswith("suite_"):
+        return "suite"
+    return name.split(".", 1)[0]
+
+
+@dataclass(frozen=True)
+class CompressionPolicy:
+    """
+    How --compress-data compresses files: gzip *level* (1-9), per-kind overrides in
+    *kind_levels* (level 0 stores that kind plain) and *min_bytes*, below which JSON is
+    stored plain because the gzip header and CPU time are not worth it. The defaults
+    compress every file at level 9.
+    """
+
+    level: int = 9
+    min_bytes: int = 0
+    kind_levels: dict[str, int] = field(default_factory=dict)
+
+    def level_for(self, kind: str, size: int) -> int:
+        """gzip level for *size* bytes of JSON of the given kind; 0 means plain."""
+        if size < self.min_bytes:
+            return 0
+        return self.kind_levels.get(kind, self.level)
+
+
+def gzip_bytes(name: str, content: bytes, level: int = 9) -> bytes:
+    """gzip stream of *content* with mtime=0, so identical input gives identical bytes."""
+    buf = io.BytesIO()
+    with gzip.GzipFile(
+        filename=name, mode="wb", fileobj=buf, compresslevel=level, mtime=0
+    ) as fh:
+        fh.write(content)
+    return buf.getvalue()
+
+
+def encode_json_file(
+    name: str, data: dict, compress: bool = False, level: int = 9
+) -> bytes:
+    """
+    Bytes of a data file: UTF-8 JSON, or gzip (mtime=0) when compress=True so that
+    identical data always produces identical bytes.
+    """
+    json_bytes = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    if not compress:
+        return json_bytes
+    return gzip_bytes(name, json_bytes, level)
+
+
+class DataDirWriter:
+    """
+    Writes JSON data files into *data_dir* and tracks them in manifest.sha256.
+    incremental=True leaves files untouched when their hash matches the previous
+    manifest; finish() then deletes files the previous manifest listed but this run
+    did not write, and records what changed. jobs > 1 writes files in a pool of that
+    many threads with at most 4 * jobs files queued; finish() waits for them and
+    re-raises the first error. With compress=True, *policy* decides per file whether
+    it is written as ``name.gz`` and at which level.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path,
+        compress: bool = False,
+        incremental: bool = False,
+        jobs: int = 1,
+        policy: CompressionPolicy | None = None,
+    ):
+        self.data_dir = Path(data_dir)
+        self.compress = compress
+        self.policy = policy or CompressionPolicy()
+        self.incremental = incremental
+        self.files: dict[str, str] = {}
+        self.changed: list[str] = []
+        self.unchanged = 0
+        self.deleted: list[str] = []
+        self._previous = self._read_manifest() if incremental else {}
+        # True once the policy compressed any file or packed record
+        self.compressed = False
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else None
+        self._max_pending = 4 * jobs
+        self._pending: set[Future] = set()
+
+    def _read_manifest(self) -> dict[str, str]:
+        try:
+            lines = (self.data_dir / MANIFEST_NAME).read_text("utf-8").splitlines()
+        except OSError:
+            return {}
+        files = {}
+        for line in lines:
+            digest, sep, name = line.partition("  ")
+            if sep and len(digest) == 64:
+                files[name] = digest
+        return files
+
+    def write_json(self, name: str, data: dict) -> None:
+        """Write *data* as ``name`` (``name.gz`` when the policy compresses it)."""
+        if self._pool is None:
+            self._encode_and_write(name, data)
+            return
+        # Bounded queue: *data* stays referenced until its file is written
+        if len(self._pending) >= self._max_pending:
+            done, self._pending = wait(self._pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+        self._pending.add(self._pool.submit(self._encode_and_write, name, data))
+
+    def encode(self, name: str, data: dict) -> tuple[str, bytes]:
+        """File name and bytes of *data* stored as *name* under the compression policy."""
+        json_bytes = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        level = (
+            self.policy.level_for(file_kind(name), len(json_bytes))
+            if self.compress
+            else 0
+        )
+        if not level:
+            return name, json_bytes
+        self.compressed = True
+        name += ".gz"
+        return name, gzip_bytes(name, json_bytes, level)
+
+    def encode_later(self, name: str, data: dict) -> Future:
+        """Future of encode(name, data), run in the thread pool when there is one."""
+        if self._pool is None:
+            future: Future = Future()
+            future.set_result(self.encode(name, data))
+            return future
+        return self._pool.submit(self.encode, name, data)
+
+    def _encode_and_write(self, name: str, data: dict) -> None:
+        self.write_bytes(*self.encode(name, data))
+
+    @property
+    def mixed_compression(self) -> bool:
+        """True when some JSON files were stored plain although the policy compressed
+        other files (JSON files or packed records)."""
+        names = [n for n in self.files if n.endswith((".json", ".json.gz"))]
+        gz = sum(n.endswith(".gz") for n in names)
+        return self.compressed and gz < len(names)
+
+    def write_bytes(self, name: str, content: bytes) -> None:
+        digest = hashlib.sha256(content).hexdigest()
+        path = self.data_dir / name
+        with self._lock:
+            self.files[name] = digest
+        if self._previous.get(name) == digest and path.exists():
+            with self._lock:
+                self.unchanged += 1
+            return
+        path.write_bytes(content)
+        with self._lock:
+            self.changed.append(name)
+
+    def _wait(self) -> None:
+        if self._pool is None:
+            return
+        try:
+            for future in self._pending:
+                future.result()
+        finally:
+            self._pending = set()
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def finish(self) -> None:
+        """
+        Wait for queued files, delete stale files (incremental mode) and write
+        manifest.sha256 (sorted by name).
+        """
+        self._wait()
+        self.changed.sort()
+        for name in sorted(set(self._previous) - set(self.files)):
+            # Only names from our own manifest, never anything outside data_dir
+            path = self.data_dir / Path(name).name
+            if path.exists():
+                path.unlink()
+            self.deleted.append(name)
+        # Sorted by name: the manifest does not depend on the order files were written
+        (self.data_dir / MANIFEST_NAME).write_text(
+            "".join(f"{self.files[name]}  {name}\n" for name in sorted(self.files)),
+            encoding="utf-8",
+        )
+
+
+class ShardPacker:
+    """
+    Packs JSON records into a few shard files (tests_<n>.pack) written through a
+    DataDirWriter instead of one file per record. Each record is encoded on its own
+    (UTF-8 JSON, or a complete gzip stream when the writer's policy compresses it;
+    readers tell them apart by the gzip magic bytes), so a reader can decode it from a
+    slice of the shard or fetch it with an HTTP Range request. A shard is closed once
+    adding a record group would grow it past shard_bytes. Records are encoded in the
+    writer's thread pool and placed in the order they were added, so shards do not
+    depend on the job count.
+    """
+
+    def __init__(self, writer: DataDirWriter, shard_bytes: int = DEFAULT_SHARD_BYTES):
+        self.writer = writer
+        self.shard_bytes = shard_bytes
+        self.shards: list[str] = []
+        self._buf = bytearray()
+        # Record groups still being encoded: (index entry to fill in, encode futures)
+        self._queue: deque[tuple[list[int], list[Future]]] = deque()
+
+    def add(self, *records: tuple[str, dict]) -> list[int]:
+        """
+        Append *records* ``(file name, data)`` to the same shard; return the index entry
+        ``[shard, offset1, length1, offset2, length2, ...]`` (byte offsets in the shard).
+        The entry is filled in once the records are encoded, at the latest by finish().
+        The name only selects the compression policy's kind.
+        """
+        entry: list[int] = []
+        futures = [self.writer.encode_later(name, data) for name, data in records]
+        self._queue.append((entry, futures))
+        # Bounded queue: place finished groups, and wait for the oldest when it is full
+        while self._queue and (
+            len(self._queue) > self.writer._max_pending
+            or all(future.done() for future in self._queue[0][1])
+        ):
+            self._place(*self._queue.popleft())
+        return entry
+
+    def _place(self, entry: list[int], futures: list[Future]) -> None:
+        encoded = [future.result()[1] for future in futures]
+        size = sum(len(b) for b in encoded)
+        if self._buf and len(self._buf) + size > self.shard_bytes:
+            self._flush()
+        entry.append(len(self.shards))
+        for content in encoded:
+            entry += [len(self._buf), len(content)]
+            self._buf += content
+
+    def _flush(self) -> None:
+        name = f"tests_{len(self.shards)}.pack"
+        self.writer.write_bytes(name, bytes(self._buf))
+        self.shards.append(name)
+        self._buf = bytearray()
+
+    def finish(self) -> None:
+        """Place the records still being encoded and write the last, partly filled shard."""
+        while self._queue:
+            self._place(*self._queue.popleft())
+        if self._buf:
+            self._flush()
@@ -0,0 +1,218 @@
+"""
+Build one ReportModel from several output.xml files (e.g. pabot shards or reruns).
+Each output is built into its own ReportModel, in worker processes when jobs > 1, and the
+models are then combined the way rebot does it:
+
+- default: a new root suite named "A & B & ..." holds each output's root suite;
+- merge=True (rebot --merge): suites are matched by name, a re-executed test replaces the
+  earlier result (latest result wins) unless it was skipped, and new suites/tests are
+  appended. Messages record what was merged, like rebot's (as plain text).
+
+Suite and test IDs, keyword IDs and full names are then renumbered positionally, as Robot
+does for the combined result.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from robot.errors import DataError
+
+from .builder import (
+    _all_tests,
+    _sorted_dropped,
+    _status_from_tests,
+    _suite_statistics,
+    build_report_model,
+    stream_report_model,
+)
+from .model import Keyword, ReportModel, Suite
+
+_MERGE_HEADER = "Test has been re-executed and results merged."
+# Plain-text stand-in for the <hr> rebot puts between parts of a merge message
+_HR = "\n---\n"
+
+
+def build_shard_models(
+    xml_paths: list[str], min_log_level: int, jobs: int = 1, streaming: bool = False
+) -> list[ReportModel]:
+    """Build a ReportModel per output file, in up to *jobs* worker processes."""
+    build = stream_report_model if streaming else build_report_model
+    if jobs <= 1 or len(xml_paths) <= 1:
+        return [build(path, min_log_level) for path in xml_paths]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(xml_paths))) as pool:
+        return list(pool.map(build, xml_paths, [min_log_level] * len(xml_paths)))
+
+
+def merge_report_models(
+    models: list[ReportModel], merge: bool = False, project_name: str | None = None
+) -> ReportModel:
+    """
+    Combine (or with merge=True, rerun-merge) models in the given order into one model.
+    The root suite is named *project_name* (default: the first model's project name).
+    """
+    if not models:
+        raise ValueError("At least one model is needed")
+    project_name = project_name or models[0].root_suite.name
+    roots = [m.root_suite for m in models]
+    for model in models:
+        model.root_suite.name = model.root_name or model.root_suite.name
+    root_name = roots[0].name if merge else " & ".join(r.name for r in roots)
+    if merge:
+        root = roots[0]
+        for new in roots[1:]:
+            if new.name != root.name:
+                raise DataError(
+                    "Cannot merge outputs containing different root suites. "
+                    f"Original suite is '{root.name}' and merged is '{new.name}'."
+                )
+            _merge_suite(root, new)
+    else:
+        root = Suite(
+            id="s1",
+            name=root_name,
+            full_name="",
+            status="PASS",
+            start_time=None,
+            suites=roots,
+            statistics=_suite_statistics([]),
+        )
+        _reset_timing(root)
+    _renumber(root, "s1", "")
+    root.status = _status_from_tests(_all_tests(root))
+    root.name = root.full_name = project_name
+
+    tests = _all_tests(root)
+    statistics = _suite_statistics(tests)
+    total = statistics["total"]
+    statistics["passRate"] = int(statistics["passed"] / total * 100) if total > 0 else 0
+    dropped: dict[str, int] = {}
+    for model in models:
+        for level, count in model.dropped_messages.items():
+            dropped[level] = dropped.get(level, 0) + count
+    generated = [m.generated for m in models if m.generated is not None]
+    starts = [m.start_time for m in models if m.start_time is not None]
+    ends = [m.end_time for m in models if m.end_time is not None]
+    return ReportModel(
+        generated=max(generated) if generated else None,
+        generator=models[0].generator,
+        start_time=min(starts) if starts else None,
+        end_time=max(ends) if ends else None,
+        duration=root.duration,
+        statistics=statistics,
+        errors=[e for m in models for e in m.errors],
+        root_suite=root,
+        utc_offset=models[0].utc_offset,
+        dropped_messages=_sorted_dropped(dropped),
+        root_name=root_name,
+    )
+
+
+def _find(items, name: str):
+    for item in items:
+        if item.name == name:
+            return item
+    return None
+
+
+def _merge_suite(old: Suite, new: Suite) -> None:
+    """Merge *new* into the matching suite *old* (rebot's Merger.start_suite/visit_test)."""
+    old.setup = new.setup
+    old.teardown = new.teardown
+    old.source = new.source or old.source
+    for suite in new.suites:
+        match = _find(old.suites, suite.name)
+        if match is None:
+            old.suites.append(suite)
+        else:
+            _merge_suite(match, suite)
+    for test in new.tests:
+        match = _find(old.tests, test.name)
+        if match is None:
+            test.message = _with_message("Test added from merged output.", test.message)
+            old.tests.append(test)
+        elif test.status == "SKIP":
+            match.message = _skip_message(match, test)
+        else:
+            test.message = _merge_message(test, match)
+            old.tests[old.tests.index(match)] = test
+    _reset_timing(old)
+    old.statistics = _suite_statistics(old.tests)
+    old.status = _status_from_tests(_all_tests(old))
+
+
+def _reset_timing(suite: Suite) -> None:
+    """Timing of a merged suite: earliest child start, summed elapsed time (as Robot)."""
+    children = (
+        [kw for kw in (suite.setup, suite.teardown) if kw is not None]
+        + suite.suites
+        + suite.tests
+    )
+    starts = [c.start_time for c in children if c.start_time is not None]
+    suite.start_time = min(starts) if starts else None
+    suite.end_time = None
+    suite.duration = sum(c.duration for c in children)
+
+
+def _with_message(prefix: str, message: str) -> str:
+    return f"{prefix}{_HR}{message}" if message else prefix
+
+
+def _status_and_message(state: str, status: str, message: str) -> str:
+    text = f"{state} status: {status}"
+    if message:
+        text += f"\n{state} message: {message}"
+    return text
+
+
+def _merge_message(new, old) -> str:
+    if old.message.startswith(_MERGE_HEADER):
+        # Old result was itself merged: its "New" part becomes the "Old" part
+        previous = old.message.split(_HR, 2)[1]
+        previous = previous.replace("New status:", "Old status:", 1).replace(
+            "\nNew message:", "\nOld message:", 1
+        )
+    else:
+        previous = _status_and_message("Old", old.status, old.message)
+    return _HR.join(
+        [
+            _MERGE_HEADER,
+            _status_and_message("New", new.status, new.message),
+            previous,
+        ]
+    )
+
+
+def _skip_message(old, new) -> str:
+    message = (
+        f"{_MERGE_HEADER} Latter result had SKIP status and was ignored. "
+        f"Message:\n{new.message}"
+    )
+    if old.message:
+        message += f"{_HR}Original message:\n{old.message}"
+    return message
+
+
+def _renumber(suite: Suite, suite_id: str, parent_full_name: str) -> None:
+    """Assign Robot's positional IDs and full names below a combined/merged root."""
+    _rekey(suite.setup, f"kw-suite-{suite.id}-", f"kw-suite-{suite_id}-")
+    _rekey(suite.teardown, f"kw-suite-{suite.id}-", f"kw-suite-{suite_id}-")
+    suite.id = suite_id
+    suite.full_name = (
+        f"{parent_full_name}.{suite.name}" if parent_full_name else suite.name
+    )
+    for index, test in enumerate(suite.tests, start=1):
+        test_id = f"{suite_id}-t{index}"
+        for kw in [*test.keywords, test.setup, test.teardown]:
+            _rekey(kw, f"kw-{test.id}-", f"kw-{test_id}-")
+        test.id = test_id
+        test.full_name = f"{suite.full_name}.{test.name}"
+    for index, child in enumerate(suite.suites, start=1):
+        _renumber(child, f"{suite_id}-s{index}", suite.full_name)
+
+
+def _rekey(kw: Keyword | None, old_prefix: str, new_prefix: str) -> None:
+    if kw is None or old_prefix == new_prefix:
+        return
+    if kw.id.startswith(old_prefix):
+        kw.id = new_prefix + kw.id[len(old_prefix) :]
+    for child in kw.keywords:
+        _rekey(child, old_prefix, new_prefix)
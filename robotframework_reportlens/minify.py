@@ -0,0 +1,225 @@
+"""
+Whitespace and comment minification of the report template's CSS and JavaScript
+(--minify). Both are small hand-written tokenizers that copy string, template and
+regular-expression literals verbatim, so the rendered markup is byte-identical to the
+unminified report. JavaScript keeps one statement line per source line (no reliance on
+automatic semicolon insertion being preserved across joined lines); only indentation,
+comments, blank lines and spaces next to punctuation are dropped.
+"""
+
+import re
+
+# A "/" starts a regular expression (not a division) after these characters ...
+_REGEX_AFTER_CHARS = frozenset("(,=:[!&|?{};+-*%<>~^")
+# ... and after these keywords
+_REGEX_AFTER_WORDS = frozenset(
+    (
+        "return",
+        "typeof",
+        "instanceof",
+        "case",
+        "do",
+        "else",
+        "in",
+        "of",
+        "new",
+        "delete",
+        "void",
+        "throw",
+        "yield",
+        "await",
+    )
+)
+_WORD_TAIL = re.compile(r"[\w$]+$")
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch in "_$" or ord(ch) > 127
+
+
+def _keep_space(prev: str, nxt: str) -> bool:
+    """Whether the space between *prev* and *nxt* is needed."""
+    if _is_word(prev) and _is_word(nxt):
+        return True
+    # a + +b, a - --b; keep spaces near "/" so no comment or regex is formed
+    return (prev in "+-" and nxt in "+-") or prev == "/" or nxt == "/"
+
+
+def _skip_string(text: str, i: int) -> int:
+    """Index after the quoted string starting at *i*."""
+    quote = text[i]
+    i += 1
+    while i < len(text) and text[i] != quote:
+        i += 2 if text[i] == "\\" else 1
+    return i + 1
+
+
+def _skip_regex(text: str, i: int) -> int:
+    """Index after the regular expression literal (and its flags) starting at *i*."""
+    i += 1
+    in_class = False
+    while i < len(text):
+        ch = text[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "[":
+            in_class = True
+        elif ch == "]":
+            in_class = False
+        elif ch == "/" and not in_class:
+            break
+        i += 1
+    i += 1
+    while i < len(text) and _is_word(text[i]):
+        i += 1
+    return i
+
+
+def _regex_allowed(out: list[str]) -> bool:
+    code = "".join(out[-3:]).rstrip()
+    if not code:
+        return True
+    if code[-1] in _REGEX_AFTER_CHARS:
+        return True
+    word = _WORD_TAIL.search(code)
+    return bool(word) and word.group() in _REGEX_AFTER_WORDS
+
+
+def minify_javascript(js: str) -> str:
+    """*js* without comments, indentation, blank lines and optional spaces."""
+    out: list[str] = []
+    # One entry per open template literal: brace depth of its current ${ } expression
+    templates: list[int] = []
+    pending_space = False
+    i = 0
+    n = len(js)
+
+    def emit(token: str) -> None:
+        nonlocal pending_space
+        if (
+            pending_space
+            and out
+            and out[-1][-1] != "\n"
+            and _keep_space(out[-1][-1], token[0])
+        ):
+            out.append(" ")
+        pending_space = False
+        out.append(token)
+
+    def newline() -> None:
+        nonlocal pending_space
+        pending_space = False
+        if out and out[-1][-1] != "\n":
+            out.append("\n")
+
+    def template_text(i: int) -> int:
+        """Copy template literal text from *i* up to its end or next ${; return index."""
+        start = i
+        while i < n:
+            ch = js[i]
+            if ch == "\\":
+                i += 2
+            elif ch == "`":
+                out.append(js[start : i + 1])
+                templates.pop()
+                return i + 1
+            elif js.startswith("${", i):
+                out.append(js[start : i + 2])
+                templates[-1] = 0
+                return i + 2
+            else:
+                i += 1
+        if start < n:
+            out.append(js[start:])
+        return n
+
+    while i < n:
+        ch = js[i]
+        if ch == "\n":
+            newline()
+            i += 1
+        elif ch in " \t\r":
+            pending_space = True
+            i += 1
+        elif js.startswith("//", i):
+            end = js.find("\n", i)
+            i = n if end == -1 else end
+        elif js.startswith("/*", i):
+            end = js.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+            pending_space = True
+        elif ch in "'\"":
+            end = _skip_string(js, i)
+            emit(js[i:end])
+            i = end
+        elif ch == "`":
+            emit("`")
+            templates.append(-1)
+            i = template_text(i + 1)
+        elif ch == "/" and _regex_allowed(out):
+            end = _skip_regex(js, i)
+            emit(js[i:end])
+            i = end
+        elif templates and templates[-1] >= 0 and ch in "{}":
+            if ch == "{":
+                templates[-1] += 1
+                emit(ch)
+            elif templates[-1] == 0:
+                # End of a ${ } expression: back to the template text
+                emit("}")
+                templates[-1] = -1
+                i = template_text(i + 1)
+                continue
+            else:
+                templates[-1] -= 1
+                emit(ch)
+            i += 1
+        else:
+            start = i
+            if _is_word(ch):
+                while i < n and _is_word(js[i]):
+                    i += 1
+            else:
+                i += 1
+            emit(js[start:i])
+    return "".join(out).strip()
+
+
+def minify_css(css: str) -> str:
+    """*css* without comments and optional whitespace."""
+    out: list[str] = []
+    pending_space = False
+    i = 0
+    n = len(css)
+    while i < n:
+        ch = css[i]
+        if ch.isspace():
+            pending_space = True
+            i += 1
+        elif css.startswith("/*", i):
+            end = css.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+            pending_space = True
+        else:
+            if ch in "'\"":
+                end = _skip_string(css, i)
+                token = css[i:end]
+                i = end
+            else:
+                token = ch
+                i += 1
+            if ch == "}" and out and out[-1] == ";":
+                out.pop()
+            # No space is needed around block/declaration punctuation; a space before
+            # ":" is kept (".a :hover" is a descendant selector)
+            if (
+                pending_space
+                and out
+                and out[-1][-1] not in "{};,>:"
+                and token[0] not in "{};,>"
+            ):
+                out.append(" ")
+            pending_space = False
+            out.append(token)
+    return "".join(out)
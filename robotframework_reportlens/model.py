@@ -1,24 +1,30 @@
 """
 Internal report model. Pure data structures for Robot Framework execution results.
 No HTML or UI logic. IDs are deterministic and stable (from Robot output.xml).
+Timestamps are integer microseconds since the Unix epoch (None when missing); they are
+formatted as ISO 8601 only when serialized (see timestamps.Timestamps).
+
+Classes are slotted to keep large runs compact: a keyword or log message carries no
+per-instance __dict__, keyword collections are tuples (empty ones share the () singleton)
+and the builder interns repeated short strings (status, type, level, badge, tags).
 """
 
 from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class LogMessage:
     """A single log message (e.g. from a keyword or return)."""
 
-    timestamp: str
+    timestamp: int | None
     level: str
     message: str
     is_return: bool = False
     html: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Keyword:
     """An executed keyword (setup, teardown, or test step)."""
 
@@ -27,21 +33,21 @@ class Keyword:
     type: str  # SETUP, TEARDOWN, KEYWORD
     status: str
     duration: int  # milliseconds
-    start_time: str
-    end_time: str = ""
-    arguments: list[str] = field(default_factory=list)
+    start_time: int | None
+    end_time: int | None = None
+    arguments: tuple[str, ...] = ()
     documentation: str = ""
-    messages: list[LogMessage] = field(default_factory=list)
-    keywords: list["Keyword"] = field(default_factory=list)
+    messages: tuple[LogMessage, ...] = ()
+    keywords: tuple["Keyword", ...] = ()
     fail_message: str = ""
     returned: bool = False
-    return_values: list[str] = field(default_factory=list)
+    return_values: tuple[str, ...] = ()
     badge: str | None = (
         None  # Reserved control word shown as badge: FOR, IF, ELSE IF, ELSE, TRY, EXCEPT, FINALLY, WHILE
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Test:
     """A single test case."""
 
@@ -52,15 +58,15 @@ class Test:
     tags: list[str]
     duration: int  # milliseconds
     message: str
-    start_time: str
-    end_time: str = ""
+    start_time: int | None
+    end_time: int | None = None
     documentation: str = ""
     keywords: list[Keyword] = field(default_factory=list)
     setup: "Keyword | None" = None
     teardown: "Keyword | None" = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Suite:
     """A test suite (root or nested)."""
 
@@ -68,8 +74,8 @@ class Suite:
     name: str
     full_name: str
     status: str
-    start_time: str
-    end_time: str = ""
+    start_time: int | None
+    end_time: int | None = None
     duration: int = 0  # milliseconds
     source: str = ""
     tests: list[Test] = field(default_factory=list)
@@ -79,15 +85,22 @@ class Suite:
     teardown: "Keyword | None" = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportModel:
     """Root model for a Robot Framework execution result."""
 
-    generated: str
+    generated: int | None
     generator: str
-    start_time: str
-    end_time: str
+    start_time: int | None
+    end_time: int | None
     duration: int  # milliseconds
     statistics: dict[str, Any]  # total, passed, failed, skipped, passRate
-    errors: list[dict[str, Any]]  # time, level, text
+    errors: list[dict[str, Any]]  # time (epoch microseconds), level, text
     root_suite: Suite
+    utc_offset: int = (
+        0  # seconds; naive Robot timestamps were local time at this offset
+    )
+    # Log messages below the build's min level that were skipped while parsing, by level
+    dropped_messages: dict[str, int] = field(default_factory=dict)
+    # Robot's name for the root suite; root_suite.name is the project (directory) name
+    root_name: str = ""
@@ -1,13 +1,23 @@
 """
 Serialize ReportModel to the template payload (dict).
 No HTML. Produces the exact structure the report template expects.
+write_payload_json streams the same payload as JSON text without building it in memory.
 """
 
+import base64
+import gzip
+import io
+import json
 import re
+from collections.abc import Callable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
+from .dedup import BLOCKS_NAME, BlockStore
 from .model import Keyword, LogMessage, ReportModel, Suite, Test
+from .timestamps import Timestamps
+
+SEARCH_INDEX_NAME = "search.json"
 
 
 # Helper: decide whether to include a value in output
@@ -35,31 +45,44 @@ def _error_file_path(text: str) -> str | None:
     return m.group(1).strip() if m else None
 
 
-def _assign_errors_to_suites_and_tests(suite: dict, errors: list[dict]) -> None:
-    """Assign root-level errors to suites by source file. Mutates suite dict."""
-    errors_with_path = []
+def _errors_by_path(errors: list[dict]) -> dict[str, list[dict]]:
+    """Index errors that name a file by its resolved path (each path resolved once)."""
+    resolved: dict[str, str] = {}
+    index: dict[str, list[dict]] = {}
     for e in errors:
-        err = {
-            "time": e.get("time", ""),
-            "level": (e.get("level") or "WARN").upper(),
-            "text": e.get("text", ""),
-        }
         path = _error_file_path(e.get("text", ""))
-        if path:
-            errors_with_path.append((path, err))
+        if not path:
+            continue
+        if path not in resolved:
+            try:
+                resolved[path] = str(Path(path).resolve())
+            except Exception:
+                resolved[path] = path
+        index.setdefault(resolved[path], []).append(
+            {
+                "time": e.get("time", ""),
+                "level": (e.get("level") or "WARN").upper(),
+                "text": e.get("text", ""),
+            }
+        )
+    return index
+
+
+def _suite_errors(source: str | None, index: dict[str, list[dict]]) -> list[dict]:
+    """Errors from *index* (see _errors_by_path) that belong to the suite *source*."""
+    source = (source or "").strip()
+    # No errors name a file: skip resolving suite sources altogether
+    if not source or not index:
+        return []
+    return list(index.get(str(Path(source).resolve()), ()))
+
+
+def _assign_errors_to_suites_and_tests(suite: dict, errors: list[dict]) -> None:
+    """Assign root-level errors to suites by source file. Mutates suite dict."""
+    index = _errors_by_path(errors)
 
     def walk(s: dict) -> None:
-        source = (s.get("source") or "").strip()
-        source_norm = str(Path(source).resolve()) if source else None
-        suite_errors = []
-        if source_norm:
-            for path, err in errors_with_path:
-                try:
-                    path_norm = str(Path(path).resolve())
-                except Exception:
-                    path_norm = path
-                if path_norm == source_norm:
-                    suite_errors.append(err)
+        suite_errors = _suite_errors(s.get("source"), index)
         s["errors"] = suite_errors
         for t in s.get("tests", []):
             t["suiteErrors"] = suite_errors
@@ -69,10 +92,15 @@ def _assign_errors_to_suites_and_tests(suite: dict, errors: list[dict]) -> None:
     walk(suite)
 
 
-def _log_message_to_dict(msg: LogMessage, msg_id: str) -> dict:
+def _errors_to_dicts(errors: list[dict], stamps: Timestamps) -> list[dict]:
+    """Model errors with their epoch ``time`` formatted as ISO 8601."""
+    return [{**e, "time": stamps.iso(e.get("time"))} for e in errors]
+
+
+def _log_message_to_dict(msg: LogMessage, msg_id: str, stamps: Timestamps) -> dict:
     out: dict = {"id": msg_id}
-    if _include_value(msg.timestamp):
-        out["timestamp"] = msg.timestamp
+    if msg.timestamp is not None:
+        out["timestamp"] = stamps.iso(msg.timestamp)
     if _include_value(msg.level):
         out["level"] = msg.level
     if _include_value(msg.message):
@@ -85,11 +113,12 @@ def _log_message_to_dict(msg: LogMessage, msg_id: str) -> dict:
     return out
 
 
-def _keyword_to_dict(kw: Keyword) -> dict:
+def _keyword_to_dict(kw: Keyword, stamps: Timestamps) -> dict:
     messages = [
-        _log_message_to_dict(m, f"{kw.id}-msg-{i}") for i, m in enumerate(kw.messages)
+        _log_message_to_dict(m, f"{kw.id}-msg-{i}", stamps)
+        for i, m in enumerate(kw.messages)
     ]
-    children = [_keyword_to_dict(c) for c in kw.keywords]
+    children = [_keyword_to_dict(c, stamps) for c in kw.keywords]
     out: dict = {"id": kw.id}
     if _include_value(kw.name):
         out["name"] = kw.name
@@ -99,13 +128,11 @@ def _keyword_to_dict(kw: Keyword) -> dict:
         out["status"] = kw.status
     if _include_value(kw.duration):
         out["duration"] = kw.duration
-    if _include_value(kw.start_time):
-        out["startTime"] = kw.start_time
+    if kw.start_time is not None:
+        out["startTime"] = stamps.iso(kw.start_time)
     # endTime: only include if present and different from start_time
-    if _include_value(getattr(kw, "end_time", None)):
-        endt = getattr(kw, "end_time")
-        if endt and endt != kw.start_time:
-            out["endTime"] = endt
+    if kw.end_time is not None and kw.end_time != kw.start_time:
+        out["endTime"] = stamps.iso(kw.end_time)
     if _include_value(kw.arguments):
         out["arguments"] = kw.arguments
     if _include_value(kw.documentation):
@@ -125,8 +152,22 @@ def _keyword_to_dict(kw: Keyword) -> dict:
     return out
 
 
-def _keyword_to_dict_without_messages(kw: Keyword) -> dict:
-    children = [_keyword_to_dict_without_messages(c) for c in kw.keywords]
+def _keyword_to_dict_without_messages(
+    kw: Keyword, stamps: Timestamps, log_map: dict[str, list[dict]] | None = None
+) -> dict:
+    """
+    Keyword dict without messages. When *log_map* is given, the messages of the keyword
+    and its children are collected into it in the same pass (see
+    _collect_keyword_messages).
+    """
+    if log_map is not None and kw.messages:
+        log_map[kw.id] = [
+            _log_message_to_dict(m, f"{kw.id}-msg-{i}", stamps)
+            for i, m in enumerate(kw.messages)
+        ]
+    children = [
+        _keyword_to_dict_without_messages(c, stamps, log_map) for c in kw.keywords
+    ]
     out: dict = {"id": kw.id}
     if _include_value(kw.name):
         out["name"] = kw.name
@@ -136,12 +177,10 @@ def _keyword_to_dict_without_messages(kw: Keyword) -> dict:
         out["status"] = kw.status
     if _include_value(kw.duration):
         out["duration"] = kw.duration
-    if _include_value(kw.start_time):
-        out["startTime"] = kw.start_time
-    if _include_value(getattr(kw, "end_time", None)):
-        endt = getattr(kw, "end_time")
-        if endt and endt != kw.start_time:
-            out["endTime"] = endt
+    if kw.start_time is not None:
+        out["startTime"] = stamps.iso(kw.start_time)
+    if kw.end_time is not None and kw.end_time != kw.start_time:
+        out["endTime"] = stamps.iso(kw.end_time)
     if _include_value(kw.arguments):
         out["arguments"] = kw.arguments
     if _include_value(kw.documentation):
@@ -159,17 +198,19 @@ def _keyword_to_dict_without_messages(kw: Keyword) -> dict:
     return out
 
 
-def _collect_keyword_messages(kw: Keyword, out: dict[str, list[dict]]) -> None:
+def _collect_keyword_messages(
+    kw: Keyword, out: dict[str, list[dict]], stamps: Timestamps
+) -> None:
     if kw.messages:
         out[kw.id] = [
-            _log_message_to_dict(m, f"{kw.id}-msg-{i}")
+            _log_message_to_dict(m, f"{kw.id}-msg-{i}", stamps)
             for i, m in enumerate(kw.messages)
         ]
     for child in kw.keywords:
-        _collect_keyword_messages(child, out)
+        _collect_keyword_messages(child, out, stamps)
 
 
-def _test_to_dict(t: Test) -> dict:
+def _test_to_dict(t: Test, stamps: Timestamps) -> dict:
     out: dict = {"id": t.id}
     if _include_value(t.name):
         out["name"] = t.name
@@ -183,29 +224,33 @@ def _test_to_dict(t: Test) -> dict:
         out["duration"] = t.duration
     if _include_value(t.message):
         out["message"] = t.message
-    if _include_value(t.start_time):
-        out["startTime"] = t.start_time
-    if _include_value(getattr(t, "end_time", None)):
-        endt = getattr(t, "end_time")
-        if endt and endt != t.start_time:
-            out["endTime"] = endt
-    kws = [_keyword_to_dict(k) for k in t.keywords]
+    if t.start_time is not None:
+        out["startTime"] = stamps.iso(t.start_time)
+    if t.end_time is not None and t.end_time != t.start_time:
+        out["endTime"] = stamps.iso(t.end_time)
+    kws = [_keyword_to_dict(k, stamps) for k in t.keywords]
     if _include_value(kws):
         out["keywords"] = kws
     if _include_value(t.documentation):
         out["documentation"] = t.documentation
     if t.setup:
-        out_setup = _keyword_to_dict(t.setup)
+        out_setup = _keyword_to_dict(t.setup, stamps)
         if _include_value(out_setup):
             out["setup"] = out_setup
     if t.teardown:
-        out_teardown = _keyword_to_dict(t.teardown)
+        out_teardown = _keyword_to_dict(t.teardown, stamps)
         if _include_value(out_teardown):
             out["teardown"] = out_teardown
     return out
 
 
-def _test_to_dict_without_messages(t: Test) -> dict:
+def _test_to_dict_without_messages(
+    t: Test, stamps: Timestamps, log_map: dict[str, list[dict]] | None = None
+) -> dict:
+    """
+    Test dict without messages. When *log_map* is given, the messages of the test's
+    keywords (not setup/teardown) are collected into it in the same pass.
+    """
     out: dict = {"id": t.id}
     if _include_value(t.name):
         out["name"] = t.name
@@ -219,29 +264,28 @@ def _test_to_dict_without_messages(t: Test) -> dict:
         out["duration"] = t.duration
     if _include_value(t.message):
         out["message"] = t.message
-    if _include_value(t.start_time):
-        out["startTime"] = t.start_time
-    if _include_value(getattr(t, "end_time", None)):
-        endt = getattr(t, "end_time")
-        if endt and endt != t.start_time:
-            out["endTime"] = endt
-    kws = [_keyword_to_dict_without_messages(k) for k in t.keywords]
+    if t.start_time is not None:
+        out["startTime"] = stamps.iso(t.start_time)
+    if t.end_time is not None and t.end_time != t.start_time:
+        out["endTime"] = stamps.iso(t.end_time)
+    kws = [_keyword_to_dict_without_messages(k, stamps, log_map) for k in t.keywords]
     if _include_value(kws):
         out["keywords"] = kws
     if _include_value(t.documentation):
         out["documentation"] = t.documentation
     if t.setup:
-        out_setup = _keyword_to_dict_without_messages(t.setup)
+        out_setup = _keyword_to_dict_without_messages(t.setup, stamps)
         if _include_value(out_setup):
             out["setup"] = out_setup
     if t.teardown:
-        out_teardown = _keyword_to_dict_without_messages(t.teardown)
+        out_teardown = _keyword_to_dict_without_messages(t.teardown, stamps)
         if _include_value(out_teardown):
             out["teardown"] = out_teardown
     return out
 
 
-def _suite_to_dict(s: Suite) -> dict:
+def _suite_head(s: Suite, stamps: Timestamps) -> dict:
+    """Suite fields that come before its tests and child suites."""
     out: dict = {"id": s.id}
     if _include_value(s.name):
         out["name"] = s.name
@@ -249,52 +293,550 @@ def _suite_to_dict(s: Suite) -> dict:
         out["fullName"] = s.full_name
     if _include_value(s.status):
         out["status"] = s.status
-    if _include_value(s.start_time):
-        out["startTime"] = s.start_time
-    if _include_value(getattr(s, "end_time", None)):
-        endt = getattr(s, "end_time")
-        if endt and endt != s.start_time:
-            out["endTime"] = endt
+    if s.start_time is not None:
+        out["startTime"] = stamps.iso(s.start_time)
+    if s.end_time is not None and s.end_time != s.start_time:
+        out["endTime"] = stamps.iso(s.end_time)
     if _include_value(s.duration):
         out["duration"] = s.duration
     if _include_value(s.statistics):
         out["statistics"] = s.statistics
-    tests = [_test_to_dict(t) for t in s.tests]
-    if _include_value(tests):
-        out["tests"] = tests
-    suites = [_suite_to_dict(c) for c in s.suites]
-    if _include_value(suites):
-        out["suites"] = suites
+    return out
+
+
+def _suite_tail(s: Suite, stamps: Timestamps) -> dict:
+    """Suite fields that come after its tests and child suites."""
+    out: dict = {}
     if _include_value(s.source):
         out["source"] = s.source
     if s.setup:
-        out_setup = _keyword_to_dict(s.setup)
+        out_setup = _keyword_to_dict(s.setup, stamps)
         if _include_value(out_setup):
             out["setup"] = out_setup
     if s.teardown:
-        out_teardown = _keyword_to_dict(s.teardown)
+        out_teardown = _keyword_to_dict(s.teardown, stamps)
         if _include_value(out_teardown):
             out["teardown"] = out_teardown
     return out
 
 
-def model_to_payload(model: ReportModel) -> dict[str, Any]:
-    """
-    Convert ReportModel to the template payload (dict).
-    Assigns errors to suites. Returns the exact structure expected by the report template.
-    """
-    root_suite = _suite_to_dict(model.root_suite)
-    _assign_errors_to_suites_and_tests(root_suite, model.errors)
+def _suite_to_dict(s: Suite, stamps: Timestamps) -> dict:
+    out = _suite_head(s, stamps)
+    tests = [_test_to_dict(t, stamps) for t in s.tests]
+    if _include_value(tests):
+        out["tests"] = tests
+    suites = [_suite_to_dict(c, stamps) for c in s.suites]
+    if _include_value(suites):
+        out["suites"] = suites
+    out.update(_suite_tail(s, stamps))
+    return out
+
+
+def _payload_head(
+    model: ReportModel, stamps: Timestamps, errors: list[dict]
+) -> dict[str, Any]:
+    """Top-level payload fields (everything but rootSuite)."""
     return {
-        "generated": model.generated,
+        "generated": stamps.iso(model.generated),
         "generator": model.generator,
         # Only include top-level values when present
-        **({"startTime": model.start_time} if _include_value(model.start_time) else {}),
-        **({"endTime": model.end_time} if _include_value(model.end_time) else {}),
+        **(
+            {"startTime": stamps.iso(model.start_time)}
+            if model.start_time is not None
+            else {}
+        ),
+        **(
+            {"endTime": stamps.iso(model.end_time)}
+            if model.end_time is not None
+            else {}
+        ),
         **({"duration": model.duration} if _include_value(model.duration) else {}),
         **(
             {"statistics": model.statistics} if _include_value(model.statistics) else {}
         ),
-        **({"errors": model.errors} if _include_value(model.errors) else {}),
-        "rootSuite": root_suite,
+        **({"errors": errors} if _include_value(errors) else {}),
+    }
+
+
+class StringTable:
+    """
+    Strings of a schemaVersion 2 payload: keyword and message strings are replaced by
+    their index in the table, which is shipped as the payload's "strings" list.
+    """
+
+    def __init__(self):
+        self.strings: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def ref(self, value: str) -> int:
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+_KEYWORD_STRING_FIELDS = (
+    "name",
+    "type",
+    "status",
+    "documentation",
+    "failMessage",
+    "badge",
+)
+_KEYWORD_LIST_FIELDS = ("arguments", "returnValues")
+_MESSAGE_STRING_FIELDS = ("level", "message")
+
+
+def _table_messages(messages: list[dict], table: StringTable) -> None:
+    for msg in messages:
+        for key in _MESSAGE_STRING_FIELDS:
+            if key in msg:
+                msg[key] = table.ref(msg[key])
+
+
+def _table_keyword_fields(kw: dict, table: StringTable) -> None:
+    for key in _KEYWORD_STRING_FIELDS:
+        if key in kw:
+            kw[key] = table.ref(kw[key])
+    for key in _KEYWORD_LIST_FIELDS:
+        if key in kw:
+            kw[key] = [table.ref(v) for v in kw[key]]
+
+
+def _table_keyword(kw: dict | None, table: StringTable) -> None:
+    """Replace the strings of a keyword dict (and its subtree) by table indices."""
+    if not kw:
+        return
+    _table_keyword_fields(kw, table)
+    _table_messages(kw.get("messages", ()), table)
+    for child in kw.get("keywords", ()):
+        _table_keyword(child, table)
+
+
+def _table_test(test: dict, table: StringTable) -> None:
+    for kw in test.get("keywords", ()):
+        _table_keyword(kw, table)
+    _table_keyword(test.get("setup"), table)
+    _table_keyword(test.get("teardown"), table)
+
+
+def _table_suite(suite: dict, table: StringTable) -> None:
+    # Same order as write_payload_json: tests, child suites, then setup/teardown
+    for test in suite.get("tests", ()):
+        _table_test(test, table)
+    for child in suite.get("suites", ()):
+        _table_suite(child, table)
+    _table_keyword(suite.get("setup"), table)
+    _table_keyword(suite.get("teardown"), table)
+
+
+def model_to_payload(model: ReportModel, string_table: bool = False) -> dict[str, Any]:
+    """
+    Convert ReportModel to the template payload (dict).
+    Assigns errors to suites. Returns the exact structure expected by the report template.
+    string_table=True produces the schemaVersion 2 payload: keyword and message strings
+    are indices into its "strings" list.
+    """
+    stamps = Timestamps(model.utc_offset)
+    errors = _errors_to_dicts(model.errors, stamps)
+    root_suite = _suite_to_dict(model.root_suite, stamps)
+    _assign_errors_to_suites_and_tests(root_suite, errors)
+    payload = {**_payload_head(model, stamps, errors), "rootSuite": root_suite}
+    if string_table:
+        table = StringTable()
+        _table_suite(root_suite, table)
+        payload = {"schemaVersion": 2, **payload, "strings": table.strings}
+    return payload
+
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def _script_safe(text: str) -> str:
+    """Escape "</script>" so JSON text can be embedded in an HTML <script> element."""
+    return text.replace("</script>", "<\\/script>").replace("</SCRIPT>", "<\\/SCRIPT>")
+
+
+def write_payload_json(
+    model: ReportModel,
+    fh: TextIO,
+    script_safe: bool = False,
+    string_table: bool = False,
+) -> None:
+    """
+    Write model_to_payload(model, string_table) as JSON text (the same text as
+    json.dumps with ensure_ascii=False) to *fh*, one test at a time: neither the payload
+    dict nor the JSON string of the whole run is built. script_safe=True escapes
+    "</script>" for embedding in an HTML page.
+    """
+    stamps = Timestamps(model.utc_offset)
+    errors = _errors_to_dicts(model.errors, stamps)
+    index = _errors_by_path(errors)
+    table = StringTable() if string_table else None
+    encode = _ENCODER.encode
+    if script_safe:
+
+        def encode(value: Any) -> str:
+            return _script_safe(_ENCODER.encode(value))
+
+    write = fh.write
+    head = _payload_head(model, stamps, errors)
+    if table is not None:
+        head = {"schemaVersion": 2, **head}
+    # Objects are written as their encoded fields with the closing/opening brace cut off;
+    # every chunk is complete JSON tokens, so "</script>" never spans two chunks
+    write(encode(head)[:-1])
+    write(', "rootSuite": ')
+    _write_suite_json(model.root_suite, stamps, index, table, encode, write)
+    if table is not None:
+        # The table is complete only once every test has been written
+        write(', "strings": ' + encode(table.strings))
+    write("}")
+
+
+class _Base64Sink(io.RawIOBase):
+    """Binary stream writing the base64 text of everything written to it to *fh*."""
+
+    def __init__(self, fh: TextIO):
+        super().__init__()
+        self._fh = fh
+        self._pending = b""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        data = self._pending + bytes(b)
+        # Encode whole 3-byte groups only, so the pieces join into one base64 text
+        cut = len(data) - len(data) % 3
+        self._fh.write(base64.b64encode(data[:cut]).decode("ascii"))
+        self._pending = data[cut:]
+        return len(b)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._fh.write(base64.b64encode(self._pending).decode("ascii"))
+        super().close()
+
+
+def write_payload_gzip_base64(
+    model: ReportModel,
+    fh: TextIO,
+    level: int = 9,
+    string_table: bool = False,
+) -> None:
+    """
+    Write the payload of write_payload_json() gzip-compressed (mtime 0, so the output is
+    deterministic) and base64-encoded to *fh*, streaming like write_payload_json(). The
+    text contains no "<", so it is safe to embed in an HTML page as is.
+    """
+    sink = _Base64Sink(fh)
+    with gzip.GzipFile(fileobj=sink, mode="wb", compresslevel=level, mtime=0) as gz:
+        text = io.TextIOWrapper(gz, encoding="utf-8", newline="")
+        write_payload_json(model, text, string_table=string_table)
+        text.flush()
+        text.detach()
+    sink.close()
+
+
+def _write_suite_json(
+    s: Suite,
+    stamps: Timestamps,
+    index: dict[str, list[dict]],
+    table: StringTable | None,
+    encode: Callable[[Any], str],
+    write: Callable[[str], Any],
+) -> None:
+    suite_errors = _suite_errors(s.source, index)
+    write(encode(_suite_head(s, stamps))[:-1])
+    if s.tests:
+        write(', "tests": [')
+        for i, t in enumerate(s.tests):
+            test = _test_to_dict(t, stamps)
+            if table is not None:
+                _table_test(test, table)
+            test["suiteErrors"] = suite_errors
+            write(", " + encode(test) if i else encode(test))
+        write("]")
+    if s.suites:
+        write(', "suites": [')
+        for i, child in enumerate(s.suites):
+            if i:
+                write(", ")
+            _write_suite_json(child, stamps, index, table, encode, write)
+        write("]")
+    tail = _suite_tail(s, stamps)
+    if table is not None:
+        _table_keyword(tail.get("setup"), table)
+        _table_keyword(tail.get("teardown"), table)
+    tail["errors"] = suite_errors
+    write(", " + encode(tail)[1:])
+
+
+_TEST_STUB_FIELDS = (
+    "id",
+    "name",
+    "fullName",
+    "status",
+    "duration",
+    "startTime",
+    "message",
+    "tags",
+)
+_SUITE_INDEX_FIELDS = (
+    "id",
+    "name",
+    "fullName",
+    "status",
+    "startTime",
+    "duration",
+    "statistics",
+    "childSuiteIds",
+    "testIds",
+)
+
+
+def _columns(rows: list[dict], fields: tuple[str, ...]) -> dict:
+    """
+    Columnar form of *rows*: {"count", "statuses", "columns"} with one array per field
+    and "status" as indices into "statuses". A column of dicts sharing the same keys
+    (statistics) becomes a dict of arrays.
+    """
+    statuses = StringTable()
+    columns: dict[str, Any] = {}
+    for field in fields:
+        values = [row[field] for row in rows]
+        if field == "status":
+            values = [statuses.ref(v) for v in values]
+        elif values and all(isinstance(v, dict) for v in values):
+            keys = list(values[0])
+            if all(list(v) == keys for v in values):
+                values = {k: [v[k] for v in values] for k in keys}
+        columns[field] = values
+    return {"count": len(rows), "statuses": statuses.strings, "columns": columns}
+
+
+def _sequential_ids(ids: list[str], prefix: str) -> bool:
+    return all(i == f"{prefix}{n}" for n, i in enumerate(ids, start=1))
+
+
+def _test_stub_columns(suite: Suite, tests_stub: list[dict]) -> dict:
+    """Columnar test stubs of a suite file; fullName is dropped when it is derivable."""
+    stubs = _columns(tests_stub, _TEST_STUB_FIELDS)
+    if all(t.full_name == f"{suite.full_name}.{t.name}" for t in suite.tests):
+        del stubs["columns"]["fullName"]
+    return stubs
+
+
+def _suite_index_columns(suites_list: list[dict]) -> dict:
+    """
+    Columnar suites.json index. testIds / childSuiteIds that are Robot's positional IDs
+    (<suite id>-t1..n, <suite id>-s1..n) are stored as their count.
+    """
+    index = _columns(suites_list, _SUITE_INDEX_FIELDS)
+    columns = index["columns"]
+    for field, marker in (("testIds", "-t"), ("childSuiteIds", "-s")):
+        columns[field] = [
+            len(ids) if _sequential_ids(ids, f"{suite_id}{marker}") else ids
+            for suite_id, ids in zip(columns["id"], columns[field])
+        ]
+    return index
+
+
+_SEARCH_FIELDS = ("id", "name", "fullName", "status", "duration", "tags")
+
+
+def _search_index(suites: list[Suite], schema: int) -> dict:
+    """
+    search.json: name, status, duration and tags (indices into "tags") of every test as
+    columns, grouped by suite ("suiteIds" / "suiteTestCounts"), so the report can search
+    and filter all tests without loading suite files. Test IDs are dropped when they are
+    all Robot's positional ones (<suite id>-t1..n), full names when all are derivable.
+    """
+    tags = StringTable()
+    rows = [
+        {
+            "id": test.id,
+            "name": test.name,
+            "fullName": test.full_name,
+            "status": test.status,
+            "duration": test.duration,
+            "tags": [tags.ref(tag) for tag in test.tags],
+        }
+        for suite in suites
+        for test in suite.tests
+    ]
+    index = _columns(rows, _SEARCH_FIELDS)
+    columns = index["columns"]
+    if all(_sequential_ids([t.id for t in s.tests], f"{s.id}-t") for s in suites):
+        del columns["id"]
+    if all(t.full_name == f"{s.full_name}.{t.name}" for s in suites for t in s.tests):
+        del columns["fullName"]
+    return {
+        "schemaVersion": schema,
+        "suiteIds": [s.id for s in suites],
+        "suiteTestCounts": [len(s.tests) for s in suites],
+        "tags": tags.strings,
+        **index,
     }
+
+
+def external_data_files(
+    model: ReportModel,
+    string_table: bool = False,
+    columnar: bool = False,
+    blocks: BlockStore | None = None,
+) -> Iterator[tuple[str, dict]]:
+    """
+    Yield the external-data files of *model* as (file name, JSON data) in one pass over
+    the model: summary.json, then per suite suite_<id>.json and per test
+    test_<id>.json / test_<id>_logs.json, and finally the search.json test index and the
+    suites.json index collected along the way. Message dicts are only built for the
+    logs files.
+    string_table=True yields schemaVersion 2 files: suite, test and logs files carry
+    their own "strings" table for their keywords and messages.
+    columnar=True stores the test stubs of suite files ("testColumns") and the
+    suites.json index ("suiteColumns") as parallel arrays per field instead of a list
+    of objects. With *blocks* (a BlockStore of *model*), keyword subtrees and message
+    blocks repeated across tests are replaced by references and blocks.json, holding
+    each of them once, is yielded before suites.json.
+    """
+    schema = 2 if string_table else 1
+    stamps = Timestamps(model.utc_offset)
+    errors = _errors_to_dicts(model.errors, stamps)
+    index = _errors_by_path(errors)
+    head = _payload_head(model, stamps, errors)
+    root = model.root_suite
+    yield (
+        "summary.json",
+        {
+            "schemaVersion": schema,
+            "generated": head["generated"],
+            "generator": head["generator"],
+            "startTime": head.get("startTime", ""),
+            "endTime": head.get("endTime", ""),
+            "duration": head.get("duration", 0),
+            "statistics": head.get("statistics", {}),
+            "errors": head.get("errors", []),
+            "rootSuiteId": root.id,
+            "rootSuiteName": root.name,
+        },
+    )
+
+    suites_list = []
+    # Suites with tests, in file order, for search.json
+    test_suites = []
+    stack = [root]
+    while stack:
+        suite = stack.pop()
+        stack.extend(reversed(suite.suites))
+        suite_errors = _suite_errors(suite.source, index)
+        start_time = stamps.iso(suite.start_time)
+        child_ids = [s.id for s in suite.suites]
+        test_ids = [t.id for t in suite.tests]
+        if suite.tests:
+            test_suites.append(suite)
+        suites_list.append(
+            {
+                "id": suite.id,
+                "name": suite.name,
+                "fullName": suite.full_name,
+                "status": suite.status,
+                "startTime": start_time,
+                "duration": suite.duration,
+                "statistics": suite.statistics,
+                "childSuiteIds": child_ids,
+                "testIds": test_ids,
+            }
+        )
+        tests_stub = [
+            {
+                "id": test.id,
+                "name": test.name,
+                "fullName": test.full_name,
+                "status": test.status,
+                "duration": test.duration,
+                "startTime": stamps.iso(test.start_time),
+                "message": test.message,
+                "tags": test.tags,
+            }
+            for test in suite.tests
+        ]
+        setup = _keyword_to_dict(suite.setup, stamps) if suite.setup else None
+        teardown = _keyword_to_dict(suite.teardown, stamps) if suite.teardown else None
+        suite_file = {
+            "schemaVersion": schema,
+            "suite": {
+                "id": suite.id,
+                "name": suite.name,
+                "fullName": suite.full_name,
+                "status": suite.status,
+                "startTime": start_time,
+                "duration": suite.duration,
+                "statistics": suite.statistics,
+                "setup": setup,
+                "teardown": teardown,
+                "childSuiteIds": child_ids,
+                "testIds": test_ids,
+                "errors": suite_errors,
+            },
+        }
+        if columnar:
+            suite_file["testColumns"] = _test_stub_columns(suite, tests_stub)
+        else:
+            suite_file["tests"] = tests_stub
+        if string_table:
+            table = StringTable()
+            _table_keyword(setup, table)
+            _table_keyword(teardown, table)
+            suite_file["strings"] = table.strings
+        yield f"suite_{suite.id}.json", suite_file
+        for test in suite.tests:
+            log_map: dict[str, list[dict]] = {}
+            test_payload = _test_to_dict_without_messages(test, stamps, log_map)
+            if blocks is not None:
+                blocks.keywords(test, test_payload)
+                blocks.messages(test, log_map)
+            test_payload["suiteErrors"] = suite_errors
+            test_file = {"schemaVersion": schema, "test": test_payload}
+            logs_file = {
+                "schemaVersion": schema,
+                "testId": test.id,
+                "keywordMessages": log_map,
+            }
+            if string_table:
+                table = StringTable()
+                _table_test(test_payload, table)
+                test_file["strings"] = table.strings
+                table = StringTable()
+                for messages in log_map.values():
+                    # Deduplicated blocks ({"ref", "timestamps"}) hold no strings
+                    if isinstance(messages, list):
+                        _table_messages(messages, table)
+                logs_file["strings"] = table.strings
+            yield f"test_{test.id}.json", test_file
+            yield f"test_{test.id}_logs.json", logs_file
+
+    yield SEARCH_INDEX_NAME, _search_index(test_suites, schema)
+    if blocks is not None:
+        blocks_file = {
+            "schemaVersion": schema,
+            "keywordBlocks": blocks.keyword_blocks,
+            "messageBlocks": blocks.message_blocks,
+        }
+        if string_table:
+            table = StringTable()
+            for block in blocks.keyword_blocks.values():
+                _table_keyword_fields(block, table)
+            for messages in blocks.message_blocks.values():
+                _table_messages(messages, table)
+            blocks_file["strings"] = table.strings
+        yield BLOCKS_NAME, blocks_file
+
+    suites_file = {"schemaVersion": schema, "rootSuiteId": root.id}
+    if columnar:
+        suites_file["suiteColumns"] = _suite_index_columns(suites_list)
+    else:
+        suites_file["suites"] = suites_list
+    yield "suites.json", suites_file
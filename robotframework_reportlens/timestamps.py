@@ -0,0 +1,94 @@
+"""
+Timestamp normalization for the report model.
+Robot timestamps (datetime objects, ISO strings or legacy "YYYYMMDD HH:MM:SS.fff") are
+converted once into integer microseconds since the Unix epoch; ISO 8601 strings are only
+produced at serialization time. Naive timestamps are local time of the machine building
+the report (same as the Robot run), resolved once per Timestamps instance.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+# Robot legacy timestamp format: "YYYYMMDD HH:MM:SS.fff" (e.g. "20260201 14:04:20.902")
+_LEGACY_TS = re.compile(
+    r"^(\d{4})(\d{2})(\d{2})\s+(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?$"
+)
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def local_utc_offset() -> int:
+    """UTC offset in seconds of the machine where the report is built."""
+    return int(datetime.now().astimezone().utcoffset().total_seconds())
+
+
+class Timestamps:
+    """
+    Per-build timestamp converter. epoch() turns any Robot timestamp into integer
+    microseconds (legacy strings from the epoch of their day, memoized per day, plus the
+    time of day); iso() formats them back as ISO 8601 with the build's UTC offset, e.g.
+    "2026-02-01T14:04:20.902000+05:30".
+    """
+
+    def __init__(self, utc_offset: int | None = None):
+        self.utc_offset = local_utc_offset() if utc_offset is None else utc_offset
+        self._offset_us = self.utc_offset * 1_000_000
+        self._local_epoch = datetime(
+            1970, 1, 1, tzinfo=timezone(timedelta(seconds=self.utc_offset))
+        )
+        # "YYYYMMDD" -> epoch microseconds of that local midnight (None if invalid)
+        self._days: dict[str, int | None] = {}
+
+    def epoch(self, ts) -> int | None:
+        """Microseconds since the Unix epoch, or None if *ts* is missing or invalid."""
+        if ts is None:
+            return None
+        if isinstance(ts, datetime):
+            return self._datetime_epoch(ts)
+        s = str(ts).strip()
+        if not s:
+            return None
+        return self._parse(s)
+
+    def iso(self, us: int | None) -> str:
+        """ISO 8601 string with the build's UTC offset, or "" for a missing timestamp."""
+        if us is None:
+            return ""
+        return (
+            self._local_epoch + timedelta(microseconds=us + self._offset_us)
+        ).isoformat()
+
+    def _datetime_epoch(self, dt: datetime) -> int:
+        if dt.tzinfo is None:
+            return (dt - _EPOCH) // _MICROSECOND - self._offset_us
+        return (dt - _EPOCH_UTC) // _MICROSECOND
+
+    def _day_epoch(self, day: str) -> int | None:
+        try:
+            return self._days[day]
+        except KeyError:
+            try:
+                midnight = datetime(int(day[:4]), int(day[4:6]), int(day[6:8]))
+                us = self._datetime_epoch(midnight)
+            except ValueError:
+                us = None
+            self._days[day] = us
+            return us
+
+    def _parse(self, s: str) -> int | None:
+        m = _LEGACY_TS.match(s)
+        if m:
+            h, mi, sec = int(m.group(4)), int(m.group(5)), int(m.group(6))
+            day = self._day_epoch(m.group(1) + m.group(2) + m.group(3))
+            if day is None or h > 23 or mi > 59 or sec > 59:
+                return None
+            frac = m.group(7)
+            micro = int(frac.ljust(6, "0")[:6]) if frac else 0
+            return day + ((h * 60 + mi) * 60 + sec) * 1_000_000 + micro
+        try:
+            return self._datetime_epoch(
+                datetime.fromisoformat(s.replace("Z", "+00:00"))
+            )
+        except ValueError:
+            return None
@@ -0,0 +1,82 @@
+// Boots a self-contained report's script against a minimal DOM stand-in and prints the
+// rendered #app markup and any errors as JSON. Used by the boot_report fixture (conftest.py):
+//   node tests/boot_report.js path/to/report.html [--worker]
+// With --worker, Worker runs the report's data worker (a blob: URL script) in a worker thread;
+// otherwise there is no Worker and the report loads its data on the main thread.
+const fs = require("fs");
+
+const html = fs.readFileSync(process.argv[2], "utf8");
+// report-config, report-data and the rl:<file> blocks of --split-payload reports
+const json = {};
+for (const match of html.matchAll(/<script type="application\/json" id="([^"]+)">(.*?)<\/script>/gs)) {
+  json[match[1]] = match[2];
+}
+const script = html.slice(html.lastIndexOf("<script>") + "<script>".length, html.lastIndexOf("</script>"));
+const errors = [];
+
+class Element {
+  constructor() {
+    this.innerHTML = "";
+    this.className = "";
+    this.style = {};
+    this.dataset = {};
+    this.classList = { add() {}, remove() {}, toggle() {}, contains: () => false };
+  }
+  addEventListener() {}
+  removeEventListener() {}
+  appendChild() {}
+  querySelector() { return null; }
+  querySelectorAll() { return []; }
+  getAttribute() { return null; }
+  setAttribute() {}
+}
+
+const app = new Element();
+globalThis.document = {
+  body: new Element(),
+  documentElement: new Element(),
+  getElementById: id => id === "app" ? app : json[id] != null ? { textContent: json[id] } : null,
+  querySelector: () => null,
+  querySelectorAll: () => [],
+  createElement: () => new Element(),
+  addEventListener() {},
+  removeEventListener() {}
+};
+globalThis.window = { location: { protocol: "http:", hash: "", pathname: "/report.html" }, addEventListener() {} };
+globalThis.localStorage = { getItem: () => null, setItem() {} };
+globalThis.requestAnimationFrame = callback => setTimeout(callback, 0);
+process.on("unhandledRejection", err => errors.push(String(err && err.stack || err)));
+const useWorker = process.argv.includes("--worker");
+if (useWorker) {
+  const { Worker: ThreadWorker } = require("worker_threads");
+  const { resolveObjectURL } = require("buffer");
+  const prelude = 'const { parentPort } = require("worker_threads");\n' +
+    "globalThis.postMessage = message => parentPort.postMessage(message);\n" +
+    "parentPort.on(\"message\", data => onmessage({ data }));\n";
+  globalThis.Worker = class {
+    constructor(url) {
+      this.thread = resolveObjectURL(url).text().then(source => {
+        const thread = new ThreadWorker(prelude + source, { eval: true });
+        thread.on("message", data => this.onmessage({ data }));
+        thread.on("error", err => this.onerror(err));
+        return thread;
+      });
+    }
+    postMessage(message) { this.thread.then(thread => thread.postMessage(message)); }
+    terminate() { this.thread.then(thread => thread.terminate()); }
+  };
+}
+
+try {
+  new Function(script)();
+} catch (err) {
+  errors.push(String(err && err.stack || err));
+}
+// Print once boot has settled: when nothing is left to run, or (a worker thread keeps the
+// process alive) after a second
+const print = () => {
+  console.log(JSON.stringify({ html: app.innerHTML, errors }));
+  process.exit(0);
+};
+if (useWorker) setTimeout(print, 1000);
+else process.on("beforeExit", print);
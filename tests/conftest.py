@@ -1,5 +1,9 @@
 """Pytest fixtures for robotframework-reportlens tests."""
 
+import json
+import shutil
+import subprocess
+
 import pytest
 from pathlib import Path
 
@@ -68,3 +72,57 @@ def sample_output_xml(tmp_path):
     path = tmp_path / "output.xml"
     path.write_text(xml_content, encoding="utf-8")
     return path
+
+
+@pytest.fixture
+def nested_suites_xml_path(fixtures_dir):
+    """Path to output.xml with nested suites and failing/skipped suite teardowns.
+
+    Generated by: robot --loglevel TRACE with a directory suite (``Nested/``) whose
+    ``__init__.robot`` teardown fails and whose ``outer.robot`` teardown skips.
+    """
+    path = fixtures_dir / "nested_suites_output.xml"
+    assert path.exists(), f"Fixture not found: {path}"
+    return str(path)
+
+
+@pytest.fixture
+def shard_xml_paths(fixtures_dir):
+    """Paths to pabot-like shard outputs plus a rerun of the first one.
+
+    Generated from ``robot_tests/shards/Shards`` with:
+    ``robot --variable FLAKY:no --suite Shards.Alpha|Shards.Beta`` (two shards) and
+    ``robot --variable FLAKY:ok --rerunfailed shard_alpha_output.xml`` (rerun of Alpha).
+    """
+    paths = [
+        fixtures_dir / f"{name}_output.xml"
+        for name in ("shard_alpha", "shard_beta", "rerun_alpha")
+    ]
+    for path in paths:
+        assert path.exists(), f"Fixture not found: {path}"
+    return [str(path) for path in paths]
+
+
+@pytest.fixture
+def boot_report():
+    """Function booting a self-contained report in Node against a stub DOM.
+
+    Returns ``{"html": <rendered #app markup>, "errors": [...]}`` (tests/boot_report.js);
+    with ``worker=True`` the report's data worker runs in a Node worker thread. Tests
+    using it are skipped when node is not installed.
+    """
+    if shutil.which("node") is None:
+        pytest.skip("node not installed")
+    script = Path(__file__).resolve().parent / "boot_report.js"
+
+    def boot(report, worker=False):
+        result = subprocess.run(
+            ["node", str(script), str(report)] + (["--worker"] if worker else []),
+            capture_output=True,
+            text=True,
+            timeout=60,
+            check=True,
+        )
+        return json.loads(result.stdout)
+
+    return boot
@@ -0,0 +1,132 @@
+"""Tests for the precompiled, cached report template assets and shared asset files."""
+
+import dataclasses
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from robotframework_reportlens.assets import (
+    TEMPLATE_PATH,
+    ReportTemplate,
+    shared_asset_name,
+    write_shared_assets,
+)
+from robotframework_reportlens.generator import RobotFrameworkReportGenerator
+
+
+class TestReportTemplate:
+    """Tests for ReportTemplate and its process-wide cache."""
+
+    def test_load_is_cached(self):
+        assert ReportTemplate.load() is ReportTemplate.load(TEMPLATE_PATH)
+
+    def test_changed_file_is_reloaded(self, tmp_path):
+        path = tmp_path / "template.html"
+        path.write_text(TEMPLATE_PATH.read_text(encoding="utf-8"), encoding="utf-8")
+        first = ReportTemplate.load(path)
+        assert ReportTemplate.load(path) is first
+        path.write_text(
+            "<style>body {}</style><script>let a = mockData;</script>",
+            encoding="utf-8",
+        )
+        os.utime(path, ns=(0, 0))
+        changed = ReportTemplate.load(path)
+        assert changed is not first
+        assert changed.css == "body {}"
+        assert changed.javascript == "let a = reportData;"
+
+    def test_missing_file_falls_back(self, tmp_path):
+        template = ReportTemplate.load(tmp_path / "missing.html")
+        assert "not found" in template.css
+        assert "not found" in template.javascript
+
+    def test_is_immutable(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            ReportTemplate.load().css = ""
+
+    def test_write_splices_config_and_payload(self):
+        template = ReportTemplate("b {}", "run();")
+        buf = io.StringIO()
+        template.write(buf, '{"externalData": false}', lambda out: out.write("{}"))
+        html = buf.getvalue()
+        assert html.startswith("<!DOCTYPE html>")
+        assert '<script type="application/json" id="report-config">' in html
+        assert '{"externalData": false}</script>' in html
+        assert '<script type="application/json" id="report-data">{}</script>' in html
+        assert html.index("b {}") < html.index("report-config") < html.index("run();")
+        buf = io.StringIO()
+        template.write(buf, "{}")
+        assert "report-data" not in buf.getvalue()
+
+    def test_generator_uses_given_template(self, tmp_path, minimal_xml_path):
+        out = tmp_path / "report.html"
+        gen = RobotFrameworkReportGenerator(
+            str(minimal_xml_path), template=ReportTemplate("b {}", "customRun();")
+        )
+        gen.generate_html(str(out))
+        html = out.read_text(encoding="utf-8")
+        assert "customRun();" in html
+        assert 'id="report-data"' in html
+
+
+class TestSharedAssets:
+    """Tests for content-hashed shared assets (--assets-dir)."""
+
+    def test_names_are_content_hashed_and_written_once(self, tmp_path):
+        template = ReportTemplate("b {}", "run();")
+        css_name, js_name = write_shared_assets(template, tmp_path)
+        assert css_name == shared_asset_name("b {}", "css")
+        assert js_name.startswith("reportlens.") and js_name.endswith(".js")
+        assert (tmp_path / js_name).read_text(encoding="utf-8") == "run();"
+        os.utime(tmp_path / js_name, ns=(0, 0))
+        assert write_shared_assets(template, tmp_path) == (css_name, js_name)
+        assert (tmp_path / js_name).stat().st_mtime_ns == 0
+        other = write_shared_assets(ReportTemplate("b {}", "other();"), tmp_path)
+        assert other[0] == css_name and other[1] != js_name
+
+    def test_concurrent_writers_share_directory(self, tmp_path):
+        """Threads of one process writing the same new assets neither fail nor leave temp files."""
+        template = ReportTemplate("b {}" * 10_000, "run();" * 10_000)
+        for attempt in range(5):
+            directory = tmp_path / str(attempt)
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(
+                    pool.map(write_shared_assets, [template] * 8, [directory] * 8)
+                )
+            assert len(set(results)) == 1
+            assert sorted(p.name for p in directory.iterdir()) == sorted(results[0])
+            js = (directory / results[0][1]).read_text(encoding="utf-8")
+            assert js == template.javascript
+
+    def test_linked_page_matches_inlined_page(self, tmp_path, minimal_xml_path):
+        inline = tmp_path / "inline.html"
+        linked = tmp_path / "reports" / "run1" / "report.html"
+        assets = tmp_path / "assets"
+        RobotFrameworkReportGenerator(str(minimal_xml_path)).generate_html(str(inline))
+        RobotFrameworkReportGenerator(
+            str(minimal_xml_path), assets_dir=str(assets)
+        ).generate_html(str(linked))
+        css_name, js_name = write_shared_assets(ReportTemplate.load(), assets)
+        page = linked.read_text(encoding="utf-8")
+        css_tag = f'  <link rel="stylesheet" href="../../assets/{css_name}">'
+        js_tag = f'  <script src="../../assets/{js_name}"></script>'
+        assert css_tag in page and js_tag in page
+        template = ReportTemplate.load()
+        page = page.replace(css_tag, f"  <style>\n{template.css}\n  </style>")
+        page = page.replace(js_tag, f"  <script>\n{template.javascript}\n  </script>")
+        assert page == inline.read_text(encoding="utf-8")
+
+    def test_assets_url_in_external_mode(self, tmp_path, minimal_xml_path):
+        out = tmp_path / "report.html"
+        RobotFrameworkReportGenerator(
+            str(minimal_xml_path),
+            external_data=True,
+            assets_dir=str(tmp_path / "static"),
+            assets_url="https://reports.example/static/",
+        ).generate_html(str(out), external_data=True)
+        page = out.read_text(encoding="utf-8")
+        assert '<script src="https://reports.example/static/reportlens.' in page
+        assert "<style>" not in page
+        assert len(list((tmp_path / "static").glob("reportlens.*"))) == 2
@@ -1,12 +1,24 @@
 """Tests for the report model builder."""
 
+import io
+from dataclasses import asdict
 
+import pytest
+import robot
+
+from robotframework_reportlens import builder
 from robotframework_reportlens.builder import (
+    _LEVELS,
+    _assign_suites,
+    _top_level_suite_sizes,
+    _all_tests,
     build_report_model,
+    stream_report_model,
     _is_executable_body_item,
 )
 from robotframework_reportlens.model import ReportModel, Suite, Test as TestCaseModel
 from robotframework_reportlens.model import Keyword
+from robotframework_reportlens.serialize import model_to_payload
 
 
 def _nested_xml_path(fixtures_dir):
@@ -88,17 +100,13 @@ class TestBuildReportModel:
     def test_report_start_time_and_generated_set_from_xml(self, minimal_xml_path):
         """Report start_time and generated come from XML (root suite or generation_time)."""
         model = build_report_model(minimal_xml_path)
-        assert model.generated, "generated should be set from <robot generated='...'>"
-        assert model.start_time, (
-            "start_time should be set (suite/status or generation_time fallback)"
-        )
-        # Should be ISO-like so JS Date(iso) parses
-        assert "T" in model.start_time or model.start_time.startswith("202"), (
-            model.start_time
-        )
-        assert "T" in model.generated or model.generated.startswith("202"), (
-            model.generated
-        )
+        # Stored as integer microseconds since the epoch
+        assert isinstance(model.generated, int), model.generated
+        assert isinstance(model.start_time, int), model.start_time
+        # Serialized as ISO so JS Date(iso) parses
+        payload = model_to_payload(model)
+        assert payload["generated"].startswith("2026-01-31T12:00:00")
+        assert "T" in payload["startTime"], payload["startTime"]
 
     def test_nested_keywords_preserved(self, fixtures_dir):
         """Keywords executed inside another keyword are built recursively and appear in the report."""
@@ -256,3 +264,211 @@ class TestBuildReportModel:
         assert "<" in plain_msg.message, (
             "Plain text message should contain unescaped < character"
         )
+
+    def test_model_is_compact(self, fixtures_dir):
+        """Slotted model objects, shared empty tuples and interned level/status strings."""
+        model = build_report_model(
+            str(fixtures_dir / "control_structures_output.xml"),
+            min_log_level=_LEVELS["TRACE"],
+        )
+        keywords = [kw for t in model.root_suite.tests for kw in t.keywords]
+        messages = [m for kw in keywords for m in kw.messages]
+        assert keywords and messages
+        for obj in (model, model.root_suite, keywords[0], messages[0]):
+            assert not hasattr(obj, "__dict__"), type(obj)
+        assert all(type(kw.keywords) is tuple for kw in keywords)
+        empty = [kw.arguments for kw in keywords if not kw.arguments]
+        assert empty and len({id(args) for args in empty}) == 1
+        levels = {id(m.level) for m in messages if m.level == "INFO"}
+        assert len(levels) == 1
+        statuses = {id(kw.status) for kw in keywords if kw.status == "PASS"}
+        assert len(statuses) == 1
+
+
+class TestStreamReportModel:
+    """Tests for stream_report_model (incremental output.xml parsing)."""
+
+    FIXTURES = (
+        "minimal_output.xml",
+        "nested_keywords_output.xml",
+        "html_messages_output.xml",
+        "control_structures_output.xml",
+        "nested_suites_output.xml",
+    )
+
+    def test_matches_build_report_model_on_all_fixtures(self, fixtures_dir):
+        """Streaming must produce exactly the same model as the ExecutionResult path."""
+        for name in self.FIXTURES:
+            path = str(fixtures_dir / name)
+            for level in (_LEVELS["TRACE"], _LEVELS["INFO"]):
+                expected = build_report_model(path, min_log_level=level)
+                streamed = stream_report_model(path, min_log_level=level)
+                assert asdict(streamed) == asdict(expected), name
+
+    def test_nested_suite_ids_and_full_names(self, nested_suites_xml_path):
+        model = stream_report_model(nested_suites_xml_path)
+        inner_parent, outer = model.root_suite.suites
+        assert [inner_parent.id, outer.id] == ["s1-s1", "s1-s2"]
+        inner = inner_parent.suites[0]
+        assert inner.id == "s1-s1-s1"
+        assert [t.id for t in inner.tests] == ["s1-s1-s1-t1", "s1-s1-s1-t2"]
+        assert inner.full_name == "Nested.Inner.Inner"
+
+    def test_parent_suite_teardown_failure_applied_to_tests(
+        self, nested_suites_xml_path
+    ):
+        """Failed and skipped suite teardowns update test status/message like Robot does."""
+        model = stream_report_model(nested_suites_xml_path)
+        inner = model.root_suite.suites[0].suites[0]
+        passing, failing = inner.tests
+        assert passing.status == "FAIL"
+        assert passing.message.startswith("Parent suite teardown failed:")
+        assert failing.message.startswith("inner failure")
+        assert "Also parent suite teardown failed:" in failing.message
+        assert inner.statistics == {"total": 2, "passed": 0, "failed": 2, "skipped": 0}
+        outer = model.root_suite.suites[1]
+        assert all(t.status == "SKIP" for t in outer.tests)
+        assert outer.status == "SKIP"
+        assert model.statistics["failed"] == 2
+        assert model.statistics["skipped"] == 2
+
+    def test_messages_below_level_dropped_while_parsing(self, nested_suites_xml_path):
+        """Filtered <msg> elements never reach the model and are counted per level."""
+        for build in (
+            build_report_model,
+            stream_report_model,
+            lambda path, level: stream_report_model(path, level, jobs=2),
+        ):
+            model = build(nested_suites_xml_path, _LEVELS["WARN"])
+            assert model.dropped_messages == {
+                "TRACE": 12,
+                "DEBUG": 5,
+                "INFO": 1,
+                "SKIP": 2,
+            }
+            levels = {
+                m.level
+                for t in _all_tests(model.root_suite)
+                for kw in t.keywords
+                for m in kw.messages
+            }
+            assert levels <= {"WARN", "ERROR", "FAIL"}
+        assert build_report_model(nested_suites_xml_path).dropped_messages == {
+            "TRACE": 12
+        }
+        trace = build_report_model(nested_suites_xml_path, _LEVELS["TRACE"])
+        assert trace.dropped_messages == {}
+
+    def test_parallel_build_matches_serial(self, fixtures_dir):
+        """Worker-built top-level suites are stitched back with identical IDs and order."""
+        for name in ("nested_suites_output.xml", "control_structures_output.xml"):
+            path = str(fixtures_dir / name)
+            expected = asdict(build_report_model(path, min_log_level=_LEVELS["TRACE"]))
+            for jobs in (2, 3):
+                parallel = stream_report_model(
+                    path, min_log_level=_LEVELS["TRACE"], jobs=jobs
+                )
+                assert asdict(parallel) == expected, (name, jobs)
+
+    def test_top_level_suite_sizes_cover_child_suites(self, fixtures_dir):
+        path = fixtures_dir / "nested_suites_output.xml"
+        sizes = _top_level_suite_sizes(str(path))
+        model = build_report_model(str(path))
+        assert len(sizes) == len(model.root_suite.suites) == 2
+        text = path.read_bytes()
+        first = text.index(b"<suite", text.index(b"<suite") + 1)
+        assert text[first : first + sizes[0]].endswith(b"</suite>")
+        assert _top_level_suite_sizes(str(fixtures_dir / "minimal_output.xml")) == []
+
+    def test_suites_assigned_by_size(self):
+        assert _assign_suites([100, 1, 1, 1, 97], 2) == [
+            frozenset({0}),
+            frozenset({1, 2, 3, 4}),
+        ]
+        # No idle workers when there are fewer suites than jobs
+        assert _assign_suites([5, 7], 4) == [frozenset({1}), frozenset({0})]
+        assert _assign_suites([], 4) == []
+
+    def test_parallel_build_builds_each_suite_once(self, fixtures_dir, tmp_path):
+        """Worker 0 holding the largest (first) suite does not rebuild later ones."""
+        combined = str(tmp_path / "combined.xml")
+        robot.rebot(
+            str(fixtures_dir / "control_structures_output.xml"),
+            str(fixtures_dir / "nested_suites_output.xml"),
+            str(fixtures_dir / "nested_suites_output.xml"),
+            output=combined,
+            log="NONE",
+            report="NONE",
+            stdout=io.StringIO(),
+            stderr=io.StringIO(),
+        )
+        sizes = _top_level_suite_sizes(combined)
+        assert _assign_suites(sizes, 2) == [frozenset({0}), frozenset({1, 2})]
+        for level in (_LEVELS["TRACE"], _LEVELS["INFO"]):
+            serial = stream_report_model(combined, level)
+            parallel = stream_report_model(combined, level, jobs=2)
+            assert parallel.dropped_messages == serial.dropped_messages
+            assert asdict(parallel) == asdict(serial)
+
+    def test_parallel_build_without_prescan(self, nested_suites_xml_path, monkeypatch):
+        """Suites the pre-scan does not find are still built (by the first worker)."""
+        monkeypatch.setattr(builder, "_top_level_suite_sizes", lambda path: [])
+        expected = asdict(build_report_model(nested_suites_xml_path))
+        assert asdict(stream_report_model(nested_suites_xml_path, jobs=2)) == expected
+
+
+class TestInstalledRobotOutput:
+    """Builds from an output.xml written by the installed Robot Framework version.
+
+    The checked-in fixtures are Robot 7 output; this covers the older output schema
+    when the suite runs against Robot 6.
+    """
+
+    SUITE = """*** Test Cases ***
+Logs At Every Level
+    Log    trace message    TRACE
+    Log    debug message    DEBUG
+    Log    info message
+    FOR    ${i}    IN RANGE    2
+        IF    ${i} == 1
+            Log    warning    WARN
+        END
+    END
+"""
+
+    @pytest.fixture
+    def native_xml_path(self, tmp_path):
+        suites = tmp_path / "Native"
+        suites.mkdir()
+        for name in ("first.robot", "second.robot"):
+            (suites / name).write_text(self.SUITE, encoding="utf-8")
+        output = tmp_path / "output.xml"
+        robot.run(
+            str(suites),
+            output=str(output),
+            log="NONE",
+            report="NONE",
+            loglevel="TRACE",
+            console="none",
+            stdout=io.StringIO(),
+            stderr=io.StringIO(),
+        )
+        return str(output)
+
+    def test_all_build_modes_match(self, native_xml_path):
+        for level in (_LEVELS["TRACE"], _LEVELS["INFO"]):
+            expected = asdict(build_report_model(native_xml_path, level))
+            assert asdict(stream_report_model(native_xml_path, level)) == expected
+            parallel = stream_report_model(native_xml_path, level, jobs=2)
+            assert asdict(parallel) == expected
+
+    def test_messages_below_level_dropped(self, native_xml_path):
+        model = build_report_model(native_xml_path, _LEVELS["INFO"])
+        # TRACE also logs every keyword's arguments and return value
+        assert model.dropped_messages["DEBUG"] == 2
+        assert model.dropped_messages["TRACE"] >= 2
+        first = model.root_suite.suites[0].tests[0]
+        assert first.status == "PASS"
+        assert first.start_time is not None
+        assert [m.message for m in first.keywords[0].messages] == []
+        assert [m.message for m in first.keywords[2].messages] == ["info message"]
@@ -0,0 +1,137 @@
+"""Tests for the on-disk ReportModel cache."""
+
+import os
+import pickle
+import shutil
+import zlib
+from dataclasses import asdict
+
+import pytest
+
+from robotframework_reportlens import cache as cache_module
+from robotframework_reportlens import generator as generator_module
+from robotframework_reportlens.builder import _LEVELS, build_report_model
+from robotframework_reportlens.cache import KEY_ENV, ModelCache, signing_key
+from robotframework_reportlens.generator import RobotFrameworkReportGenerator
+
+
+@pytest.fixture(autouse=True)
+def user_config(tmp_path_factory, monkeypatch):
+    """Per-user signing key in a temporary config directory, not the real home."""
+    config = tmp_path_factory.mktemp("config")
+    monkeypatch.delenv(KEY_ENV, raising=False)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(config))
+    return config
+
+
+class TestModelCache:
+    def test_store_and_load_round_trip(self, tmp_path, control_structures_xml_path):
+        cache = ModelCache(str(tmp_path / "cache"))
+        model = build_report_model(control_structures_xml_path, _LEVELS["TRACE"])
+        key = cache.key(control_structures_xml_path, _LEVELS["TRACE"])
+        assert cache.load(key) is None
+        cache.store(key, model)
+        assert asdict(cache.load(key)) == asdict(model)
+
+    def test_key_depends_on_content_and_options(self, tmp_path, minimal_xml_path):
+        cache = ModelCache(str(tmp_path / "cache"))
+        copy = tmp_path / "fixtures" / "copy.xml"
+        copy.parent.mkdir()
+        shutil.copy(minimal_xml_path, copy)
+        key = cache.key(str(copy), _LEVELS["TRACE"])
+        # Same content and directory name: same key
+        assert cache.key(minimal_xml_path, _LEVELS["TRACE"]) == key
+        assert cache.key(str(copy), _LEVELS["DEBUG"]) != key
+        copy.write_text(copy.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+        assert cache.key(str(copy), _LEVELS["TRACE"]) != key
+
+    def test_key_depends_on_robot_version(
+        self, tmp_path, minimal_xml_path, monkeypatch
+    ):
+        cache = ModelCache(str(tmp_path))
+        key = cache.key(minimal_xml_path, _LEVELS["TRACE"])
+        monkeypatch.setattr(cache_module, "ROBOT_VERSION", "0.0")
+        assert cache.key(minimal_xml_path, _LEVELS["TRACE"]) != key
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path, minimal_xml_path):
+        cache = ModelCache(str(tmp_path))
+        key = cache.key(minimal_xml_path, _LEVELS["TRACE"])
+        data = b"not a model"
+        (tmp_path / f"{key}.model").write_bytes(cache._sign(data) + data)
+        assert cache.load(key) is None
+        assert not (tmp_path / f"{key}.model").exists()
+
+    @pytest.mark.parametrize(
+        "pickled",
+        [
+            b"cno_such_module_for_reportlens\nModel\n.",  # ImportError
+            b"cbuiltins\nint\n(S'1'\nS'2'\nS'3'\ntR.",  # TypeError
+        ],
+    )
+    def test_signed_entry_failing_to_unpickle_is_a_miss(self, tmp_path, pickled):
+        cache = ModelCache(str(tmp_path))
+        data = zlib.compress(pickled)
+        (tmp_path / "a.model").write_bytes(cache._sign(data) + data)
+        assert cache.load("a") is None
+        assert not (tmp_path / "a.model").exists()
+
+    def test_unreadable_entry_is_a_miss(self, tmp_path):
+        (tmp_path / "a.model").mkdir()
+        assert ModelCache(str(tmp_path)).load("a") is None
+
+    def test_unsigned_entries_are_never_unpickled(
+        self, tmp_path, minimal_xml_path, monkeypatch
+    ):
+        """Entries written without this user's key are misses and left in place."""
+        model = build_report_model(minimal_xml_path)
+        ModelCache(str(tmp_path), secret=b"someone else").store("a", model)
+        forged = zlib.compress(pickle.dumps(model))
+        (tmp_path / "b.model").write_bytes(bytes(32) + forged)
+
+        def fail(*args, **kwargs):
+            pytest.fail("unsigned entry unpickled")
+
+        monkeypatch.setattr(cache_module.pickle, "loads", fail)
+        cache = ModelCache(str(tmp_path))
+        assert cache.load("a") is None
+        assert cache.load("b") is None
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.model", "b.model"]
+
+    def test_signing_key(self, user_config, monkeypatch):
+        key = signing_key()
+        assert len(key) == 32
+        assert (user_config / "reportlens" / "cache.key").stat().st_mode & 0o077 == 0
+        assert signing_key() == key
+        monkeypatch.setenv(KEY_ENV, "shared ci secret")
+        assert signing_key() == b"shared ci secret"
+
+    def test_eviction_removes_least_recently_used(self, tmp_path, minimal_xml_path):
+        model = build_report_model(minimal_xml_path)
+        cache = ModelCache(str(tmp_path))
+        cache.store("a", model)
+        entry_size = (tmp_path / "a.model").stat().st_size
+        cache.max_bytes = entry_size * 2
+        cache.store("b", model)
+        os.utime(tmp_path / "a.model", (0, 0))
+        os.utime(tmp_path / "b.model", (1, 1))
+        cache.load("a")  # touch: "b" is now the oldest
+        cache.store("c", model)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.model", "c.model"]
+
+
+class TestGeneratorCache:
+    def test_second_generation_skips_parsing(
+        self, tmp_path, minimal_xml_path, monkeypatch
+    ):
+        cache_dir = str(tmp_path / "cache")
+        first = RobotFrameworkReportGenerator(minimal_xml_path, cache_dir=cache_dir)
+
+        def fail(*args, **kwargs):
+            pytest.fail("model should come from the cache")
+
+        monkeypatch.setattr(generator_module, "build_report_model", fail)
+        monkeypatch.setattr(generator_module, "stream_report_model", fail)
+        second = RobotFrameworkReportGenerator(
+            minimal_xml_path, cache_dir=cache_dir, streaming=True
+        )
+        assert asdict(second._model) == asdict(first._model)
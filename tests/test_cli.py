@@ -1,6 +1,10 @@
 """Tests for the reportlens CLI."""
 
+import json
 from unittest.mock import patch
+
+import pytest
+
 from robotframework_reportlens.cli import main
 
 
@@ -85,3 +89,210 @@ def test_cli_external_data_mode(tmp_path, sample_output_xml):
     assert data_dir.exists()
     assert (data_dir / "summary.json").exists()
     assert (data_dir / "suites.json").exists()
+
+
+def test_cli_streaming_mode(tmp_path, sample_output_xml):
+    """--streaming generates the same self-contained report as the default mode."""
+    default_html = tmp_path / "default.html"
+    streamed_html = tmp_path / "streamed.html"
+    with patch(
+        "sys.argv", ["reportlens", str(sample_output_xml), "-o", str(default_html)]
+    ):
+        assert main() == 0
+    with patch(
+        "sys.argv",
+        ["reportlens", str(sample_output_xml), "-o", str(streamed_html), "--streaming"],
+    ):
+        assert main() == 0
+    assert streamed_html.read_text(encoding="utf-8") == default_html.read_text(
+        encoding="utf-8"
+    )
+
+
+def test_cli_jobs_mode(tmp_path, sample_output_xml):
+    """--jobs builds the same report as a serial run."""
+    serial_html = tmp_path / "serial.html"
+    parallel_html = tmp_path / "parallel.html"
+    with patch(
+        "sys.argv", ["reportlens", str(sample_output_xml), "-o", str(serial_html)]
+    ):
+        assert main() == 0
+    with patch(
+        "sys.argv",
+        ["reportlens", str(sample_output_xml), "-o", str(parallel_html), "--jobs", "2"],
+    ):
+        assert main() == 0
+    assert parallel_html.read_text(encoding="utf-8") == serial_html.read_text(
+        encoding="utf-8"
+    )
+
+
+def test_cli_reports_dropped_messages(tmp_path, nested_suites_xml_path, capsys):
+    """--loglevel reports how many messages were dropped per level while parsing."""
+    out_html = tmp_path / "report.html"
+    with patch(
+        "sys.argv",
+        [
+            "reportlens",
+            nested_suites_xml_path,
+            "-o",
+            str(out_html),
+            "--loglevel",
+            "DEBUG",
+        ],
+    ):
+        assert main() == 0
+    out = capsys.readouterr().out
+    assert "Dropped 12 log messages below DEBUG (TRACE: 12)" in out
+
+
+def test_cli_merges_multiple_outputs(tmp_path, shard_xml_paths):
+    """Several outputs with --merge produce one report."""
+    out_html = tmp_path / "report.html"
+    with patch(
+        "sys.argv",
+        ["reportlens", *shard_xml_paths, "-o", str(out_html), "--merge", "-j", "2"],
+    ):
+        assert main() == 0
+    content = out_html.read_text(encoding="utf-8")
+    assert "Alpha Flaky" in content
+    assert "Beta Fails" in content
+
+
+def test_cli_packed_external_data(tmp_path, sample_output_xml):
+    """--packed writes tests_<n>.pack shards instead of per-test files."""
+    out_html = tmp_path / "report.html"
+    with patch(
+        "sys.argv",
+        [
+            "reportlens",
+            str(sample_output_xml),
+            "-o",
+            str(out_html),
+            "--external-data",
+            "--packed",
+            "--shard-size",
+            "1",
+        ],
+    ):
+        assert main() == 0
+    data_dir = tmp_path / "reportlens-data"
+    assert [p.name for p in data_dir.glob("*.pack")] == ["tests_0.pack"]
+    assert not list(data_dir.glob("test_*.json"))
+
+
+def test_cli_compression_policy(tmp_path, sample_output_xml):
+    """--compress-min-size and --compress-kind keep some data files plain."""
+    out_html = tmp_path / "report.html"
+    argv = ["reportlens", str(sample_output_xml), "-o", str(out_html)]
+    argv += ["--external-data", "--compress-data", "--compress-level", "6"]
+    with patch("sys.argv", [*argv, "--compress-kind", "summary=0"]):
+        assert main() == 0
+    data_dir = tmp_path / "reportlens-data"
+    assert (data_dir / "summary.json").exists()
+    assert (data_dir / "suites.json.gz").exists()
+    with (
+        patch("sys.argv", [*argv, "--compress-kind", "tests=3"]),
+        pytest.raises(SystemExit),
+    ):
+        main()
+
+
+def test_cli_string_table(tmp_path, sample_output_xml):
+    """--string-table writes a schemaVersion 2 payload and data files."""
+    out_html = tmp_path / "report.html"
+    argv = ["reportlens", str(sample_output_xml), "-o", str(out_html), "--string-table"]
+    with patch("sys.argv", argv):
+        assert main() == 0
+    assert '"schemaVersion": 2' in out_html.read_text(encoding="utf-8")
+    with patch("sys.argv", [*argv, "--external-data"]):
+        assert main() == 0
+    suites = (tmp_path / "reportlens-data" / "suites.json").read_text(encoding="utf-8")
+    assert '"schemaVersion": 2' in suites
+
+
+def test_cli_columnar_external_data(tmp_path, sample_output_xml):
+    """--columnar writes suites.json and suite files as parallel arrays."""
+    out_html = tmp_path / "report.html"
+    argv = ["reportlens", str(sample_output_xml), "-o", str(out_html)]
+    with patch("sys.argv", [*argv, "--external-data", "--columnar"]):
+        assert main() == 0
+    data_dir = tmp_path / "reportlens-data"
+    suites = json.loads((data_dir / "suites.json").read_text(encoding="utf-8"))
+    assert "suiteColumns" in suites and "suites" not in suites
+    suite_id = suites["suiteColumns"]["columns"]["id"][0]
+    suite = json.loads(
+        (data_dir / f"suite_{suite_id}.json").read_text(encoding="utf-8")
+    )
+    assert "testColumns" in suite and "tests" not in suite
+
+
+def test_cli_dedup_external_data(tmp_path, sample_output_xml, capsys):
+    """--dedup writes blocks.json and prints the dedup ratio."""
+    out_html = tmp_path / "report.html"
+    argv = ["reportlens", str(sample_output_xml), "-o", str(out_html)]
+    with patch("sys.argv", [*argv, "--external-data", "--dedup"]):
+        assert main() == 0
+    assert (tmp_path / "reportlens-data" / "blocks.json").exists()
+    assert "(ratio x" in capsys.readouterr().out
+
+
+def test_cli_minify(tmp_path, sample_output_xml):
+    """--minify writes a smaller report without template comments."""
+    plain_html = tmp_path / "plain.html"
+    minified_html = tmp_path / "minified.html"
+    with patch(
+        "sys.argv", ["reportlens", str(sample_output_xml), "-o", str(plain_html)]
+    ):
+        assert main() == 0
+    argv = ["reportlens", str(sample_output_xml), "-o", str(minified_html), "--minify"]
+    with patch("sys.argv", argv):
+        assert main() == 0
+    content = minified_html.read_text(encoding="utf-8")
+    assert "// ==========" not in content
+    assert len(content) < len(plain_html.read_text(encoding="utf-8"))
+
+
+def test_cli_shared_assets(tmp_path, sample_output_xml):
+    """--assets-dir links shared content-hashed CSS/JS; --assets-url needs it."""
+    out_html = tmp_path / "report.html"
+    argv = ["reportlens", str(sample_output_xml), "-o", str(out_html)]
+    with patch("sys.argv", [*argv, "--assets-dir", str(tmp_path / "assets")]):
+        assert main() == 0
+    assert '<script src="assets/reportlens.' in out_html.read_text(encoding="utf-8")
+    assert len(list((tmp_path / "assets").glob("reportlens.*.js"))) == 1
+    with (
+        patch("sys.argv", [*argv, "--assets-url", "/static"]),
+        pytest.raises(SystemExit),
+    ):
+        main()
+
+
+def test_cli_compressed_self_contained(tmp_path, sample_output_xml):
+    """--compress-data without --external-data embeds a gzip+base64 payload."""
+    out_html = tmp_path / "report.html"
+    argv = ["reportlens", str(sample_output_xml), "-o", str(out_html)]
+    with patch("sys.argv", [*argv, "--compress-data"]):
+        assert main() == 0
+    content = out_html.read_text(encoding="utf-8")
+    assert '"compressed": true' in content
+    assert 'id="report-data">H4sI' in content
+    assert not (tmp_path / "reportlens-data").exists()
+
+
+def test_cli_split_payload(tmp_path, sample_output_xml):
+    """--split-payload embeds per-file data blocks; not combinable with --external-data."""
+    out_html = tmp_path / "report.html"
+    argv = [
+        "reportlens",
+        str(sample_output_xml),
+        "-o",
+        str(out_html),
+        "--split-payload",
+    ]
+    with patch("sys.argv", argv):
+        assert main() == 0
+    content = out_html.read_text(encoding="utf-8")
+    assert 'id="rl:summary.json"' in content and 'id="report-data"' not in content
+    with patch("sys.argv", [*argv, "--external-data"]), pytest.raises(SystemExit):
+        main()
@@ -0,0 +1,138 @@
+"""Tests for cross-test deduplication of keyword subtrees and message blocks."""
+
+import json
+from dataclasses import replace
+
+from robotframework_reportlens.builder import build_report_model
+from robotframework_reportlens.dedup import BLOCKS_NAME, BlockStore, keyword_key
+from robotframework_reportlens.generator import RobotFrameworkReportGenerator
+from robotframework_reportlens.serialize import external_data_files
+
+
+def _expand_keyword(kw, keyword_blocks):
+    """Plain keyword dict of a (possibly referenced) keyword (what the frontend does)."""
+    if "ref" not in kw:
+        if "keywords" in kw:
+            kw["keywords"] = [
+                _expand_keyword(c, keyword_blocks) for c in kw["keywords"]
+            ]
+        return kw
+    times, ids = kw["times"], kw.get("ids")
+    node = 0
+
+    def build(key, kw_id):
+        nonlocal node
+        block = keyword_blocks[key]
+        t = 3 * node
+        node += 1
+        out = {"id": kw_id, **{k: v for k, v in block.items() if k != "keywords"}}
+        if times[t] is not None:
+            out["startTime"] = times[t]
+        if times[t + 1] is not None:
+            out["endTime"] = times[t + 1]
+        out["duration"] = times[t + 2]
+        if "keywords" in block:
+            children = []
+            for i, child in enumerate(block["keywords"]):
+                children.append(build(child, ids[node - 1] if ids else f"{kw_id}-{i}"))
+            out["keywords"] = children
+        return out
+
+    return build(kw["ref"], kw["id"])
+
+
+def _expand(files):
+    blocks = files.pop(BLOCKS_NAME)
+    for data in files.values():
+        test = data.get("test")
+        if test:
+            if "keywords" in test:
+                test["keywords"] = [
+                    _expand_keyword(kw, blocks["keywordBlocks"])
+                    for kw in test["keywords"]
+                ]
+            for field in ("setup", "teardown"):
+                if field in test:
+                    test[field] = _expand_keyword(test[field], blocks["keywordBlocks"])
+        for kw_id, value in data.get("keywordMessages", {}).items():
+            if isinstance(value, dict):
+                data["keywordMessages"][kw_id] = [
+                    {
+                        "id": f"{kw_id}-msg-{i}",
+                        **({"timestamp": ts} if ts is not None else {}),
+                        **msg,
+                    }
+                    for i, (msg, ts) in enumerate(
+                        zip(blocks["messageBlocks"][value["ref"]], value["timestamps"])
+                    )
+                ]
+    return files
+
+
+def _canonical(files):
+    return json.dumps(files, sort_keys=True)
+
+
+class TestBlockStore:
+    """Tests for BlockStore and the deduplicated external-data files."""
+
+    def test_expands_to_plain_files(self, control_structures_xml_path):
+        model = build_report_model(control_structures_xml_path)
+        store = BlockStore(model)
+        files = json.loads(json.dumps(dict(external_data_files(model, blocks=store))))
+        assert store.keyword_refs and store.message_refs
+        assert any(
+            "ref" in kw
+            for data in files.values()
+            if "test" in data
+            for kw in data["test"].get("keywords", ())
+        )
+        plain = json.loads(json.dumps(dict(external_data_files(model))))
+        assert _canonical(_expand(files)) == _canonical(plain)
+
+    def test_unique_content_stays_inline(self, minimal_xml_path):
+        model = build_report_model(minimal_xml_path)
+        store = BlockStore(model)
+        files = dict(external_data_files(model, blocks=store))
+        assert files.pop(BLOCKS_NAME)["keywordBlocks"] == {}
+        assert _canonical(files) == _canonical(dict(external_data_files(model)))
+        assert store.ratio == 1.0
+
+    def test_key_ignores_ids_and_timing(self, control_structures_xml_path):
+        model = build_report_model(control_structures_xml_path)
+        kw = model.root_suite.tests[0].keywords[0]
+        moved = replace(kw, id="kw-other", start_time=1, end_time=2, duration=1)
+        assert keyword_key(moved, []) == keyword_key(kw, [])
+        assert keyword_key(replace(kw, arguments=("x",)), []) != keyword_key(kw, [])
+
+    def test_non_positional_child_ids_are_listed(self, control_structures_xml_path):
+        model = build_report_model(control_structures_xml_path)
+        parent = next(
+            kw for test in model.root_suite.tests for kw in test.keywords if kw.keywords
+        )
+        parent.keywords[0].id = "kw-renamed"
+        files = dict(external_data_files(model, blocks=BlockStore(model)))
+        refs = [
+            kw
+            for data in files.values()
+            if "test" in data
+            for kw in data["test"].get("keywords", ())
+            if "ids" in kw
+        ]
+        assert any("kw-renamed" in ref["ids"] for ref in refs)
+        plain = json.loads(json.dumps(dict(external_data_files(model))))
+        assert _canonical(_expand(json.loads(json.dumps(files)))) == _canonical(plain)
+
+    def test_generator_writes_blocks_and_summary(
+        self, tmp_path, control_structures_xml_path, capsys
+    ):
+        out = tmp_path / "report.html"
+        gen = RobotFrameworkReportGenerator(
+            str(control_structures_xml_path), external_data=True, dedup=True
+        )
+        gen.generate_html(str(out), external_data=True)
+        data_dir = tmp_path / "reportlens-data"
+        assert (data_dir / BLOCKS_NAME).exists()
+        assert BLOCKS_NAME in (data_dir / "manifest.sha256").read_text("utf-8")
+        assert '"dedup": true' in out.read_text(encoding="utf-8")
+        assert "Deduplicated data:" in capsys.readouterr().out
@@ -1,9 +1,25 @@
 """Tests for RobotFrameworkReportGenerator."""
 
+import base64
 import gzip
+import hashlib
 import json
+import os
+import re
 
+import pytest
+
+from robotframework_reportlens import generator as generator_module
+from robotframework_reportlens.builder import build_report_model
+from robotframework_reportlens.dedup import BlockStore
 from robotframework_reportlens.generator import RobotFrameworkReportGenerator
+from robotframework_reportlens.manifest import (
+    CompressionPolicy,
+    DataDirWriter,
+    ShardPacker,
+    file_kind,
+)
+from robotframework_reportlens.serialize import external_data_files
 
 
 class TestErrorFilePath:
@@ -119,6 +135,11 @@ class TestReportGeneratorParsing:
         assert "documentation" in passing
         assert "A passing test" in passing["documentation"]
 
+    def test_dropped_messages_below_custom_level(self, nested_suites_xml_path, capsys):
+        """A min_log_level between the named levels is printed as its number."""
+        RobotFrameworkReportGenerator(nested_suites_xml_path, min_log_level=25)
+        assert "below 25 (TRACE: 12, DEBUG: 5)" in capsys.readouterr().out
+
 
 class TestGenerateHtml:
     """Tests for HTML generation."""
@@ -185,6 +206,7 @@ class TestExternalDataMode:
         assert data_dir.exists()
         assert (data_dir / "summary.json").exists()
         assert (data_dir / "suites.json").exists()
+        assert (data_dir / "search.json").exists()
         summary = json.loads((data_dir / "summary.json").read_text(encoding="utf-8"))
         suites = json.loads((data_dir / "suites.json").read_text(encoding="utf-8"))
         root_id = suites.get("rootSuiteId")
@@ -443,6 +465,154 @@ class TestCompressedExternalDataMode:
         )
 
 
+class TestCompressedSelfContainedReport:
+    """Tests for --compress-data without --external-data (gzip+base64 payload)."""
+
+    def _payload(self, html):
+        start = html.find('id="report-data">') + len('id="report-data">')
+        return html[start : html.find("</script>", start)]
+
+    def test_payload_is_base64_gzip_of_plain_payload(self, minimal_xml_path, tmp_path):
+        plain = tmp_path / "plain.html"
+        packed = tmp_path / "compressed.html"
+        RobotFrameworkReportGenerator(minimal_xml_path).generate_html(str(plain))
+        RobotFrameworkReportGenerator(
+            minimal_xml_path, compress_data=True
+        ).generate_html(str(packed))
+        content = packed.read_text(encoding="utf-8")
+        assert '"compressed": true' in content
+        text = gzip.decompress(base64.b64decode(self._payload(content)))
+        expected = self._payload(plain.read_text(encoding="utf-8"))
+        assert json.loads(text) == json.loads(expected.replace("<\\/", "</"))
+
+    def test_compressed_report_boots(
+        self, control_structures_xml_path, tmp_path, boot_report
+    ):
+        plain = tmp_path / "plain.html"
+        packed = tmp_path / "compressed.html"
+        RobotFrameworkReportGenerator(control_structures_xml_path).generate_html(
+            str(plain)
+        )
+        RobotFrameworkReportGenerator(
+            control_structures_xml_path, compress_data=True, string_table=True
+        ).generate_html(str(packed))
+        assert packed.stat().st_size < plain.stat().st_size
+        booted = boot_report(packed)
+        assert booted["errors"] == []
+        assert booted["html"] == boot_report(plain)["html"]
+
+
+class TestSplitPayload:
+    """Tests for self-contained reports with per-file embedded data (--split-payload)."""
+
+    def _embedded(self, html):
+        files = dict(
+            re.findall(
+                r'<script type="application/json" id="rl:([^"]+)">(.*?)</script>',
+                html,
+                re.DOTALL,
+            )
+        )
+        return {
+            name: json.loads(
+                text
+                if text.startswith("{")
+                else gzip.decompress(base64.b64decode(text))
+            )
+            for name, text in files.items()
+        }
+
+    @pytest.mark.parametrize(
+        "options", [{}, {"compress_data": True}, {"dedup": True, "columnar": True}]
+    )
+    def test_embeds_external_data_files(
+        self, control_structures_xml_path, tmp_path, options
+    ):
+        out = tmp_path / "report.html"
+        gen = RobotFrameworkReportGenerator(
+            control_structures_xml_path, split_payload=True, **options
+        )
+        gen.generate_html(str(out))
+        html = out.read_text(encoding="utf-8")
+        assert 'id="report-data"' not in html
+        assert '"embeddedData": true' in html and '"externalData": true' in html
+        expected = external_data_files(
+            gen._model,
+            columnar=options.get("columnar", False),
+            blocks=BlockStore(gen._model) if options.get("dedup") else None,
+        )
+        assert self._embedded(html) == json.loads(json.dumps(dict(expected)))
+        assert not (tmp_path / "reportlens-data").exists()
+
+    def test_split_report_boots(self, nested_suites_xml_path, tmp_path, boot_report):
+        out = tmp_path / "report.html"
+        RobotFrameworkReportGenerator(
+            nested_suites_xml_path, split_payload=True
+        ).generate_html(str(out))
+        booted = boot_report(out)
+        assert booted["errors"] == []
+        assert 'data-test-id="s1-s1-s1-t1"' in booted["html"]
+
+
+class TestDataWorker:
+    """Data files decoded in the report's Web Worker render like main-thread decoding."""
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"compress_data": True},
+            {"split_payload": True},
+            {
+                "split_payload": True,
+                "compress_data": True,
+                "string_table": True,
+                "columnar": True,
+                "dedup": True,
+            },
+        ],
+    )
+    def test_worker_renders_same_markup(
+        self, nested_suites_xml_path, tmp_path, boot_report, options
+    ):
+        out = tmp_path / "report.html"
+        RobotFrameworkReportGenerator(nested_suites_xml_path, **options).generate_html(
+            str(out)
+        )
+        booted = boot_report(out, worker=True)
+        assert booted["errors"] == []
+        assert 'data-test-id="s1-s1-s1-t1"' in booted["html"]
+        assert booted["html"] == boot_report(out)["html"]
+
+
+class TestVirtualTestTree:
+    """The sidebar test tree only renders the rows around its viewport."""
+
+    def test_large_suite_renders_a_window_of_rows(self, tmp_path, boot_report):
+        status = '<status status="{}" start="2026-01-31T12:00:01" elapsed="0.001"/>'
+        tests = "".join(
+            f'<test id="s1-t{i}" name="Test {i}">{status.format("FAIL" if i == 1 else "PASS")}</test>'
+            for i in range(1, 1001)
+        )
+        xml = tmp_path / "output.xml"
+        xml.write_text(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<robot generator="Robot 7.0" rpa="false" schemaversion="5">'
+            f'<suite id="s1" name="Many" source="many.robot">{tests}{status.format("FAIL")}</suite>'
+            "</robot>",
+            encoding="utf-8",
+        )
+        out = tmp_path / "report.html"
+        RobotFrameworkReportGenerator(xml).generate_html(str(out))
+        booted = boot_report(out)
+        assert booted["errors"] == []
+        html = booted["html"]
+        # The failed suite is expanded: its row and 1000 test rows make up the tree height
+        assert 'class="tree-window" style="height: 32032px; padding-top: 0px"' in html
+        assert 'data-test-id="s1-t1"' in html
+        assert 0 < html.count('class="tree-row"') <= 50
+        assert 'data-test-id="s1-t1000"' not in html
+
+
 class TestCompactSerialiserGuards:
     """Regression tests: compact serialisation omits empty arrays/falsy fields.
     The JS template must guard every suite/test field access with || [] / || "".
@@ -497,3 +667,257 @@ class TestCompactSerialiserGuards:
         # The JS must cope; we verify the keys are either absent or valid lists.
         assert root.get("tests") is None or isinstance(root.get("tests"), list)
         assert root.get("suites") is None or isinstance(root.get("suites"), list)
+
+
+class TestIncrementalExternalData:
+    """Tests for the reportlens-data manifest and --incremental regeneration."""
+
+    def _generate(self, xml_path, tmp_path, incremental=True, compress=False):
+        gen = RobotFrameworkReportGenerator(
+            xml_path, compress_data=compress, incremental=incremental
+        )
+        gen.generate_html(str(tmp_path / "report.html"), external_data=True)
+        return tmp_path / "reportlens-data"
+
+    def _manifest(self, data_dir):
+        lines = (data_dir / "manifest.sha256").read_text(encoding="utf-8").splitlines()
+        return {name: digest for digest, name in (ln.split("  ") for ln in lines)}
+
+    def test_manifest_lists_every_data_file(self, minimal_xml_path, tmp_path):
+        data_dir = self._generate(minimal_xml_path, tmp_path, incremental=False)
+        manifest = self._manifest(data_dir)
+        files = {f.name for f in data_dir.iterdir()} - {"manifest.sha256"}
+        assert set(manifest) == files
+        assert list(manifest) == sorted(manifest)
+        for name, digest in manifest.items():
+            assert hashlib.sha256((data_dir / name).read_bytes()).hexdigest() == digest
+
+    def test_unchanged_files_are_not_rewritten(
+        self, control_structures_xml_path, tmp_path, capsys
+    ):
+        data_dir = self._generate(control_structures_xml_path, tmp_path, compress=True)
+        for f in data_dir.iterdir():
+            os.utime(f, (0, 0))
+        self._generate(control_structures_xml_path, tmp_path, compress=True)
+        assert all(
+            f.stat().st_mtime == 0
+            for f in data_dir.iterdir()
+            if f.name != "manifest.sha256"
+        )
+        assert "Incremental data: 0 written" in capsys.readouterr().out
+
+    def test_changed_and_stale_files(
+        self, control_structures_xml_path, minimal_xml_path, tmp_path
+    ):
+        data_dir = self._generate(control_structures_xml_path, tmp_path)
+        before = self._manifest(data_dir)
+        gen = RobotFrameworkReportGenerator(minimal_xml_path, incremental=True)
+        gen.generate_html(str(tmp_path / "report.html"), external_data=True)
+        after = self._manifest(data_dir)
+        # Files from the previous run that are not produced any more are deleted
+        files = {f.name for f in data_dir.iterdir()} - {"manifest.sha256"}
+        assert files == set(after)
+        assert set(before) - set(after)
+        assert all(not (data_dir / name).exists() for name in set(before) - set(after))
+
+
+class TestParallelDataWriter:
+    """Tests for writing external-data files with a thread pool (--jobs)."""
+
+    def _write(self, xml_path, data_dir, jobs):
+        model = build_report_model(xml_path)
+        writer = DataDirWriter(data_dir, compress=True, jobs=jobs)
+        for name, data in external_data_files(model):
+            writer.write_json(name, data)
+        writer.finish()
+        return {f.name: f.read_bytes() for f in data_dir.iterdir()}
+
+    def test_output_does_not_depend_on_jobs(self, nested_suites_xml_path, tmp_path):
+        (tmp_path / "serial").mkdir()
+        (tmp_path / "parallel").mkdir()
+        serial = self._write(nested_suites_xml_path, tmp_path / "serial", jobs=1)
+        parallel = self._write(nested_suites_xml_path, tmp_path / "parallel", jobs=4)
+        assert parallel == serial
+
+    def test_worker_errors_are_raised_by_finish(self, tmp_path):
+        writer = DataDirWriter(tmp_path / "missing", jobs=2)
+        writer.write_json("a.json", {"x": 1})
+        with pytest.raises(FileNotFoundError):
+            writer.finish()
+
+    def test_generator_passes_jobs_to_writer(
+        self, minimal_xml_path, tmp_path, monkeypatch
+    ):
+        seen = []
+        original = generator_module.DataDirWriter
+
+        def recording_writer(*args, **kwargs):
+            seen.append(kwargs["jobs"])
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(generator_module, "DataDirWriter", recording_writer)
+        monkeypatch.setattr(generator_module.os, "cpu_count", lambda: 2)
+        gen = RobotFrameworkReportGenerator(minimal_xml_path, jobs=3)
+        gen.generate_html(str(tmp_path / "report.html"), external_data=True)
+        assert seen == [2]
+
+
+class TestPackedExternalData:
+    """Tests for packing test and logs records into tests_<n>.pack shards (--packed)."""
+
+    def _generate(self, xml_path, out_dir, packed, compress=False, shard_bytes=4000):
+        gen = RobotFrameworkReportGenerator(
+            xml_path, compress_data=compress, packed=packed, shard_bytes=shard_bytes
+        )
+        gen.generate_html(str(out_dir / "report.html"), external_data=True)
+        return out_dir / "reportlens-data"
+
+    def _read(self, path, compress):
+        data = path.read_bytes()
+        return json.loads(gzip.decompress(data) if compress else data)
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_records_match_per_test_files(
+        self, control_structures_xml_path, tmp_path, compress
+    ):
+        suffix = ".gz" if compress else ""
+        files_dir = self._generate(
+            control_structures_xml_path, tmp_path / "files", False, compress
+        )
+        packed_dir = self._generate(
+            control_structures_xml_path, tmp_path / "packed", True, compress
+        )
+        assert not list(packed_dir.glob("test_*"))
+        suites = self._read(packed_dir / f"suites.json{suffix}", compress)
+        assert len(suites["shards"]) > 1
+        test_ids = [tid for s in suites["suites"] for tid in s["testIds"]]
+        assert sorted(suites["testIndex"]) == sorted(test_ids)
+        for test_id, entry in suites["testIndex"].items():
+            shard = (packed_dir / suites["shards"][entry[0]]).read_bytes()
+            for name, (offset, length) in [
+                (f"test_{test_id}.json", entry[1:3]),
+                (f"test_{test_id}_logs.json", entry[3:5]),
+            ]:
+                record = shard[offset : offset + length]
+                record = gzip.decompress(record) if compress else record
+                expected = self._read(files_dir / f"{name}{suffix}", compress)
+                assert json.loads(record) == expected
+
+    def test_html_config_marks_packed(self, minimal_xml_path, tmp_path):
+        self._generate(minimal_xml_path, tmp_path, True)
+        html = (tmp_path / "report.html").read_text(encoding="utf-8")
+        assert '"packed": true' in html
+
+    def test_shards_close_at_shard_size(self, tmp_path):
+        writer = DataDirWriter(tmp_path)
+        packer = ShardPacker(writer, shard_bytes=30)
+        first = packer.add(
+            ("test_a.json", {"a": "x" * 10}), ("test_a_logs.json", {"b": 1})
+        )
+        second = packer.add(("test_c.json", {"c": "y" * 10}))
+        packer.finish()
+        # Records added together share a shard even when they exceed the size
+        assert first == [0, 0, 19, 19, 8]
+        assert second == [1, 0, 19]
+        assert packer.shards == ["tests_0.pack", "tests_1.pack"]
+        assert (tmp_path / "tests_1.pack").read_bytes() == b'{"c": "yyyyyyyyyy"}'
+
+    def test_records_encoded_in_writer_pool(self, nested_suites_xml_path, tmp_path):
+        """Records encoded by writer threads land at the same offsets as serially."""
+        model = build_report_model(nested_suites_xml_path)
+        results = []
+        for jobs in (1, 4):
+            data_dir = tmp_path / str(jobs)
+            data_dir.mkdir()
+            writer = DataDirWriter(data_dir, compress=True, jobs=jobs)
+            packer = ShardPacker(writer, shard_bytes=2000)
+            index = [
+                packer.add((name, data))
+                for name, data in external_data_files(model)
+                if name.startswith("test_")
+            ]
+            packer.finish()
+            writer.finish()
+            files = {f.name: f.read_bytes() for f in data_dir.iterdir()}
+            results.append((index, packer.shards, files))
+        assert len(results[0][1]) > 1
+        assert results[1] == results[0]
+
+
+class TestCompressionPolicy:
+    """Tests for per-kind gzip levels and the minimum size to compress."""
+
+    def test_file_kinds(self):
+        assert file_kind("summary.json") == "summary"
+        assert file_kind("suites.json.gz") == "suites"
+        assert file_kind("suite_s1-s2.json") == "suite"
+        assert file_kind("test_s1-t1.json") == "test"
+        assert file_kind("test_s1-t1_logs.json") == "logs"
+        assert file_kind("search.json") == "search"
+
+    def test_level_for(self):
+        policy = CompressionPolicy(level=6, min_bytes=100, kind_levels={"test": 0})
+        assert policy.level_for("logs", 99) == 0
+        assert policy.level_for("logs", 100) == 6
+        assert policy.level_for("test", 5000) == 0
+        assert CompressionPolicy().level_for("test", 1) == 9
+
+    def test_small_files_stay_plain_and_manifest_tells(
+        self, control_structures_xml_path, tmp_path
+    ):
+        policy = CompressionPolicy(level=1, min_bytes=600, kind_levels={"suites": 0})
+        gen = RobotFrameworkReportGenerator(
+            control_structures_xml_path, compress_data=True, compression=policy
+        )
+        gen.generate_html(str(tmp_path / "report.html"), external_data=True)
+        data_dir = tmp_path / "reportlens-data"
+        names = {f.name for f in data_dir.iterdir()} - {"manifest.sha256"}
+        plain = {n for n in names if n.endswith(".json")}
+        gz = names - plain
+        assert "suites.json" in plain and plain - {"suites.json"} and gz
+        assert all((data_dir / n).stat().st_size < 600 for n in plain - {"suites.json"})
+        for name in gz:
+            content = (data_dir / name).read_bytes()
+            assert len(gzip.decompress(content)) >= 600
+            assert content[8] == 4  # gzip XFL: fastest compression (level 1)
+        manifest = (data_dir / "manifest.sha256").read_text(encoding="utf-8")
+        assert {line[66:] for line in manifest.splitlines()} == names
+        html = (tmp_path / "report.html").read_text(encoding="utf-8")
+        assert '"mixedCompression": true' in html
+
+    def test_default_policy_is_not_mixed(self, minimal_xml_path, tmp_path):
+        gen = RobotFrameworkReportGenerator(minimal_xml_path, compress_data=True)
+        gen.generate_html(str(tmp_path / "report.html"), external_data=True)
+        html = (tmp_path / "report.html").read_text(encoding="utf-8")
+        assert '"mixedCompression"' not in html
+
+    def test_all_plain_files_are_not_flagged_compressed(
+        self, minimal_xml_path, tmp_path
+    ):
+        """A policy that keeps every file plain writes a report that fetches .json."""
+        policy = CompressionPolicy(min_bytes=100_000_000)
+        gen = RobotFrameworkReportGenerator(
+            minimal_xml_path, compress_data=True, compression=policy
+        )
+        gen.generate_html(str(tmp_path / "report.html"), external_data=True)
+        names = {f.name for f in (tmp_path / "reportlens-data").iterdir()}
+        assert not any(n.endswith(".gz") for n in names)
+        html = (tmp_path / "report.html").read_text(encoding="utf-8")
+        assert '"compressed"' not in html
+        assert '"mixedCompression"' not in html
+
+    def test_plain_json_with_compressed_records_is_mixed(
+        self, minimal_xml_path, tmp_path
+    ):
+        """Plain JSON files next to gzip packed records still list .gz files per manifest."""
+        json_kinds = ("summary", "suites", "suite", "search")
+        policy = CompressionPolicy(kind_levels=dict.fromkeys(json_kinds, 0))
+        gen = RobotFrameworkReportGenerator(
+            minimal_xml_path, compress_data=True, compression=policy, packed=True
+        )
+        gen.generate_html(str(tmp_path / "report.html"), external_data=True)
+        names = {f.name for f in (tmp_path / "reportlens-data").iterdir()}
+        assert not any(n.endswith(".gz") for n in names)
+        html = (tmp_path / "report.html").read_text(encoding="utf-8")
+        assert '"compressed": true' in html
+        assert '"mixedCompression": true' in html
@@ -0,0 +1,80 @@
+"""Tests for building one report from several output.xml files."""
+
+import pytest
+from robot.api import ExecutionResult
+from robot.errors import DataError
+
+from robotframework_reportlens.builder import _LEVELS, _all_tests, build_report_model
+from robotframework_reportlens.merge import build_shard_models, merge_report_models
+
+
+def _structure(suite):
+    """IDs, full names, statuses and statistics of a suite tree (messages left out)."""
+    return (
+        suite.id,
+        suite.full_name,
+        suite.status,
+        suite.statistics,
+        suite.setup.id if suite.setup else None,
+        [
+            (t.id, t.full_name, t.status, [kw.id for kw in t.keywords])
+            for t in suite.tests
+        ],
+        [_structure(s) for s in suite.suites],
+    )
+
+
+def _rebot_model(tmp_path, paths, merge):
+    # Same directory name as the shards, so both roots get the same project name
+    output = tmp_path / "fixtures" / "output.xml"
+    output.parent.mkdir()
+    ExecutionResult(*paths, merge=merge).save(str(output))
+    return build_report_model(str(output), _LEVELS["TRACE"])
+
+
+class TestMergeReportModels:
+    def test_combine_matches_rebot(self, shard_xml_paths, tmp_path):
+        shards = shard_xml_paths[:2]
+        model = merge_report_models(build_shard_models(shards, _LEVELS["TRACE"]))
+        expected = _rebot_model(tmp_path, shards, merge=False)
+        assert model.root_name == "Shards & Shards"
+        assert _structure(model.root_suite) == _structure(expected.root_suite)
+        assert model.statistics == expected.statistics
+
+    def test_merge_matches_rebot(self, shard_xml_paths, tmp_path):
+        model = merge_report_models(
+            build_shard_models(shard_xml_paths, _LEVELS["TRACE"]), merge=True
+        )
+        expected = _rebot_model(tmp_path, shard_xml_paths, merge=True)
+        assert model.root_name == "Shards"
+        assert _structure(model.root_suite) == _structure(expected.root_suite)
+        assert model.statistics == expected.statistics
+
+    def test_merge_latest_result_wins_unless_skipped(self, shard_xml_paths):
+        model = merge_report_models(
+            build_shard_models(shard_xml_paths, _LEVELS["TRACE"]), merge=True
+        )
+        tests = {t.name: t for t in _all_tests(model.root_suite)}
+        flaky = tests["Alpha Flaky"]
+        assert flaky.status == "PASS"
+        assert flaky.message.startswith("Test has been re-executed and results merged.")
+        assert "New status: PASS" in flaky.message
+        assert "Old status: FAIL\nOld message: no != ok" in flaky.message
+        skipped = tests["Alpha Skipped On Rerun"]
+        assert skipped.status == "FAIL"
+        assert "Latter result had SKIP status and was ignored" in skipped.message
+        assert skipped.message.endswith("Original message:\nfirst failure")
+
+    def test_parallel_shard_builds(self, shard_xml_paths):
+        serial = build_shard_models(shard_xml_paths, _LEVELS["TRACE"])
+        parallel = build_shard_models(shard_xml_paths, _LEVELS["TRACE"], jobs=2)
+        assert parallel == serial
+
+    def test_merge_rejects_different_root_suites(
+        self, shard_xml_paths, minimal_xml_path
+    ):
+        models = build_shard_models(
+            [shard_xml_paths[0], minimal_xml_path], _LEVELS["TRACE"]
+        )
+        with pytest.raises(DataError, match="different root suites"):
+            merge_report_models(models, merge=True)
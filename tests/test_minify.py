@@ -0,0 +1,77 @@
+"""Tests for the minified report template (--minify)."""
+
+from pathlib import Path
+
+import pytest
+
+from robotframework_reportlens.assets import ReportTemplate
+from robotframework_reportlens.generator import RobotFrameworkReportGenerator
+from robotframework_reportlens.minify import minify_css, minify_javascript
+
+FIXTURES = sorted((Path(__file__).resolve().parent / "fixtures").glob("*.xml"))
+
+
+class TestMinifyJavascript:
+    """Tests for minify_javascript."""
+
+    def test_strips_comments_and_indentation(self):
+        js = "  // setup\n  const a = 1;  /* one */\n\n  if (a > 0) {\n    run(a);\n  }\n"
+        assert minify_javascript(js) == "const a=1;\nif(a>0){\nrun(a);\n}"
+
+    def test_keeps_literals_verbatim(self):
+        js = (
+            'const s = "a  // b";\n'
+            "const r = text.replace(/ +\\/\\* x/g, ' ');\n"
+            "const t = `<p>  ${ items.map(i => `<b> ${i} </b>`).join(' ') }  </p>`;\n"
+        )
+        assert minify_javascript(js) == (
+            'const s="a  // b";\n'
+            "const r=text.replace(/ +\\/\\* x/g,' ');\n"
+            "const t=`<p>  ${items.map(i=>`<b> ${i} </b>`).join(' ')}  </p>`;"
+        )
+
+    def test_keeps_required_spaces(self):
+        js = "return typeof a === 'x' ? a + +b : a - -b;\nconst y = x / 2 / z;\n"
+        assert minify_javascript(js) == (
+            "return typeof a==='x'?a+ +b:a- -b;\nconst y=x / 2 / z;"
+        )
+
+
+class TestMinifyCss:
+    """Tests for minify_css."""
+
+    def test_strips_comments_and_whitespace(self):
+        css = "/* theme */\n.a > .b ,\n.c {\n  color : red;\n  margin: 0 auto;\n}\n"
+        assert minify_css(css) == ".a>.b,.c{color :red;margin:0 auto}"
+
+    def test_keeps_strings_and_descendant_pseudo_selectors(self):
+        css = '.a :hover { content: "  x  "; width: calc(100% - 2px); }'
+        assert minify_css(css) == '.a :hover{content:"  x  ";width:calc(100% - 2px)}'
+
+
+class TestMinifiedTemplate:
+    """Tests for the minified report template."""
+
+    def test_minified_template_is_smaller_and_cached(self):
+        template = ReportTemplate.load()
+        minified = ReportTemplate.load(minify=True)
+        assert minified is ReportTemplate.load(minify=True)
+        assert len(minified.css) < 0.8 * len(template.css)
+        assert len(minified.javascript) < 0.85 * len(template.javascript)
+        assert "// ==========" not in minified.javascript
+
+    @pytest.mark.parametrize("xml_path", FIXTURES, ids=lambda p: p.stem)
+    def test_minified_report_boots(self, tmp_path, xml_path, boot_report):
+        """The minified report renders exactly what the unminified one does."""
+        plain = tmp_path / "plain.html"
+        minified = tmp_path / "minified.html"
+        RobotFrameworkReportGenerator(str(xml_path)).generate_html(str(plain))
+        RobotFrameworkReportGenerator(str(xml_path), minify=True).generate_html(
+            str(minified)
+        )
+        assert minified.stat().st_size < plain.stat().st_size
+        expected = boot_report(plain)
+        booted = boot_report(minified)
+        assert booted["errors"] == []
+        assert 'class="test-tree' in booted["html"]
+        assert booted["html"] == expected["html"]
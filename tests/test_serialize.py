@@ -1,7 +1,23 @@
 """Tests for the report model serializer."""
 
+import base64
+import gzip
+import io
+import json
+from dataclasses import replace
+
+import pytest
+
 from robotframework_reportlens.builder import build_report_model
-from robotframework_reportlens.serialize import model_to_payload
+from robotframework_reportlens.serialize import (
+    _assign_errors_to_suites_and_tests,
+    _collect_keyword_messages,
+    external_data_files,
+    model_to_payload,
+    write_payload_gzip_base64,
+    write_payload_json,
+)
+from robotframework_reportlens.timestamps import Timestamps
 
 
 class TestModelToPayload:
@@ -92,3 +108,343 @@ class TestModelToPayload:
 
         levels = list(collect_levels(model.root_suite.tests))
         assert "TRACE" not in levels
+
+
+class TestAssignErrors:
+    """Tests for _assign_errors_to_suites_and_tests."""
+
+    def test_errors_assigned_by_resolved_source(self, tmp_path):
+        a = tmp_path / "a.robot"
+        b = tmp_path / "b.robot"
+        root = {
+            "source": str(tmp_path),
+            "suites": [
+                {"source": str(a), "tests": [{"id": "s1-s1-t1"}]},
+                {"source": str(b), "tests": [{"id": "s1-s2-t1"}]},
+            ],
+        }
+        errors = [
+            {
+                "time": "t1",
+                "level": "error",
+                "text": f"Error in file '{a}' on line 2: x",
+            },
+            {
+                "text": f"Error in file '{tmp_path / 'sub' / '..' / 'a.robot'}' on line 5: y"
+            },
+            {"level": "WARN", "text": "Not related to a file"},
+        ]
+        _assign_errors_to_suites_and_tests(root, errors)
+        suite_a, suite_b = root["suites"]
+        assert [e["text"][-1] for e in suite_a["errors"]] == ["x", "y"]
+        assert suite_a["errors"][0] == {
+            "time": "t1",
+            "level": "ERROR",
+            "text": errors[0]["text"],
+        }
+        assert suite_a["tests"][0]["suiteErrors"] == suite_a["errors"]
+        assert suite_b["errors"] == [] and suite_b["tests"][0]["suiteErrors"] == []
+        assert root["errors"] == []
+
+    def test_suites_not_resolved_without_file_errors(self, monkeypatch):
+        def fail(self, *args, **kwargs):
+            raise AssertionError("no suite source needs resolving")
+
+        monkeypatch.setattr("pathlib.Path.resolve", fail)
+        root = {"source": "/x/a.robot", "tests": [{"id": "s1-t1"}]}
+        _assign_errors_to_suites_and_tests(root, [{"text": "Plain error"}])
+        assert root["errors"] == [] and root["tests"][0]["suiteErrors"] == []
+
+
+class TestWritePayloadJson:
+    """Tests for the streaming JSON serializer."""
+
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            "minimal_xml_path",
+            "control_structures_xml_path",
+            "html_messages_xml_path",
+            "nested_suites_xml_path",
+        ],
+    )
+    def test_same_text_as_json_dumps(self, fixture, request):
+        model = build_report_model(request.getfixturevalue(fixture))
+        buf = io.StringIO()
+        write_payload_json(model, buf)
+        assert buf.getvalue() == json.dumps(model_to_payload(model), ensure_ascii=False)
+
+    def test_script_safe_escapes_closing_script_tags(self, minimal_xml_path):
+        model = build_report_model(minimal_xml_path)
+        test = model.root_suite.tests[0]
+        model.root_suite.tests[0] = replace(test, message="a </script> b </SCRIPT>")
+        buf = io.StringIO()
+        write_payload_json(model, buf, script_safe=True)
+        text = buf.getvalue()
+        assert "</script>" not in text and "</SCRIPT>" not in text
+        payload = json.loads(text)
+        assert payload["rootSuite"]["tests"][0]["message"] == "a </script> b </SCRIPT>"
+
+    def test_gzip_base64_decodes_to_same_text(self, control_structures_xml_path):
+        model = build_report_model(control_structures_xml_path)
+        plain = io.StringIO()
+        write_payload_json(model, plain)
+        packed = io.StringIO()
+        write_payload_gzip_base64(model, packed, level=6)
+        text = packed.getvalue()
+        assert "<" not in text and "\n" not in text
+        assert gzip.decompress(base64.b64decode(text)).decode() == plain.getvalue()
+        again = io.StringIO()
+        write_payload_gzip_base64(model, again, level=6)
+        assert again.getvalue() == text
+
+
+class TestExternalDataFiles:
+    """Tests for the single-pass external-data pipeline."""
+
+    def test_yields_every_file_once(self, nested_suites_xml_path):
+        model = build_report_model(nested_suites_xml_path)
+        names = [name for name, _ in external_data_files(model)]
+        assert names[0] == "summary.json" and names[-2:] == [
+            "search.json",
+            "suites.json",
+        ]
+        assert len(names) == len(set(names))
+        payload = model_to_payload(model)
+        expected = set()
+
+        def walk(suite):
+            expected.add(f"suite_{suite['id']}.json")
+            for t in suite.get("tests", []):
+                expected.update({f"test_{t['id']}.json", f"test_{t['id']}_logs.json"})
+            for child in suite.get("suites", []):
+                walk(child)
+
+        walk(payload["rootSuite"])
+        assert set(names[1:-2]) == expected
+
+    def test_logs_and_suite_errors_match_payload(self, control_structures_xml_path):
+        model = build_report_model(control_structures_xml_path)
+        files = dict(external_data_files(model))
+        payload = model_to_payload(model)
+        stamps = Timestamps(model.utc_offset)
+        for test in model.root_suite.tests:
+            log_map = {}
+            for kw in test.keywords:
+                _collect_keyword_messages(kw, log_map, stamps)
+            assert files[f"test_{test.id}_logs.json"]["keywordMessages"] == log_map
+            assert '"messages": ' not in json.dumps(files[f"test_{test.id}.json"])
+        root = payload["rootSuite"]
+        suite_file = files[f"suite_{root['id']}.json"]
+        assert suite_file["suite"]["errors"] == root["errors"]
+        assert files["summary.json"]["statistics"] == payload["statistics"]
+
+
+def _resolve_keyword(kw, strings):
+    """Undo the string table in a keyword dict (what the frontend does)."""
+    if not kw:
+        return
+    for key in ("name", "type", "status", "documentation", "failMessage", "badge"):
+        if key in kw:
+            kw[key] = strings[kw[key]]
+    for key in ("arguments", "returnValues"):
+        if key in kw:
+            kw[key] = [strings[i] for i in kw[key]]
+    _resolve_messages(kw.get("messages", ()), strings)
+    for child in kw.get("keywords", ()):
+        _resolve_keyword(child, strings)
+
+
+def _resolve_messages(messages, strings):
+    for msg in messages:
+        for key in ("level", "message"):
+            if key in msg:
+                msg[key] = strings[msg[key]]
+
+
+def _resolve_suite(suite, strings):
+    for test in suite.get("tests", ()):
+        for kw in [*test.get("keywords", ()), test.get("setup"), test.get("teardown")]:
+            _resolve_keyword(kw, strings)
+    for child in suite.get("suites", ()):
+        _resolve_suite(child, strings)
+    _resolve_keyword(suite.get("setup"), strings)
+    _resolve_keyword(suite.get("teardown"), strings)
+
+
+class TestStringTable:
+    """Tests for schemaVersion 2 (string table) payloads."""
+
+    def test_resolves_to_plain_payload(self, control_structures_xml_path):
+        model = build_report_model(control_structures_xml_path)
+        payload = model_to_payload(model, string_table=True)
+        assert payload["schemaVersion"] == 2
+        strings = payload.pop("strings")
+        assert len(strings) == len(set(strings))
+        kw = payload["rootSuite"]["tests"][0]["keywords"][0]
+        assert isinstance(kw["name"], int)
+        del payload["schemaVersion"]
+        _resolve_suite(payload["rootSuite"], strings)
+        assert json.dumps(payload) == json.dumps(model_to_payload(model))
+
+    def test_streamed_text_matches(self, nested_suites_xml_path):
+        model = build_report_model(nested_suites_xml_path)
+        buf = io.StringIO()
+        write_payload_json(model, buf, string_table=True)
+        expected = model_to_payload(model, string_table=True)
+        assert buf.getvalue() == json.dumps(expected, ensure_ascii=False)
+
+    def test_external_files_carry_own_table(self, control_structures_xml_path):
+        model = build_report_model(control_structures_xml_path)
+        plain = dict(external_data_files(model))
+        for name, data in external_data_files(model, string_table=True):
+            if "strings" in data:
+                strings = data.pop("strings")
+                _resolve_suite({"suites": [data.get("suite", {})]}, strings)
+                _resolve_suite({"tests": [data.get("test", {})]}, strings)
+                for messages in data.get("keywordMessages", {}).values():
+                    _resolve_messages(messages, strings)
+                data["schemaVersion"] = 1
+                assert json.dumps(data) == json.dumps(plain[name])
+
+
+def _decode_columns(table, derive):
+    """Row dicts of a columnar table (what the frontend does)."""
+    rows = []
+    for i in range(table["count"]):
+        row = {}
+        for field, values in table["columns"].items():
+            if field == "status":
+                row[field] = table["statuses"][values[i]]
+            elif isinstance(values, dict):
+                row[field] = {k: v[i] for k, v in values.items()}
+            else:
+                row[field] = values[i]
+        derive(row)
+        rows.append(row)
+    return rows
+
+
+def _positional(value, prefix):
+    if isinstance(value, int):
+        return [f"{prefix}{n}" for n in range(1, value + 1)]
+    return value
+
+
+class TestColumnarExternalData:
+    """Tests for columnar test stubs and suites index."""
+
+    def _decoded(self, model):
+        files = dict(external_data_files(model, columnar=True))
+        suites = files["suites.json"]
+
+        def derive_suite(row):
+            row["testIds"] = _positional(row["testIds"], row["id"] + "-t")
+            row["childSuiteIds"] = _positional(row["childSuiteIds"], row["id"] + "-s")
+
+        suites["suites"] = _decode_columns(suites.pop("suiteColumns"), derive_suite)
+        for data in files.values():
+            if "testColumns" in data:
+                prefix = data["suite"]["fullName"] + "."
+
+                def derive_test(row, prefix=prefix):
+                    row.setdefault("fullName", prefix + row["name"])
+
+                data["tests"] = _decode_columns(data.pop("testColumns"), derive_test)
+        return files
+
+    @pytest.mark.parametrize(
+        "fixture", ["nested_suites_xml_path", "control_structures_xml_path"]
+    )
+    def test_decodes_to_row_form(self, fixture, request):
+        model = build_report_model(request.getfixturevalue(fixture))
+        rows = dict(external_data_files(model))
+        assert json.dumps(self._decoded(model), sort_keys=True) == json.dumps(
+            rows, sort_keys=True
+        )
+
+    def test_positional_ids_and_full_names_are_derived(self, nested_suites_xml_path):
+        model = build_report_model(nested_suites_xml_path)
+        files = dict(external_data_files(model, columnar=True))
+        columns = files["suites.json"]["suiteColumns"]["columns"]
+        assert all(isinstance(ids, int) for ids in columns["testIds"])
+        assert "passed" in columns["statistics"]
+        suite = model.root_suite.suites[1]
+        suite_file = files[f"suite_{suite.id}.json"]
+        assert "fullName" not in suite_file["testColumns"]["columns"]
+        # Non-positional ids and other full names are stored as they are
+        suite.tests[0].id = "custom"
+        suite.tests[0].full_name = "Elsewhere.Test"
+        files = dict(external_data_files(model, columnar=True))
+        test_ids = files["suites.json"]["suiteColumns"]["columns"]["testIds"]
+        assert ["custom", f"{suite.id}-t2"] in test_ids
+        assert "fullName" in files[f"suite_{suite.id}.json"]["testColumns"]["columns"]
+        rows = dict(external_data_files(model))
+        assert json.dumps(self._decoded(model), sort_keys=True) == json.dumps(
+            rows, sort_keys=True
+        )
+
+
+class TestSearchIndex:
+    """Tests for the search.json test index of external data."""
+
+    def _decoded(self, index):
+        """Test rows of search.json with suite ids, tag names and derived fields."""
+        suite_ids = [
+            suite_id
+            for suite_id, count in zip(index["suiteIds"], index["suiteTestCounts"])
+            for _ in range(count)
+        ]
+        positions = [
+            n for count in index["suiteTestCounts"] for n in range(1, count + 1)
+        ]
+        rows = _decode_columns(index, lambda row: None)
+        for row, suite_id, n in zip(rows, suite_ids, positions):
+            row["suite"] = suite_id
+            row.setdefault("id", f"{suite_id}-t{n}")
+            row["tags"] = [index["tags"][i] for i in row["tags"]]
+        return rows
+
+    def _tests(self, model, full_names=False):
+        tests = []
+        stack = [model.root_suite]
+        while stack:
+            suite = stack.pop()
+            stack.extend(reversed(suite.suites))
+            for t in suite.tests:
+                row = {
+                    "id": t.id,
+                    "name": t.name,
+                    "status": t.status,
+                    "duration": t.duration,
+                    "tags": list(t.tags),
+                    "suite": suite.id,
+                }
+                if full_names:
+                    row["fullName"] = t.full_name
+                tests.append(row)
+        return tests
+
+    @pytest.mark.parametrize(
+        "fixture", ["nested_suites_xml_path", "control_structures_xml_path"]
+    )
+    def test_lists_every_test(self, fixture, request):
+        model = build_report_model(request.getfixturevalue(fixture))
+        index = dict(external_data_files(model))["search.json"]
+        full_names = "fullName" in index["columns"]
+        assert self._decoded(index) == self._tests(model, full_names)
+        assert index["count"] == len(self._decoded(index))
+
+    def test_positional_ids_and_full_names_are_derived(self, nested_suites_xml_path):
+        model = build_report_model(nested_suites_xml_path)
+        index = dict(external_data_files(model))["search.json"]
+        assert set(index["columns"]) == {"name", "status", "duration", "tags"}
+
+    def test_custom_ids_and_full_names_are_stored(self, nested_suites_xml_path):
+        model = build_report_model(nested_suites_xml_path)
+        suite = model.root_suite.suites[1]
+        suite.tests[0].id = "custom"
+        suite.tests[0].full_name = "Elsewhere.Test"
+        index = dict(external_data_files(model, string_table=True))["search.json"]
+        assert index["schemaVersion"] == 2
+        assert self._decoded(index) == self._tests(model, full_names=True)
@@ -0,0 +1,64 @@
+"""Tests for timestamp normalization (epoch microseconds <-> ISO 8601)."""
+
+from datetime import datetime, timedelta, timezone
+
+from robotframework_reportlens.timestamps import Timestamps
+
+# 2026-02-01T14:04:20.902 UTC
+_US = 1769954660902000
+
+
+class TestTimestamps:
+    def test_missing_and_invalid_values_are_none(self):
+        stamps = Timestamps(0)
+        assert stamps.epoch(None) is None
+        assert stamps.epoch("") is None
+        assert stamps.epoch("not a timestamp") is None
+        assert stamps.iso(None) == ""
+
+    def test_legacy_iso_and_datetime_inputs_agree(self):
+        stamps = Timestamps(0)
+        assert stamps.epoch("20260201 14:04:20.902") == _US
+        assert stamps.epoch("2026-02-01T14:04:20.902000") == _US
+        assert stamps.epoch("2026-02-01T14:04:20.902Z") == _US
+        assert stamps.epoch(datetime(2026, 2, 1, 14, 4, 20, 902000)) == _US
+
+    def test_naive_values_use_build_offset(self):
+        stamps = Timestamps(5 * 3600 + 1800)
+        assert stamps.epoch("20260201 19:34:20.902") == _US
+        assert stamps.iso(_US) == "2026-02-01T19:34:20.902000+05:30"
+
+    def test_aware_values_keep_their_offset(self):
+        stamps = Timestamps(0)
+        aware = datetime(
+            2026, 2, 1, 16, 4, 20, 902000, tzinfo=timezone(timedelta(hours=2))
+        )
+        assert stamps.epoch(aware) == _US
+        assert stamps.epoch("2026-02-01T16:04:20.902+02:00") == _US
+
+    def test_iso_round_trip(self):
+        stamps = Timestamps(-7 * 3600)
+        iso = stamps.iso(_US)
+        assert iso.endswith("-07:00")
+        assert stamps.epoch(iso) == _US
+
+    def test_legacy_parses_memoize_days_only(self):
+        """Only the day is memoized; the time of day matches a full datetime parse."""
+        stamps = Timestamps(3600)
+        start = datetime(2026, 2, 1, 23, 59, 0)
+        for i in range(0, 200_000_000, 997_003):
+            dt = start + timedelta(microseconds=i)
+            legacy = dt.strftime("%Y%m%d %H:%M:%S.%f")[:-3]
+            assert stamps.epoch(legacy) == stamps.epoch(
+                dt.replace(microsecond=dt.microsecond // 1000 * 1000)
+            )
+        assert list(stamps._days) == ["20260201", "20260202"]
+        assert stamps.epoch("20260201 24:00:00.000") is None
+        assert stamps.epoch("20260230 12:00:00.000") is None
+        assert stamps.epoch("2026-02-01 14:04:20.902") == Timestamps(0).epoch(
+            datetime(2026, 2, 1, 13, 4, 20, 902000)
+        )
+
+    def test_default_offset_is_local(self):
+        local = datetime.now().astimezone().utcoffset().total_seconds()
+        assert Timestamps().utc_offset == int(local)
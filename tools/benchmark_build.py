@@ -0,0 +1,58 @@
+"""Benchmark report model build time against the number of worker processes.
+
+Usage: python tools/benchmark_build.py <path-to-output-xml> [max-jobs]
+
+Builds the ReportModel with the default (ExecutionResult) builder, then with the
+streaming builder at --jobs 1, 2, 4, ... up to max-jobs (default: CPU count), and
+prints wall time and speed-up relative to the serial streaming build.
+The parallel build splits the run by top-level suites, so scaling is bounded by
+the number (and balance) of top-level suites in the output.
+"""
+
+import os
+import sys
+import time
+
+from robotframework_reportlens.builder import (
+    _LEVELS,
+    build_report_model,
+    stream_report_model,
+)
+
+
+def timed(fn, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def job_counts(max_jobs: int) -> list[int]:
+    counts = [1]
+    while counts[-1] * 2 <= max_jobs:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_jobs:
+        counts.append(max_jobs)
+    return counts
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python tools/benchmark_build.py <output.xml> [max-jobs]")
+        return 2
+    xml = sys.argv[1]
+    max_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    level = _LEVELS["TRACE"]
+    print("Benchmark result:")
+    print("  xml:", xml)
+    print("  xml_bytes:", os.path.getsize(xml))
+    print(f"  default_build_s: {timed(build_report_model, xml, level):.2f}")
+    serial = None
+    for jobs in job_counts(max_jobs):
+        elapsed = timed(stream_report_model, xml, level, jobs=jobs)
+        serial = serial or elapsed
+        print(f"  jobs={jobs}: {elapsed:.2f}s (x{serial / elapsed:.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
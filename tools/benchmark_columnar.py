@@ -0,0 +1,94 @@
+"""Benchmark columnar test stubs and suites index against the row form.
+
+Usage: python tools/benchmark_columnar.py path/to/output.xml
+
+Builds the ReportModel once and derives the external-data files with and without
+columnar=True. For the suite files and suites.json it prints raw and gzip size, the
+json.loads time and the time to turn the columns back into row objects (what the
+frontend does when a suite is expanded).
+"""
+
+import gzip
+import json
+import sys
+import time
+
+from robotframework_reportlens.builder import _LEVELS, build_report_model
+from robotframework_reportlens.serialize import external_data_files
+
+
+def rows(table: dict, derived: dict) -> list[dict]:
+    """Row objects of a columnar table (mirrors decodeColumns in the template)."""
+    columns = table["columns"]
+    statuses = table["statuses"]
+    out = []
+    for i in range(table["count"]):
+        row = {}
+        for field, values in columns.items():
+            if isinstance(values, dict):
+                row[field] = {k: v[i] for k, v in values.items()}
+            elif field == "status":
+                row[field] = statuses[values[i]]
+            else:
+                row[field] = values[i]
+        for field, derive in derived.items():
+            row[field] = derive(row)
+        out.append(row)
+    return out
+
+
+def best_of(fn, texts: list[str], rounds: int = 5) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for text in texts:
+            fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def decode_columnar(text: str) -> None:
+    data = json.loads(text)
+    if "suiteColumns" in data:
+        rows(data["suiteColumns"], {})
+    else:
+        suite = data["suite"]
+        prefix = suite["fullName"] + "."
+        derived = {}
+        if "fullName" not in data["testColumns"]["columns"]:
+            derived["fullName"] = lambda row: prefix + row["name"]
+        rows(data["testColumns"], derived)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python tools/benchmark_columnar.py path/to/output.xml")
+        return 1
+    model = build_report_model(sys.argv[1], _LEVELS["DEBUG"])
+    print("Benchmark result:")
+    results = {}
+    for label, columnar in (("rows", False), ("columnar", True)):
+        texts = [
+            json.dumps(data, ensure_ascii=False)
+            for name, data in external_data_files(model, columnar=columnar)
+            if name.startswith("suite")
+        ]
+        raw = sum(len(t.encode("utf-8")) for t in texts)
+        gz = sum(len(gzip.compress(t.encode("utf-8"), 9, mtime=0)) for t in texts)
+        loads_s = best_of(json.loads, texts)
+        decode_s = best_of(decode_columnar, texts) if columnar else loads_s
+        results[label] = (raw, gz, loads_s, decode_s)
+        print(f"  {label}_files: {len(texts)}")
+        print(f"  {label}_bytes: {raw}")
+        print(f"  {label}_gzip_bytes: {gz}")
+        print(f"  {label}_loads_s: {loads_s:.4f}")
+        if columnar:
+            print(f"  {label}_loads_and_rows_s: {decode_s:.4f}")
+    r, c = results["rows"], results["columnar"]
+    print(f"  size_ratio: {c[0] / r[0]:.2f} (gzip {c[1] / r[1]:.2f})")
+    print(f"  loads_ratio: {c[2] / r[2]:.2f} (with rows {c[3] / r[2]:.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
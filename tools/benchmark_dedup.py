@@ -0,0 +1,63 @@
+"""Benchmark cross-test deduplication of keyword subtrees and message blocks.
+
+Usage: python tools/benchmark_dedup.py path/to/output.xml
+
+Builds the ReportModel once and derives the external-data files with and without a
+BlockStore. Prints the counting pass and serialization time, the raw and gzip size of
+the test and logs files (plus blocks.json) in both forms and the dedup summary line.
+"""
+
+import gzip
+import json
+import sys
+import time
+
+from robotframework_reportlens.builder import _LEVELS, build_report_model
+from robotframework_reportlens.dedup import BLOCKS_NAME, BlockStore
+from robotframework_reportlens.serialize import external_data_files
+
+
+def sizes(files) -> tuple[int, int, int]:
+    raw = gz = count = 0
+    for name, data in files:
+        if not name.startswith("test_") and name != BLOCKS_NAME:
+            continue
+        content = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        raw += len(content)
+        gz += len(gzip.compress(content, 6, mtime=0))
+        count += 1
+    return count, raw, gz
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python tools/benchmark_dedup.py path/to/output.xml")
+        return 1
+    model = build_report_model(sys.argv[1], _LEVELS["DEBUG"])
+    start = time.perf_counter()
+    plain = list(external_data_files(model))
+    plain_s = time.perf_counter() - start
+    start = time.perf_counter()
+    store = BlockStore(model)
+    count_s = time.perf_counter() - start
+    deduped = list(external_data_files(model, blocks=store))
+    dedup_s = time.perf_counter() - start
+    (plain_n, plain_raw, plain_gz) = sizes(plain)
+    (dedup_n, dedup_raw, dedup_gz) = sizes(deduped)
+    print("Benchmark result:")
+    print(f"  {store.summary()}")
+    print(f"  plain_files: {plain_n}")
+    print(f"  plain_bytes: {plain_raw}")
+    print(f"  plain_gzip_bytes: {plain_gz}")
+    print(f"  plain_serialize_s: {plain_s:.3f}")
+    print(f"  dedup_files: {dedup_n} (with {BLOCKS_NAME})")
+    print(f"  dedup_bytes: {dedup_raw}")
+    print(f"  dedup_gzip_bytes: {dedup_gz}")
+    print(f"  dedup_count_pass_s: {count_s:.3f}")
+    print(f"  dedup_serialize_s: {dedup_s:.3f}")
+    print(f"  size_ratio: {dedup_raw / plain_raw:.2f} (gzip {dedup_gz / plain_gz:.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
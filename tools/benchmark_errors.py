@@ -0,0 +1,105 @@
+"""Benchmark assigning execution errors to suites on a synthetic run.
+
+Usage: python tools/benchmark_errors.py [suites] [errors]
+
+Builds a payload-shaped suite tree with *suites* suites (default 3000, 10 tests each)
+and *errors* "Error in file ... on line ..." errors (default 300) spread over the suite
+sources, then times serialize._assign_errors_to_suites_and_tests against the previous
+nested-loop implementation (which resolved every error path once per suite).
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from robotframework_reportlens.serialize import (
+    _assign_errors_to_suites_and_tests,
+    _error_file_path,
+)
+
+
+def nested_loop_assign(suite: dict, errors: list[dict]) -> None:
+    """Reference: the pre-index implementation, O(suites x errors) path resolves."""
+    errors_with_path = []
+    for e in errors:
+        err = {
+            "time": e.get("time", ""),
+            "level": (e.get("level") or "WARN").upper(),
+            "text": e.get("text", ""),
+        }
+        path = _error_file_path(e.get("text", ""))
+        if path:
+            errors_with_path.append((path, err))
+
+    def walk(s: dict) -> None:
+        source = (s.get("source") or "").strip()
+        source_norm = str(Path(source).resolve()) if source else None
+        suite_errors = []
+        if source_norm:
+            for path, err in errors_with_path:
+                try:
+                    path_norm = str(Path(path).resolve())
+                except (OSError, RuntimeError, ValueError):
+                    # Unresolvable path (e.g. symlink loop, NUL byte): compare as given
+                    path_norm = path
+                if path_norm == source_norm:
+                    suite_errors.append(err)
+        s["errors"] = suite_errors
+        for t in s.get("tests", []):
+            t["suiteErrors"] = suite_errors
+        for child in s.get("suites", []):
+            walk(child)
+
+    walk(suite)
+
+
+def synthetic_run(n_suites: int, n_errors: int) -> tuple[dict, list[dict]]:
+    suites = [
+        {
+            "id": f"s1-s{i + 1}",
+            "source": f"/work/project/tests/area_{i % 50}/suite_{i}.robot",
+            "tests": [{"id": f"s1-s{i + 1}-t{j + 1}"} for j in range(10)],
+        }
+        for i in range(n_suites)
+    ]
+    root = {"id": "s1", "source": "/work/project/tests", "suites": suites}
+    errors = [
+        {
+            "time": "2026-02-01T14:04:20.902000+00:00",
+            "level": "ERROR",
+            "text": (
+                f"Error in file '{suites[(k * 7) % n_suites]['source']}' on line 3: "
+                "Importing library 'Missing' failed: ModuleNotFoundError"
+            ),
+        }
+        for k in range(n_errors)
+    ]
+    return root, errors
+
+
+def timed(fn, n_suites: int, n_errors: int) -> tuple[float, dict]:
+    root, errors = synthetic_run(n_suites, n_errors)
+    start = time.perf_counter()
+    fn(root, errors)
+    return time.perf_counter() - start, root
+
+
+def main():
+    n_suites = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    n_errors = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    indexed_s, indexed = timed(_assign_errors_to_suites_and_tests, n_suites, n_errors)
+    nested_s, nested = timed(nested_loop_assign, n_suites, n_errors)
+    assert [s["errors"] for s in indexed["suites"]] == [
+        s["errors"] for s in nested["suites"]
+    ]
+    print("Benchmark result:")
+    print("  suites:", n_suites)
+    print("  errors:", n_errors)
+    print(f"  nested_loop_s: {nested_s:.3f}")
+    print(f"  indexed_s: {indexed_s:.3f}")
+    print(f"  speedup: x{nested_s / indexed_s:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+"""Benchmark the phases of external-data generation.
+
+Usage: python tools/benchmark_external.py path/to/output.xml [--compress]
+
+Builds the ReportModel once, then times deriving the external-data files from it with
+the previous pipeline (model_to_payload twice for the summary and the suite errors, then
+a separate pass per suite/test, walking each test's keywords twice) against the single
+pass of serialize.external_data_files, and finally the encoding and writing phases.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from robotframework_reportlens.builder import _LEVELS, build_report_model
+from robotframework_reportlens.manifest import DataDirWriter, encode_json_file
+from robotframework_reportlens.serialize import (
+    _collect_keyword_messages,
+    _keyword_to_dict,
+    _test_to_dict_without_messages,
+    external_data_files,
+    model_to_payload,
+)
+from robotframework_reportlens.timestamps import Timestamps
+
+
+def previous_pipeline(model) -> list[tuple[str, dict]]:
+    """Reference: the files as derived before the single-pass pipeline."""
+    report_data = model_to_payload(model)
+    payload = model_to_payload(model)
+    stamps = Timestamps(model.utc_offset)
+    suite_errors_map = {}
+    test_suite_errors = {}
+
+    def walk_errors(suite_dict):
+        suite_errors_map[suite_dict.get("id")] = suite_dict.get("errors", [])
+        for t in suite_dict.get("tests", []):
+            test_suite_errors[t.get("id")] = t.get("suiteErrors", [])
+        for child in suite_dict.get("suites", []):
+            walk_errors(child)
+
+    walk_errors(payload["rootSuite"])
+
+    def iter_suites(suite):
+        yield suite
+        for child in suite.suites:
+            yield from iter_suites(child)
+
+    root = model.root_suite
+    files = [
+        (
+            "summary.json",
+            {
+                "generated": report_data.get("generated", ""),
+                "statistics": report_data.get("statistics", {}),
+                "errors": report_data.get("errors", []),
+            },
+        ),
+        (
+            "suites.json",
+            {
+                "suites": [
+                    {"id": s.id, "startTime": stamps.iso(s.start_time)}
+                    for s in iter_suites(root)
+                ]
+            },
+        ),
+    ]
+    for suite in iter_suites(root):
+        files.append(
+            (
+                f"suite_{suite.id}.json",
+                {
+                    "setup": _keyword_to_dict(suite.setup, stamps)
+                    if suite.setup
+                    else None,
+                    "teardown": _keyword_to_dict(suite.teardown, stamps)
+                    if suite.teardown
+                    else None,
+                    "errors": suite_errors_map.get(suite.id, []),
+                },
+            )
+        )
+        for test in suite.tests:
+            test_payload = _test_to_dict_without_messages(test, stamps)
+            test_payload["suiteErrors"] = test_suite_errors.get(test.id, [])
+            files.append((f"test_{test.id}.json", {"test": test_payload}))
+            log_map: dict[str, list[dict]] = {}
+            for kw in test.keywords:
+                _collect_keyword_messages(kw, log_map, stamps)
+            files.append((f"test_{test.id}_logs.json", {"keywordMessages": log_map}))
+    return files
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if not args:
+        print(
+            "Usage: python tools/benchmark_external.py path/to/output.xml [--compress]"
+        )
+        return 1
+    compress = "--compress" in sys.argv
+    build_s, model = timed(build_report_model, args[0], _LEVELS["DEBUG"])
+    previous_s, _ = timed(previous_pipeline, model)
+    single_s, files = timed(lambda m: list(external_data_files(m)), model)
+    suffix = ".gz" if compress else ""
+    encode_s, encoded = timed(
+        lambda fs: [
+            (name + suffix, encode_json_file(name + suffix, data, compress))
+            for name, data in fs
+        ],
+        files,
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = DataDirWriter(Path(tmp), compress=compress)
+
+        def write_all():
+            for name, content in encoded:
+                writer.write_bytes(name, content)
+            writer.finish()
+
+        write_s, _ = timed(write_all)
+    print("Benchmark result:")
+    print("  files:", len(files))
+    print(f"  build_model_s: {build_s:.3f}")
+    print(f"  derive_files_previous_s: {previous_s:.3f}")
+    print(f"  derive_files_single_pass_s: {single_s:.3f}")
+    print(f"  derive_reduction: x{previous_s / single_s:.1f}")
+    print(f"  encode_s: {encode_s:.3f}")
+    print(f"  write_s: {write_s:.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+"""Benchmark memory held by the in-memory ReportModel.
+
+Usage: python tools/benchmark_model_memory.py <path-to-output-xml>
+
+Builds the ReportModel at TRACE level and measures its deep size (every reachable
+object counted once), then converts it to the previous plain-dataclass layout
+(per-instance __dict__, fresh lists for every keyword collection, one level string
+per message) and measures that too. Also prints the traced peak of the build itself.
+"""
+
+import sys
+import time
+import tracemalloc
+from dataclasses import fields, is_dataclass, make_dataclass
+
+from robotframework_reportlens.builder import _LEVELS, build_report_model
+from robotframework_reportlens.model import (
+    Keyword,
+    LogMessage,
+    ReportModel,
+    Suite,
+    Test,
+)
+
+_PLAIN = {
+    cls: make_dataclass(cls.__name__, [(f.name, f.type) for f in fields(cls)])
+    for cls in (LogMessage, Keyword, Test, Suite, ReportModel)
+}
+
+
+def plain_copy(obj):
+    """Copy of obj in the pre-slots model layout."""
+    if is_dataclass(obj):
+        values = {f.name: plain_copy(getattr(obj, f.name)) for f in fields(obj)}
+        if isinstance(obj, LogMessage):
+            # Levels were .upper() results, i.e. a separate string per message
+            values["level"] = "".join(list(obj.level))
+        return _PLAIN[type(obj)](**values)
+    if isinstance(obj, (list, tuple)):
+        return [plain_copy(v) for v in obj]
+    if isinstance(obj, dict):
+        return {k: plain_copy(v) for k, v in obj.items()}
+    return obj
+
+
+def deep_size(root) -> tuple[int, int]:
+    """Total bytes and object count reachable from root, each object counted once."""
+    seen = set()
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or obj is None or isinstance(obj, (bool, type)):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if is_dataclass(obj):
+            if hasattr(obj, "__dict__"):
+                stack.append(obj.__dict__)
+            stack.extend(getattr(obj, f.name) for f in fields(obj))
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+    return total, len(seen)
+
+
+def count_messages(model: ReportModel) -> int:
+    def kw_messages(kw):
+        return len(kw.messages) + sum(kw_messages(c) for c in kw.keywords)
+
+    def suite_messages(suite):
+        total = sum(suite_messages(s) for s in suite.suites)
+        for kw in (suite.setup, suite.teardown):
+            total += kw_messages(kw) if kw else 0
+        for test in suite.tests:
+            for kw in [*test.keywords, test.setup, test.teardown]:
+                total += kw_messages(kw) if kw else 0
+        return total
+
+    return suite_messages(model.root_suite)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python tools/benchmark_model_memory.py <output.xml>")
+        return 2
+    xml = sys.argv[1]
+    tracemalloc.start()
+    start = time.perf_counter()
+    model = build_report_model(xml, _LEVELS["TRACE"])
+    elapsed = time.perf_counter() - start
+    _, build_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    compact_bytes, compact_objects = deep_size(model)
+    plain_bytes, plain_objects = deep_size(plain_copy(model))
+    messages = count_messages(model)
+    print("Benchmark result:")
+    print("  xml:", xml)
+    print(f"  build_s: {elapsed:.2f}")
+    print(f"  build_peak_mb: {build_peak / 1e6:.1f}")
+    print("  messages:", messages)
+    print(f"  compact_model_mb: {compact_bytes / 1e6:.1f} ({compact_objects} objects)")
+    print(f"  dataclass_model_mb: {plain_bytes / 1e6:.1f} ({plain_objects} objects)")
+    print(f"  saving: {1 - compact_bytes / plain_bytes:.1%}")
+    if messages:
+        print(
+            f"  bytes_per_message: {compact_bytes / messages:.0f} vs {plain_bytes / messages:.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,18 +1,25 @@
 """Simple benchmark to generate external-data and report sizes.
 
-Usage: python tools/benchmark_payload.py <path-to-output-xml> [out-dir]
+Usage: python tools/benchmark_payload.py <path-to-output-xml> [out-dir] [--levels]
 
 Generates external-data into out-dir/report.html + reportlens-data/ and prints total size,
 number of test files, avg test payload size, and total messages.
 
+With --levels, also gzips every data file at levels 1-9 and prints, per level, the CPU
+time spent and the bytes saved against plain JSON, and per file kind how many files gzip
+makes larger (the case --compress-min-size avoids).
+
 This is a conservative, fast script intended for local benchmarking.
 """
 
 import sys
+import time
 from pathlib import Path
 import json
 
 from robotframework_reportlens.generator import RobotFrameworkReportGenerator
+from robotframework_reportlens.manifest import FILE_KINDS, file_kind, gzip_bytes
+from robotframework_reportlens.serialize import external_data_files
 
 
 def dir_size(path: Path) -> int:
@@ -37,12 +44,47 @@ def count_messages(data_dir: Path) -> int:
     return total_msgs
 
 
+def compression_levels(model) -> None:
+    """Print CPU time and bytes saved per gzip level over all external-data files."""
+    files = [
+        (name, json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        for name, data in external_data_files(model)
+    ]
+    plain = sum(len(content) for _, content in files)
+    print("Compression levels:")
+    print("  plain_bytes:", plain)
+    growing = dict.fromkeys(FILE_KINDS, 0)
+    for level in range(1, 10):
+        start = time.process_time()
+        sizes = [
+            (name, len(content), len(gzip_bytes(name, content, level)))
+            for name, content in files
+        ]
+        cpu = time.process_time() - start
+        total = sum(size for _, _, size in sizes)
+        print(
+            f"  level {level}: cpu_s={cpu:.3f} bytes={total} "
+            f"saved={plain - total} ({(plain - total) / plain:.1%})"
+        )
+        if level == 9:
+            for name, size, gz_size in sizes:
+                growing[file_kind(name)] += gz_size >= size
+    counts = dict.fromkeys(FILE_KINDS, 0)
+    for name, _ in files:
+        counts[file_kind(name)] += 1
+    for kind in FILE_KINDS:
+        print(f"  {kind}: files={counts[kind]} not_smaller_gzipped={growing[kind]}")
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python tools/benchmark_payload.py <output.xml> [out-dir]")
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if not args:
+        print(
+            "Usage: python tools/benchmark_payload.py <output.xml> [out-dir] [--levels]"
+        )
         return 2
-    xml = sys.argv[1]
-    out = Path(sys.argv[2]) if len(sys.argv) > 2 else Path("benchmark-output")
+    xml = args[0]
+    out = Path(args[1]) if len(args) > 1 else Path("benchmark-output")
     out.mkdir(parents=True, exist_ok=True)
     out_report = out / "report.html"
     gen = RobotFrameworkReportGenerator(xml)
@@ -58,6 +100,8 @@ def main():
     print("  num_test_files:", num_tests)
     print("  avg_test_file_bytes:", avg)
     print("  total_messages:", msgs)
+    if "--levels" in sys.argv:
+        compression_levels(gen._model)
     return 0
 
 
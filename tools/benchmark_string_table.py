@@ -0,0 +1,61 @@
+"""Benchmark the schemaVersion 2 string table against the plain (v1) payload.
+
+Usage: python tools/benchmark_string_table.py path/to/output.xml
+
+Builds the ReportModel once, then compares the embedded payload and the external-data
+files with and without --string-table: raw and gzip size, and json.loads time of the
+payload (the frontend additionally pays for resolving the table after parsing).
+"""
+
+import gzip
+import json
+import sys
+import time
+
+from robotframework_reportlens.builder import _LEVELS, build_report_model
+from robotframework_reportlens.serialize import external_data_files, model_to_payload
+
+
+def sizes(texts: list[str]) -> tuple[int, int]:
+    raw = [t.encode("utf-8") for t in texts]
+    return sum(map(len, raw)), sum(len(gzip.compress(b, 9, mtime=0)) for b in raw)
+
+
+def loads_s(text: str, rounds: int = 3) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        json.loads(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python tools/benchmark_string_table.py path/to/output.xml")
+        return 1
+    model = build_report_model(sys.argv[1], _LEVELS["DEBUG"])
+    print("Benchmark result:")
+    results = {}
+    for label, table in (("v1", False), ("v2", True)):
+        payload = json.dumps(
+            model_to_payload(model, string_table=table), ensure_ascii=False
+        )
+        files = [
+            json.dumps(data, ensure_ascii=False)
+            for _, data in external_data_files(model, string_table=table)
+        ]
+        results[label] = (sizes([payload]), sizes(files))
+        print(f"  {label}_payload_bytes: {results[label][0][0]}")
+        print(f"  {label}_payload_gzip_bytes: {results[label][0][1]}")
+        print(f"  {label}_payload_loads_s: {loads_s(payload):.3f}")
+        print(f"  {label}_files_bytes: {results[label][1][0]}")
+        print(f"  {label}_files_gzip_bytes: {results[label][1][1]}")
+    (p1, f1), (p2, f2) = results["v1"], results["v2"]
+    print(f"  payload_ratio: {p2[0] / p1[0]:.2f} (gzip {p2[1] / p1[1]:.2f})")
+    print(f"  files_ratio: {f2[0] / f1[0]:.2f} (gzip {f2[1] / f1[1]:.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
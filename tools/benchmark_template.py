@@ -0,0 +1,58 @@
+"""Benchmark preparing the template assets per report against the cached ReportTemplate.
+
+Usage: python tools/benchmark_template.py [reports] [path/to/output.xml]
+
+Renders *reports* (default 200) report pages for one model (default: the minimal test
+fixture) into memory, once re-reading and re-patching template.html for every page (as
+before ReportTemplate) and once with the process-wide cached assets, and prints the
+per-report time of both.
+"""
+
+import io
+import sys
+import time
+from pathlib import Path
+
+from robotframework_reportlens.assets import TEMPLATE_PATH, ReportTemplate
+from robotframework_reportlens.generator import RobotFrameworkReportGenerator
+
+FIXTURE = (
+    Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "minimal_output.xml"
+)
+
+
+def render(generator, reports: int, fresh: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(reports):
+        if fresh:
+            # Previously: template.html read and sliced once for the CSS, once for the JS
+            ReportTemplate.from_html(TEMPLATE_PATH.read_text(encoding="utf-8"))
+            generator._template = ReportTemplate.from_html(
+                TEMPLATE_PATH.read_text(encoding="utf-8")
+            )
+        else:
+            generator._template = None
+        generator._build_html()
+    return (time.perf_counter() - start) / reports
+
+
+def main():
+    reports = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    xml = sys.argv[2] if len(sys.argv) > 2 else str(FIXTURE)
+    generator = RobotFrameworkReportGenerator(xml)
+    sys.stdout = io.StringIO()
+    try:
+        fresh_s = render(generator, reports, fresh=True)
+        cached_s = render(generator, reports, fresh=False)
+    finally:
+        sys.stdout = sys.__stdout__
+    print("Benchmark result:")
+    print("  reports:", reports)
+    print(f"  per_report_fresh_template_ms: {fresh_s * 1000:.2f}")
+    print(f"  per_report_cached_template_ms: {cached_s * 1000:.2f}")
+    print(f"  speedup: x{fresh_s / cached_s:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
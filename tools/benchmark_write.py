@@ -0,0 +1,61 @@
+"""Benchmark writing external-data files with 1..N writer threads.
+
+Usage: python tools/benchmark_write.py path/to/output.xml [max_jobs] [--no-compress]
+
+Builds the ReportModel and its external-data files once, then writes them with
+DataDirWriter(jobs=1..max_jobs) (default max_jobs: CPU count, compressed files) into
+a temporary directory and prints the wall time of each run. Every run must produce the
+same manifest.sha256 as the single-threaded one.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from robotframework_reportlens.builder import _LEVELS, build_report_model
+from robotframework_reportlens.manifest import MANIFEST_NAME, DataDirWriter
+from robotframework_reportlens.serialize import external_data_files
+
+
+def write_all(files, data_dir: Path, compress: bool, jobs: int) -> tuple[float, str]:
+    start = time.perf_counter()
+    writer = DataDirWriter(data_dir, compress=compress, jobs=jobs)
+    for name, data in files:
+        writer.write_json(name, data)
+    writer.finish()
+    elapsed = time.perf_counter() - start
+    return elapsed, (data_dir / MANIFEST_NAME).read_text(encoding="utf-8")
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if not args:
+        print(
+            "Usage: python tools/benchmark_write.py path/to/output.xml [max_jobs] "
+            "[--no-compress]"
+        )
+        return 1
+    compress = "--no-compress" not in sys.argv
+    max_jobs = int(args[1]) if len(args) > 1 else (os.cpu_count() or 1)
+    model = build_report_model(args[0], _LEVELS["DEBUG"])
+    files = list(external_data_files(model))
+    print("Benchmark result:")
+    print("  files:", len(files))
+    print("  compress:", compress)
+    baseline_s = manifest = None
+    for jobs in range(1, max_jobs + 1):
+        with tempfile.TemporaryDirectory() as tmp:
+            elapsed, jobs_manifest = write_all(files, Path(tmp), compress, jobs)
+        if manifest is None:
+            baseline_s, manifest = elapsed, jobs_manifest
+        elif jobs_manifest != manifest:
+            print(f"  jobs={jobs}: output differs from jobs=1")
+            return 1
+        print(f"  jobs={jobs}: {elapsed:.3f}s (x{baseline_s / elapsed:.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())